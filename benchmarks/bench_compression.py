@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import io
+import json
+import uuid
+
+from opensearchpy.client.utils import _bulk_body
+from opensearchpy.connection import Connection
+from opensearchpy.serializer import JSONSerializer
+
+item_count = 50000
+
+lines = []
+for i in range(item_count):
+    lines.append({"index": {"_index": "test-index", "_id": str(uuid.uuid4())}})
+    lines.append({"value": i, "name": "document %d" % i, "tags": ["a", "b", "c"]})
+body = "\n".join(json.dumps(line) for line in lines).encode("utf-8") + b"\n"
+
+
+def gzip_file_compress(body):
+    # how request bodies were compressed before http_compress_level
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(body)
+    return buf.getvalue()
+
+
+def test_gzip_file():
+    gzip_file_compress(body)
+
+
+def test_gzip_level_9():
+    Connection(http_compress=True)._compress(body, {})
+
+
+def test_gzip_level_1():
+    Connection(http_compress=True, http_compress_level=1)._compress(body, {})
+
+
+def test_zstd():
+    Connection(http_compress="zstd")._compress(body, {})
+
+
+def test_gzip_streamed():
+    chunks = _bulk_body(JSONSerializer(), iter(lines))
+    for _ in Connection(http_compress=True, http_compress_level=1)._compress(
+        chunks, {}
+    ):
+        pass
+
+
+def test_gzip_file_serialized():
+    gzip_file_compress(_bulk_body(JSONSerializer(), lines).encode("utf-8"))
+
+
+__benchmarks__ = [
+    (test_gzip_file, test_gzip_level_9, "GzipFile vs. gzip level 9"),
+    (test_gzip_file, test_gzip_level_1, "GzipFile vs. gzip level 1"),
+    (test_gzip_file, test_zstd, "GzipFile vs. zstd level 3"),
+    (
+        test_gzip_file_serialized,
+        test_gzip_streamed,
+        "GzipFile vs. streamed gzip level 1 (bulk)",
+    ),
+]
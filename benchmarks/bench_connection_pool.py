@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import time
+
+from thread_with_return_value import ThreadWithReturnValue
+
+from opensearchpy.connection_pool import ConnectionPool
+
+connection_count = 16
+call_count = 320000
+
+
+def get_connections(pool, count):
+    for _ in range(count):
+        pool.get_connection()
+
+
+def fail_connections(pool, count):
+    # keep a couple of nodes on a timeout the whole time, the way a
+    # partially failing cluster would
+    for n in range(count):
+        connection = pool.get_connection()
+        if n % 1000 == 0:
+            pool.mark_dead(connection)
+
+
+def test(thread_count=1, dead_count=0):
+    pool = ConnectionPool([(x, {}) for x in range(connection_count)], dead_timeout=0.01)
+    for x in range(dead_count):
+        pool.mark_dead(x)
+
+    start = time.time()
+    threads = []
+    for thread_id in range(thread_count):
+        target = get_connections
+        if dead_count and thread_id == 0:
+            target = fail_connections
+        thread = ThreadWithReturnValue(
+            target=target, args=[pool, call_count // thread_count]
+        )
+        threads.append(thread)
+        thread.start()
+
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+
+    print(
+        f"{thread_count} threads, {call_count / elapsed:.0f} get_connection() calls/s"
+    )
+
+
+def test_1():
+    test(1)
+
+
+def test_32():
+    test(32)
+
+
+def test_32_with_dead():
+    test(32, dead_count=2)
+
+
+__benchmarks__ = [
+    (test_1, test_32, "1 thread vs. 32 threads (get_connection)"),
+    (test_32, test_32_with_dead, "all live vs. failing nodes (get_connection)"),
+]
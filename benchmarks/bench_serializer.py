@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from opensearchpy.helpers.actions import _bulk_lines_body, _chunk_actions
+from opensearchpy.serializer import JSONSerializer, OrjsonSerializer
+
+item_count = 100000
+
+docs = [
+    (
+        {"index": {"_index": "test-index", "_id": str(uuid.uuid4())}},
+        {
+            "value": i,
+            "price": Decimal("3.14"),
+            "name": "document %d" % i,
+            "tags": ["a", "b", "c"],
+            "created": datetime(2023, 10, 1, 2, 30),
+        },
+    )
+    for i in range(item_count)
+]
+
+
+def serialize(serializer):
+    for bulk_data, bulk_actions in _chunk_actions(
+        docs, 500, 100 * 1024 * 1024, serializer
+    ):
+        _bulk_lines_body(bulk_actions)
+
+
+def test_json():
+    serialize(JSONSerializer())
+
+
+def test_orjson():
+    serialize(OrjsonSerializer())
+
+
+__benchmarks__ = [(test_json, test_orjson, "json vs. orjson (bulk serialization)")]
@@ -43,14 +43,23 @@ VERSION = __version__ = (_major, _minor, _patch)
 logger = logging.getLogger("opensearch")
 logger.addHandler(logging.NullHandler())
 
+from .cache import ResponseCache
+from .circuit_breaker import CircuitBreaker
 from .client import OpenSearch
+from .concurrency import ConcurrencyLimiter
 from .connection import (
     Connection,
     RequestsHttpConnection,
     Urllib3HttpConnection,
     connections,
 )
-from .connection_pool import ConnectionPool, ConnectionSelector, RoundRobinSelector
+from .connection_pool import (
+    ConnectionPool,
+    ConnectionSelector,
+    LatencySelector,
+    RoundRobinSelector,
+    ZoneAwareSelector,
+)
 from .exceptions import (
     AuthenticationException,
     AuthorizationException,
@@ -71,6 +80,7 @@ from .exceptions import (
     UnknownDslObject,
     ValidationException,
 )
+from .hedging import RequestHedging
 from .helpers import AWSV4SignerAsyncAuth, AWSV4SignerAuth
 from .helpers.aggs import A
 from .helpers.analysis import analyzer, char_filter, normalizer, token_filter, tokenizer
@@ -133,7 +143,10 @@ from .helpers.search import MultiSearch, Search
 from .helpers.update_by_query import UpdateByQuery
 from .helpers.utils import AttrDict, AttrList, DslBase
 from .helpers.wrappers import Range
-from .serializer import JSONSerializer
+from .metrics import HistogramCollector, TransportMetrics
+from .retry import RetryBudget
+from .serializer import JSONSerializer, OrjsonSerializer
+from .tracing import Tracing
 from .transport import Transport
 
 # Only raise one warning per deprecation message so as not
@@ -143,10 +156,21 @@ warnings.simplefilter("default", category=OpenSearchDeprecationWarning, append=T
 __all__ = [
     "OpenSearch",
     "Transport",
+    "RequestHedging",
+    "RetryBudget",
+    "ResponseCache",
     "ConnectionPool",
     "ConnectionSelector",
+    "LatencySelector",
     "RoundRobinSelector",
+    "ZoneAwareSelector",
+    "CircuitBreaker",
+    "ConcurrencyLimiter",
+    "TransportMetrics",
+    "HistogramCollector",
+    "Tracing",
     "JSONSerializer",
+    "OrjsonSerializer",
     "Connection",
     "RequestsHttpConnection",
     "AsyncHttpConnection",
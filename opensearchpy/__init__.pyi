@@ -27,7 +27,10 @@
 import sys
 from typing import Tuple
 
+from .cache import ResponseCache as ResponseCache
+from .circuit_breaker import CircuitBreaker as CircuitBreaker
 from .client import OpenSearch as OpenSearch
+from .concurrency import ConcurrencyLimiter as ConcurrencyLimiter
 from .connection import AsyncHttpConnection as AsyncHttpConnection
 from .connection import Connection as Connection
 from .connection import RequestsHttpConnection as RequestsHttpConnection
@@ -35,7 +38,9 @@ from .connection import Urllib3HttpConnection as Urllib3HttpConnection
 from .connection import connections as connections
 from .connection_pool import ConnectionPool as ConnectionPool
 from .connection_pool import ConnectionSelector as ConnectionSelector
+from .connection_pool import LatencySelector as LatencySelector
 from .connection_pool import RoundRobinSelector as RoundRobinSelector
+from .connection_pool import ZoneAwareSelector as ZoneAwareSelector
 from .exceptions import AuthenticationException as AuthenticationException
 from .exceptions import AuthorizationException as AuthorizationException
 from .exceptions import ConflictError as ConflictError
@@ -54,6 +59,7 @@ from .exceptions import SSLError as SSLError
 from .exceptions import TransportError as TransportError
 from .exceptions import UnknownDslObject as UnknownDslObject
 from .exceptions import ValidationException as ValidationException
+from .hedging import RequestHedging as RequestHedging
 from .helpers.aggs import A as A
 from .helpers.analysis import Analyzer, CharFilter, Normalizer, TokenFilter, Tokenizer
 from .helpers.document import Document as Document
@@ -117,7 +123,12 @@ from .helpers.utils import AttrDict as AttrDict
 from .helpers.utils import AttrList as AttrList
 from .helpers.utils import DslBase as DslBase
 from .helpers.wrappers import Range as Range
+from .metrics import HistogramCollector as HistogramCollector
+from .metrics import TransportMetrics as TransportMetrics
+from .retry import RetryBudget as RetryBudget
 from .serializer import JSONSerializer as JSONSerializer
+from .serializer import OrjsonSerializer as OrjsonSerializer
+from .tracing import Tracing as Tracing
 from .transport import Transport as Transport
 
 try:
@@ -42,7 +42,7 @@ from .remote import RemoteClient
 from .security import SecurityClient
 from .snapshot import SnapshotClient
 from .tasks import TasksClient
-from .utils import SKIP_IN_PATH, _bulk_body, _make_path, _normalize_hosts, query_params
+from .utils import SKIP_IN_PATH, _make_path, _normalize_hosts, query_params
 
 logger = logging.getLogger("opensearch")
 
@@ -412,7 +412,7 @@ class AsyncOpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = await self.transport._bulk_body(body)
         return await self.transport.perform_request(
             "POST",
             _make_path(index, "_bulk"),
@@ -1100,7 +1100,7 @@ class AsyncOpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = await self.transport._bulk_body(body)
         return await self.transport.perform_request(
             "POST",
             _make_path(index, "_msearch"),
@@ -1140,7 +1140,7 @@ class AsyncOpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = await self.transport._bulk_body(body)
         return await self.transport.perform_request(
             "POST",
             _make_path(index, "_msearch", "template"),
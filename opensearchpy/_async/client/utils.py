@@ -25,12 +25,51 @@
 #  under the License.
 
 
+from functools import wraps
+
 from ...client.utils import (  # noqa
     SKIP_IN_PATH,
     NamespacedClient,
     _bulk_body,
     _escape,
+    _get_api_span,
+    _get_params_and_headers,
     _make_path,
     _normalize_hosts,
-    query_params,
 )
+from ...tracing import _api_name, _get_tracing, _index_position
+
+
+async def _traced(span, coro):
+    with span:
+        return await coro
+
+
+def query_params(*opensearch_query_params):
+    """
+    Decorator that pops all accepted parameters from method's kwargs and puts
+    them in the params argument.
+
+    When the transport of the client has ``tracing`` the coroutine is
+    wrapped in a span named after the API.
+    """
+
+    def _wrapper(func):
+        name = _api_name(func)
+        index_position = _index_position(func)
+
+        @wraps(func)
+        def _wrapped(*args, **kwargs):
+            params, headers = _get_params_and_headers(kwargs, opensearch_query_params)
+
+            tracing = _get_tracing(args[0]) if args else None
+            if tracing is None:
+                return func(*args, params=params, headers=headers, **kwargs)
+            return _traced(
+                _get_api_span(tracing, name, index_position, args, kwargs),
+                func(*args, params=params, headers=headers, **kwargs),
+            )
+
+        return _wrapped
+
+    return _wrapper
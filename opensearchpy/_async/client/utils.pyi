@@ -24,15 +24,22 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from typing import Callable, TypeVar
+
 from ...client.utils import SKIP_IN_PATH as SKIP_IN_PATH
 from ...client.utils import _bulk_body as _bulk_body
 from ...client.utils import _escape as _escape
 from ...client.utils import _make_path as _make_path  # noqa
 from ...client.utils import _normalize_hosts as _normalize_hosts
-from ...client.utils import query_params as query_params
 from ..client import AsyncOpenSearch
 from ..transport import AsyncTransport
 
+T = TypeVar("T")
+
+def query_params(
+    *es_query_params: str,
+) -> Callable[[Callable[..., T]], Callable[..., T]]: ...
+
 class NamespacedClient:
     client: AsyncOpenSearch
     def __init__(self, client: AsyncOpenSearch) -> None: ...
@@ -31,13 +31,20 @@
 
 import asyncio
 import logging
+import time
 
-from ...compat import map
 from ...exceptions import TransportError
 from ...helpers.actions import (
     _ActionChunker,
+    _adaptive_chunk_size,
+    _bulk_lines_body,
+    _check_pit_shards,
+    _import_ijson,
+    _pit_slice_body,
     _process_bulk_chunk_error,
     _process_bulk_chunk_success,
+    _serialize_line,
+    _stream_hits_request,
     expand_action,
 )
 from ...helpers.errors import ScanError
@@ -45,13 +52,19 @@ from ...helpers.errors import ScanError
 logger = logging.getLogger("opensearchpy.helpers")
 
 
-async def _chunk_actions(actions, chunk_size, max_chunk_bytes, serializer):
+async def _chunk_actions(
+    actions, chunk_size, max_chunk_bytes, serializer, chunk_sizer=None
+):
     """
-    Split actions into chunks by number or size, serialize them into strings in
-    the process.
+    Split actions into chunks by number or size, serialize them into bytes in
+    the process. When ``chunk_sizer`` is given, its current limits are used
+    instead of ``chunk_size`` and ``max_chunk_bytes``.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        chunk_sizer=chunk_sizer,
     )
     async for action, data in actions:
         ret = chunker.feed(action, data)
@@ -69,6 +82,7 @@ async def _process_bulk_chunk(
     raise_on_exception=True,
     raise_on_error=True,
     ignore_status=(),
+    chunk_sizer=None,
     *args,
     **kwargs
 ):
@@ -78,10 +92,13 @@ async def _process_bulk_chunk(
     if not isinstance(ignore_status, (list, tuple)):
         ignore_status = (ignore_status,)
 
+    start = time.time()
     try:
         # send the actual request
-        resp = await client.bulk("\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = await client.bulk(_bulk_lines_body(bulk_actions), *args, **kwargs)
     except TransportError as e:
+        if chunk_sizer is not None:
+            chunk_sizer.observe_error(e, bulk_actions, bulk_data)
         gen = _process_bulk_chunk_error(
             error=e,
             bulk_data=bulk_data,
@@ -90,6 +107,10 @@ async def _process_bulk_chunk(
             raise_on_error=raise_on_error,
         )
     else:
+        if chunk_sizer is not None:
+            chunk_sizer.observe_response(
+                resp, bulk_actions, bulk_data, time.time() - start
+            )
         gen = _process_bulk_chunk_success(
             resp=resp,
             bulk_data=bulk_data,
@@ -139,6 +160,7 @@ async def async_streaming_bulk(
     max_backoff=600,
     yield_ok=True,
     ignore_status=(),
+    adaptive_chunking=False,
     *args,
     **kwargs
 ):
@@ -174,65 +196,112 @@ async def async_streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg adaptive_chunking: if ``True``, grow or shrink ``chunk_size`` and
+        ``max_chunk_bytes`` based on how fast and how many documents the cluster
+        accepts, see :class:`~opensearchpy.helpers.AdaptiveChunkSize`. Also
+        accepts an instance of it to control the bounds.
     """
 
     async def map_actions():
         async for item in aiter(actions):
             yield expand_action_callback(item)
 
+    chunk_sizer = _adaptive_chunk_size(adaptive_chunking, chunk_size, max_chunk_bytes)
+
     async for bulk_data, bulk_actions in _chunk_actions(
-        map_actions(), chunk_size, max_chunk_bytes, client.transport.serializer
+        map_actions(),
+        chunk_size,
+        max_chunk_bytes,
+        client.transport.serializer,
+        chunk_sizer,
     ):
-        for attempt in range(max_retries + 1):
-            to_retry, to_retry_data = [], []
-            if attempt:
-                await asyncio.sleep(
-                    min(max_backoff, initial_backoff * 2 ** (attempt - 1))
-                )
+        async for item in _process_bulk_chunk_with_retries(
+            client,
+            bulk_actions,
+            bulk_data,
+            raise_on_exception,
+            raise_on_error,
+            ignore_status,
+            chunk_sizer,
+            max_retries,
+            initial_backoff,
+            max_backoff,
+            yield_ok,
+            *args,
+            **kwargs,
+        ):
+            yield item
+
 
-            try:
-                async for data, (ok, info) in azip(
+async def _process_bulk_chunk_with_retries(
+    client,
+    bulk_actions,
+    bulk_data,
+    raise_on_exception,
+    raise_on_error,
+    ignore_status,
+    chunk_sizer,
+    max_retries,
+    initial_backoff,
+    max_backoff,
+    yield_ok,
+    *args,
+    **kwargs
+):
+    """
+    Send one chunk with :func:`_process_bulk_chunk`, retrying the documents
+    rejected with ``429`` up to ``max_retries`` times.
+    """
+    for attempt in range(max_retries + 1):
+        to_retry, to_retry_data = [], []
+        if attempt:
+            await asyncio.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
+
+        try:
+            async for data, (ok, info) in azip(
+                bulk_data,
+                _process_bulk_chunk(
+                    client,
+                    bulk_actions,
                     bulk_data,
-                    _process_bulk_chunk(
-                        client,
-                        bulk_actions,
-                        bulk_data,
-                        raise_on_exception,
-                        raise_on_error,
-                        ignore_status,
-                        *args,
-                        **kwargs,
-                    ),
-                ):
-                    if not ok:
-                        action, info = info.popitem()
-                        # retry if retries enabled, we get 429, and we are not
-                        # in the last attempt
-                        if (
-                            max_retries
-                            and info["status"] == 429
-                            and (attempt + 1) <= max_retries
-                        ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
-                            to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
-                            )
-                            to_retry_data.append(data)
-                        else:
-                            yield ok, {action: info}
-                    elif yield_ok:
-                        yield ok, info
-
-            except TransportError as e:
-                # suppress 429 errors since we will retry them
-                if attempt == max_retries or e.status_code != 429:
-                    raise
-            else:
-                if not to_retry:
-                    break
-                # retry only subset of documents that didn't succeed
-                bulk_actions, bulk_data = to_retry, to_retry_data
+                    raise_on_exception,
+                    raise_on_error,
+                    ignore_status,
+                    chunk_sizer,
+                    *args,
+                    **kwargs,
+                ),
+            ):
+                if not ok:
+                    action, info = info.popitem()
+                    # retry if retries enabled, we get 429, and we are not
+                    # in the last attempt
+                    if (
+                        max_retries
+                        and info["status"] == 429
+                        and (attempt + 1) <= max_retries
+                    ):
+                        # _process_bulk_chunk expects serialized lines so we
+                        # need to re-serialize the data
+                        to_retry.extend(
+                            _serialize_line(client.transport.serializer, line)
+                            for line in data
+                        )
+                        to_retry_data.append(data)
+                    else:
+                        yield ok, {action: info}
+                elif yield_ok:
+                    yield ok, info
+
+        except TransportError as e:
+            # suppress 429 errors since we will retry them
+            if attempt == max_retries or e.status_code != 429:
+                raise
+        else:
+            if not to_retry:
+                break
+            # retry only subset of documents that didn't succeed
+            bulk_actions, bulk_data = to_retry, to_retry_data
 
 
 async def async_bulk(
@@ -287,6 +356,178 @@ async def async_bulk(
     return success, failed if stats_only else errors
 
 
+async def async_parallel_bulk(
+    client,
+    actions,
+    concurrency=4,
+    chunk_size=500,
+    max_chunk_bytes=100 * 1024 * 1024,
+    raise_on_error=True,
+    expand_action_callback=expand_action,
+    raise_on_exception=True,
+    max_retries=0,
+    initial_backoff=2,
+    max_backoff=600,
+    yield_ok=True,
+    ignore_status=(),
+    adaptive_chunking=False,
+    preserve_order=True,
+    *args,
+    **kwargs
+):
+    """
+    Concurrent version of :func:`~opensearchpy.helpers.async_streaming_bulk`
+    that keeps up to ``concurrency`` bulk requests in flight at once. The next
+    chunk is only read from ``actions`` when a request slot is free.
+
+    Documents rejected with a ``429`` status code are retried per chunk (see
+    ``max_retries``), a chunk waiting to be retried doesn't hold back the
+    other requests.
+
+    Make sure the connection pool is large enough for ``concurrency``
+    requests, for :class:`~opensearchpy.AIOHttpConnection` see ``maxsize``.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg actions: iterable or async iterable containing the actions to be executed
+    :arg concurrency: maximum number of bulk requests in flight (default: 4)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
+    :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
+        from the execution of the last chunk when some occur. By default we raise.
+    :arg raise_on_exception: if ``False`` then don't propagate exceptions from
+        call to ``bulk`` and just report the items that failed as failed.
+    :arg expand_action_callback: callback executed on each action passed in,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg max_retries: maximum number of times a document will be retried when
+        ``429`` is received, set to 0 (default) for no retries on ``429``
+    :arg initial_backoff: number of seconds we should wait before the first
+        retry. Any subsequent retries will be powers of ``initial_backoff *
+        2**retry_number``
+    :arg max_backoff: maximum number of seconds a retry will wait
+    :arg yield_ok: if set to False will skip successful documents in the output
+    :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg adaptive_chunking: if ``True``, grow or shrink ``chunk_size`` and
+        ``max_chunk_bytes`` based on how fast and how many documents the cluster
+        accepts, see :class:`~opensearchpy.helpers.AdaptiveChunkSize`. Also
+        accepts an instance of it to control the bounds.
+    :arg preserve_order: if ``True`` (default) results are yielded in the order
+        of the actions, otherwise per chunk as soon as its request completes
+    """
+
+    async def map_actions():
+        async for item in aiter(actions):
+            yield expand_action_callback(item)
+
+    async def send_chunk(bulk_data, bulk_actions):
+        return [
+            item
+            async for item in _process_bulk_chunk_with_retries(
+                client,
+                bulk_actions,
+                bulk_data,
+                raise_on_exception,
+                raise_on_error,
+                ignore_status,
+                chunk_sizer,
+                max_retries,
+                initial_backoff,
+                max_backoff,
+                yield_ok,
+                *args,
+                **kwargs,
+            )
+        ]
+
+    chunk_sizer = _adaptive_chunk_size(adaptive_chunking, chunk_size, max_chunk_bytes)
+    chunks = _chunk_actions(
+        map_actions(),
+        chunk_size,
+        max_chunk_bytes,
+        client.transport.serializer,
+        chunk_sizer,
+    ).__aiter__()
+
+    # tasks in the order their chunks were read
+    tasks = []
+    exhausted = False
+    try:
+        while tasks or not exhausted:
+            # fill the free request slots
+            while not exhausted and len(tasks) < concurrency:
+                try:
+                    bulk_data, bulk_actions = await chunks.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    tasks.append(
+                        asyncio.ensure_future(send_chunk(bulk_data, bulk_actions))
+                    )
+
+            if not tasks:
+                break
+
+            if preserve_order:
+                done = [tasks[0]]
+                await done[0]
+            else:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # yield chunks completed together in the order they were read
+                done = [task for task in tasks if task in done]
+
+            for task in done:
+                tasks.remove(task)
+                for item in task.result():
+                    yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _AsyncScrollPrefetcher(object):
+    """
+    Fetch the pages of a scroll ahead of the consumer in a background task,
+    at most ``prefetch`` pages are fetched before the consumer gets to them.
+    """
+
+    def __init__(self, client, resp, scroll, scroll_kwargs, prefetch):
+        self.scroll_id = resp.get("_scroll_id")
+        self._pages = asyncio.Queue()
+        self._slots = asyncio.Semaphore(prefetch)
+        self._task = asyncio.ensure_future(
+            self._run(client, resp, scroll, scroll_kwargs)
+        )
+
+    async def _run(self, client, resp, scroll, scroll_kwargs):
+        try:
+            # request exactly the pages the consumer will ask for
+            while self.scroll_id and resp["hits"]["hits"]:
+                await self._slots.acquire()
+                resp = await client.scroll(
+                    body={"scroll_id": self.scroll_id, "scroll": scroll},
+                    **scroll_kwargs,
+                )
+                self.scroll_id = resp.get("_scroll_id")
+                self._pages.put_nowait(resp)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._pages.put_nowait(e)
+
+    async def next_page(self):
+        page = await self._pages.get()
+        self._slots.release()
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    async def close(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
 async def async_scan(
     client,
     query=None,
@@ -297,6 +538,7 @@ async def async_scan(
     request_timeout=None,
     clear_scroll=True,
     scroll_kwargs=None,
+    prefetch=0,
     **kwargs
 ):
     """
@@ -327,6 +569,9 @@ async def async_scan(
         to true.
     :arg scroll_kwargs: additional kwargs to be passed to
         :meth:`~opensearchpy.AsyncOpenSearch.scroll`
+    :arg prefetch: number of pages to fetch ahead in a background task while
+        the current page is being consumed. By default (``0``) the next page
+        is only requested once all hits of the current one have been consumed.
 
     Any additional keyword arguments will be passed to the initial
     :meth:`~opensearchpy.AsyncOpenSearch.search` call::
@@ -364,6 +609,12 @@ async def async_scan(
     )
     scroll_id = resp.get("_scroll_id")
 
+    prefetcher = None
+    if prefetch:
+        prefetcher = _AsyncScrollPrefetcher(
+            client, resp, scroll, scroll_kwargs, prefetch
+        )
+
     try:
         while scroll_id and resp["hits"]["hits"]:
             for hit in resp["hits"]["hits"]:
@@ -393,12 +644,19 @@ async def async_scan(
                             shards_total,
                         ),
                     )
-            resp = await client.scroll(
-                body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
-            )
+            if prefetcher is not None:
+                resp = await prefetcher.next_page()
+            else:
+                resp = await client.scroll(
+                    body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+                )
             scroll_id = resp.get("_scroll_id")
 
     finally:
+        if prefetcher is not None:
+            await prefetcher.close()
+            # the prefetched pages might have moved the scroll on
+            scroll_id = prefetcher.scroll_id
         if scroll_id and clear_scroll:
             await client.clear_scroll(
                 body={"scroll_id": [scroll_id]},
@@ -407,6 +665,197 @@ async def async_scan(
             )
 
 
+async def async_stream_hits(client, query=None, index=None, **kwargs):
+    """
+    Run a :meth:`~opensearchpy.AsyncOpenSearch.search` and yield its hits as
+    they are read from the response, instead of once the whole response has
+    been received and deserialized. Memory use is then bounded by the largest
+    hit rather than by the size of the page. The rest of the response, e.g.
+    the aggregations, is skipped.
+
+    The hits are parsed with `ijson <https://github.com/ICRAR/ijson>`_,
+    which has to be installed. Numbers are returned as ``int`` and ``float``
+    like the default serializer does.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
+    :arg index: index (or list of indices) to search
+
+    Any additional keyword arguments are passed as parameters of the search
+    request::
+
+        async for hit in async_stream_hits(client,
+            query={"query": {"match": {"title": "python"}}},
+            index="orders-*",
+            size=10000,
+        ):
+            print(hit["_id"])
+
+    """
+    ijson = _import_ijson()
+    path, params, headers = _stream_hits_request(index, kwargs)
+    stream = await client.transport.perform_stream_request(
+        "POST", path, params=params, headers=headers, body=query
+    )
+    try:
+        async for hit in ijson.items_async(stream, "hits.hits.item", use_float=True):
+            yield hit
+    finally:
+        stream.close()
+
+
+async def _async_scan_pit_slice(
+    client,
+    query,
+    pit_id,
+    keep_alive,
+    slice_id,
+    slices,
+    size,
+    raise_on_error,
+    request_timeout,
+    progress_callback,
+    **kwargs
+):
+    """
+    Page through one slice of a point in time with ``search_after``, yields
+    the hits of every page.
+    """
+    search_after = None
+    fetched = 0
+    while True:
+        resp = await client.search(
+            body=_pit_slice_body(
+                query, pit_id, keep_alive, slice_id, slices, size, search_after
+            ),
+            request_timeout=request_timeout,
+            **kwargs,
+        )
+        pit_id = resp.get("pit_id", pit_id)
+        hits = resp["hits"]["hits"]
+        _check_pit_shards(resp, pit_id, raise_on_error)
+
+        fetched += len(hits)
+        done = len(hits) < size
+        if progress_callback is not None:
+            progress_callback(slice_id, fetched, done)
+        if hits:
+            yield hits
+        if done:
+            return
+        search_after = hits[-1]["sort"]
+
+
+async def async_parallel_scan(
+    client,
+    index,
+    query=None,
+    slices=None,
+    concurrency=4,
+    queue_size=4,
+    size=1000,
+    keep_alive="5m",
+    raise_on_error=True,
+    request_timeout=None,
+    progress_callback=None,
+    **kwargs
+):
+    """
+    Parallel counterpart of :func:`~opensearchpy.helpers.async_scan`. Opens a
+    point in time on ``index``, splits it into ``slices`` and pages through
+    ``concurrency`` slices at once with ``search_after``. Hits of all slices
+    are yielded from a single iterator, in no particular order. The point in
+    time is deleted once the iterator is exhausted, closed or fails.
+
+    Unless ``query`` has a ``sort``, hits are sorted by ``_doc``. That only
+    pages correctly when every slice covers a single shard, which is the
+    case for the default ``slices`` on a single index. Otherwise sort on a
+    field that is unique per document.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg index: index (or comma-separated list of indices) to scan
+    :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
+    :arg slices: number of slices to split the point in time into, defaults
+        to the number of shards it covers
+    :arg concurrency: number of slices scanned at once
+    :arg queue_size: number of pages of hits fetched ahead of the consumer
+    :arg size: number of hits in each page of a slice
+    :arg keep_alive: how long the point in time should be kept between
+        requests
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg request_timeout: explicit timeout for each search request
+    :arg progress_callback: callable called with the slice id, the number of
+        hits fetched from that slice so far and whether the slice is done,
+        after every page.
+
+    Any additional keyword arguments will be passed to every
+    :meth:`~opensearchpy.AsyncOpenSearch.search` call.
+    """
+    # Grab options that should be propagated to every
+    # API call within this helper instead of just 'search()'
+    transport_kwargs = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+
+    resp = await client.create_pit(
+        index=index, keep_alive=keep_alive, **transport_kwargs
+    )
+    pit_id = resp["pit_id"]
+    if slices is None:
+        slices = resp.get("_shards", {}).get("total") or 1
+
+    # shared by the workers, each slice is scanned once
+    slice_ids = iter(range(slices))
+    pages = asyncio.Queue(queue_size)
+
+    async def worker():
+        try:
+            for slice_id in slice_ids:
+                async for hits in _async_scan_pit_slice(
+                    client,
+                    query,
+                    pit_id,
+                    keep_alive,
+                    slice_id,
+                    slices,
+                    size,
+                    raise_on_error,
+                    request_timeout,
+                    progress_callback,
+                    **kwargs,
+                ):
+                    await pages.put(hits)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await pages.put(e)
+        else:
+            await pages.put(None)
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, slices))]
+    try:
+        running = len(tasks)
+        while running:
+            page = await pages.get()
+            if page is None:
+                running -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                for hit in page:
+                    yield hit
+
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.delete_pit(
+            body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs
+        )
+
+
 async def async_reindex(
     client,
     source_index,
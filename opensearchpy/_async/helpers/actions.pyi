@@ -41,6 +41,7 @@ from typing import (
     Union,
 )
 
+from ...helpers.actions import AdaptiveChunkSize
 from ...serializer import Serializer
 from ..client import AsyncOpenSearch
 
@@ -49,7 +50,11 @@ logger: logging.Logger
 T = TypeVar("T")
 
 def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Serializer
+    actions: Any,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    serializer: Serializer,
+    chunk_sizer: Optional[AdaptiveChunkSize] = ...,
 ) -> AsyncGenerator[Any, None]: ...
 def _process_bulk_chunk(
     client: AsyncOpenSearch,
@@ -58,6 +63,7 @@ def _process_bulk_chunk(
     raise_on_exception: bool = ...,
     raise_on_error: bool = ...,
     ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    chunk_sizer: Optional[AdaptiveChunkSize] = ...,
     *args: Any,
     **kwargs: Any
 ) -> AsyncGenerator[Tuple[bool, Any], None]: ...
@@ -78,6 +84,41 @@ def async_streaming_bulk(
     max_backoff: Union[float, int] = ...,
     yield_ok: bool = ...,
     ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    adaptive_chunking: Union[bool, AdaptiveChunkSize] = ...,
+    *args: Any,
+    **kwargs: Any
+) -> AsyncGenerator[Tuple[bool, Any], None]: ...
+def _process_bulk_chunk_with_retries(
+    client: AsyncOpenSearch,
+    bulk_actions: Any,
+    bulk_data: Any,
+    raise_on_exception: bool,
+    raise_on_error: bool,
+    ignore_status: Optional[Union[int, Collection[int]]],
+    chunk_sizer: Optional[AdaptiveChunkSize],
+    max_retries: int,
+    initial_backoff: Union[float, int],
+    max_backoff: Union[float, int],
+    yield_ok: bool,
+    *args: Any,
+    **kwargs: Any
+) -> AsyncGenerator[Tuple[bool, Any], None]: ...
+def async_parallel_bulk(
+    client: AsyncOpenSearch,
+    actions: Union[Iterable[Any], AsyncIterable[Any]],
+    concurrency: int = ...,
+    chunk_size: int = ...,
+    max_chunk_bytes: int = ...,
+    raise_on_error: bool = ...,
+    expand_action_callback: Callable[[Any], Tuple[Dict[str, Any], Optional[Any]]] = ...,
+    raise_on_exception: bool = ...,
+    max_retries: int = ...,
+    initial_backoff: Union[float, int] = ...,
+    max_backoff: Union[float, int] = ...,
+    yield_ok: bool = ...,
+    ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    adaptive_chunking: Union[bool, AdaptiveChunkSize] = ...,
+    preserve_order: bool = ...,
     *args: Any,
     **kwargs: Any
 ) -> AsyncGenerator[Tuple[bool, Any], None]: ...
@@ -99,6 +140,27 @@ def async_scan(
     request_timeout: Optional[Union[float, int]] = ...,
     clear_scroll: bool = ...,
     scroll_kwargs: Optional[Mapping[str, Any]] = ...,
+    prefetch: int = ...,
+    **kwargs: Any
+) -> AsyncGenerator[dict[str, Any], None]: ...
+def async_stream_hits(
+    client: AsyncOpenSearch,
+    query: Optional[Any] = ...,
+    index: Optional[Union[str, Collection[str]]] = ...,
+    **kwargs: Any
+) -> AsyncGenerator[dict[str, Any], None]: ...
+def async_parallel_scan(
+    client: AsyncOpenSearch,
+    index: Union[str, Collection[str]],
+    query: Optional[Any] = ...,
+    slices: Optional[int] = ...,
+    concurrency: int = ...,
+    queue_size: int = ...,
+    size: int = ...,
+    keep_alive: str = ...,
+    raise_on_error: bool = ...,
+    request_timeout: Optional[Union[float, int]] = ...,
+    progress_callback: Optional[Callable[[int, int, bool], Any]] = ...,
     **kwargs: Any
 ) -> AsyncGenerator[dict[str, Any], None]: ...
 async def async_reindex(
@@ -33,7 +33,12 @@ import warnings
 import urllib3  # type: ignore
 
 from ..compat import reraise_exceptions, urlencode
-from ..connection.base import Connection
+from ..connection.base import (
+    Connection,
+    _compress_bytes,
+    _compressobj,
+    _is_streamed,
+)
 from ..exceptions import (
     ConnectionError,
     ConnectionTimeout,
@@ -50,9 +55,37 @@ VERIFY_CERTS_DEFAULT = object()
 SSL_SHOW_WARN_DEFAULT = object()
 
 
+async def _chunks(body):
+    """
+    Chunks of a streamed request body as ``bytes``, which aiohttp sends with
+    chunked transfer encoding.
+    """
+    if hasattr(body, "__anext__"):
+        async for chunk in body:
+            yield chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+    else:
+        for chunk in body:
+            yield chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+
+
+async def _compress_chunks(compressor, chunks):
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
 class AsyncConnection(Connection):
     """Base class for Async HTTP connection implementations"""
 
+    def _compress(self, body, headers):
+        if not hasattr(body, "__anext__"):
+            return super(AsyncConnection, self)._compress(body, headers)
+        headers["content-encoding"] = self.http_compress
+        compressor = _compressobj(self.http_compress, self.http_compress_level)
+        return _compress_chunks(compressor, body)
+
     async def perform_request(
         self,
         method,
@@ -65,6 +98,24 @@ class AsyncConnection(Connection):
     ):
         raise NotImplementedError()
 
+    async def perform_stream_request(
+        self,
+        method,
+        url,
+        params=None,
+        body=None,
+        timeout=None,
+        ignore=(),
+        headers=None,
+    ):
+        """
+        Same as :meth:`perform_request`, but return the body of a successful
+        response as a file-like object whose ``read()`` is a coroutine,
+        instead of reading it. The caller must close it to release the
+        connection.
+        """
+        raise NotImplementedError()
+
     async def close(self):
         raise NotImplementedError()
 
@@ -92,6 +143,8 @@ class AIOHttpConnection(AsyncConnection):
         opaque_id=None,
         loop=None,
         trust_env=False,
+        offload_threshold=None,
+        offload_executor=None,
         **kwargs
     ):
         """
@@ -122,10 +175,18 @@ class AIOHttpConnection(AsyncConnection):
             host. See https://urllib3.readthedocs.io/en/1.4/pools.html#api for more
             information.
         :arg headers: any custom http headers to be add to requests
-        :arg http_compress: Use gzip compression
+        :arg http_compress: Use gzip compression, or ``"deflate"`` or ``"zstd"``
         :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
             For tracing all requests made by this transport.
         :arg loop: asyncio Event Loop to use with aiohttp. This is set by default to the currently running loop.
+        :arg offload_threshold: size in bytes from which request bodies are
+            compressed in ``offload_executor`` rather than on the event loop
+            (default: ``None``, never)
+        :arg offload_executor: :class:`concurrent.futures.Executor` to
+            compress large request bodies in, defaults to the event loop's
+            default executor
+        :arg decode_response: set to ``False`` to return the raw response ``bytes``
+            instead of decoding them into ``str``
         """
 
         self.headers = {}
@@ -215,6 +276,8 @@ class AIOHttpConnection(AsyncConnection):
         self.headers.setdefault("connection", "keep-alive")
         self.loop = loop
         self.session = None
+        self.offload_threshold = offload_threshold
+        self.offload_executor = offload_executor
 
         # Parameters for creating an aiohttp.ClientSession later.
         self._limit = maxsize
@@ -225,11 +288,34 @@ class AIOHttpConnection(AsyncConnection):
     async def perform_request(
         self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None
     ):
+        return await self._perform_request(
+            method, url, params, body, timeout, ignore, headers
+        )
+
+    async def perform_stream_request(
+        self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None
+    ):
+        status, headers, response = await self._perform_request(
+            method, url, params, body, timeout, ignore, headers, stream=True
+        )
+        return status, headers, AIOHttpResponseStream(response)
+
+    async def _perform_request(
+        self, method, url, params, body, timeout, ignore, headers, stream=False
+    ):
+        """
+        Send a request, returning the response to read the body from instead
+        of the body when ``stream`` is set.
+        """
         if self.session is None:
             await self._create_aiohttp_session()
         assert self.session is not None
 
         orig_body = body
+        streamed = _is_streamed(body)
+        if streamed:
+            # the chunks can only be consumed once, to send them
+            orig_body = None
         url_path = self.url_prefix + url
         if params:
             query_string = urlencode(params)
@@ -240,7 +326,7 @@ class AIOHttpConnection(AsyncConnection):
         # of the connection in the pool when method=HEAD.
         # See: aio-libs/aiohttp#1769
         is_head = False
-        if method == "HEAD":
+        if method == "HEAD" and not stream:
             method = "GET"
             is_head = True
 
@@ -269,34 +355,54 @@ class AIOHttpConnection(AsyncConnection):
                 url = "%s?%s" % (url, query_string)
             url = self.host + url
 
-        timeout = aiohttp.ClientTimeout(
-            total=timeout if timeout is not None else self.timeout
-        )
+        if timeout is None:
+            timeout = self.timeout
+        if stream:
+            # bound each read rather than the whole body, which is read later on
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=timeout, sock_read=timeout
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=timeout)
 
         req_headers = self.headers.copy()
         if headers:
             req_headers.update(headers)
 
+        if streamed:
+            body = _chunks(body)
         if self.http_compress and body:
-            body = self._gzip_compress(body)
-            req_headers["content-encoding"] = "gzip"
+            body = await self._compress_offloaded(body, req_headers)
 
         start = self.loop.time()
+        raw_data = None
         try:
-            async with self.session.request(
+            request = self.session.request(
                 method,
                 url,
                 data=body,
                 headers=req_headers,
                 timeout=timeout,
                 fingerprint=self.ssl_assert_fingerprint,
-            ) as response:
-                if is_head:  # We actually called 'GET' so throw away the data.
-                    await response.release()
-                    raw_data = ""
-                else:
-                    raw_data = await response.text()
-                duration = self.loop.time() - start
+            )
+            if stream:
+                response = await request
+                # a streamed response is only read to raise its error
+                if not (200 <= response.status < 300 or response.status in ignore):
+                    if self.decode_response:
+                        raw_data = await response.text()
+                    else:
+                        raw_data = await response.read()
+            else:
+                async with request as response:
+                    if is_head:  # We actually called 'GET' so throw away the data.
+                        await response.release()
+                        raw_data = ""
+                    elif self.decode_response:
+                        raw_data = await response.text()
+                    else:
+                        raw_data = await response.read()
+            duration = self.loop.time() - start
 
         # We want to reraise a cancellation or recursion error.
         except reraise_exceptions:
@@ -343,6 +449,8 @@ class AIOHttpConnection(AsyncConnection):
             method, str(url), url_path, orig_body, response.status, raw_data, duration
         )
 
+        if stream:
+            return response.status, response.headers, response
         return response.status, response.headers, raw_data
 
     async def close(self):
@@ -352,6 +460,27 @@ class AIOHttpConnection(AsyncConnection):
         if self.session:
             await self.session.close()
 
+    async def _compress_offloaded(self, body, headers):
+        """
+        Same as ``_compress()``, but compress bodies of at least
+        ``offload_threshold`` bytes in ``offload_executor``, to keep the event
+        loop free in the meantime.
+        """
+        if (
+            self.offload_threshold is None
+            or not isinstance(body, bytes)
+            or len(body) < max(self.offload_threshold, self.http_compress_min_size)
+        ):
+            return self._compress(body, headers)
+        headers["content-encoding"] = self.http_compress
+        return await self.loop.run_in_executor(
+            self.offload_executor,
+            _compress_bytes,
+            self.http_compress,
+            self.http_compress_level,
+            body,
+        )
+
     async def _create_aiohttp_session(self):
         """Creates an aiohttp.ClientSession(). This is delayed until
         the first call to perform_request() so that AsyncTransport has
@@ -379,3 +508,19 @@ class OpenSearchClientResponse(aiohttp.ClientResponse):
             await self.read()
 
         return self._body.decode("utf-8", "surrogatepass")
+
+
+class AIOHttpResponseStream(object):
+    """
+    File-like object reading the body of an aiohttp response as it arrives.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    async def read(self, size=-1):
+        return await self.response.content.read(size)
+
+    def close(self):
+        # returns the connection to the pool once the body has been read
+        self.response.release()
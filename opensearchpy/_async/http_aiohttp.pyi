@@ -25,7 +25,8 @@
 #  under the License.
 
 from asyncio import AbstractEventLoop
-from typing import Any, Collection, Mapping, Optional, Tuple, Union
+from concurrent.futures import Executor
+from typing import Any, Collection, Dict, Mapping, Optional, Tuple, Union
 
 from ..connection import Connection
 from ._extra_imports import aiohttp  # type: ignore
@@ -41,11 +42,23 @@ class AsyncConnection(Connection):
         ignore: Collection[int] = ...,
         headers: Optional[Mapping[str, str]] = ...,
     ) -> Tuple[int, Mapping[str, str], str]: ...
+    async def perform_stream_request(  # type: ignore
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = ...,
+        body: Optional[bytes] = ...,
+        timeout: Optional[Union[int, float]] = ...,
+        ignore: Collection[int] = ...,
+        headers: Optional[Mapping[str, str]] = ...,
+    ) -> Tuple[int, Mapping[str, str], AIOHttpResponseStream]: ...
     async def close(self) -> None: ...
 
 class AIOHttpConnection(AsyncConnection):
     session: Optional[aiohttp.ClientSession]
     ssl_assert_fingerprint: Optional[str]
+    offload_threshold: Optional[int]
+    offload_executor: Optional[Executor]
     def __init__(
         self,
         host: str = ...,
@@ -64,9 +77,18 @@ class AIOHttpConnection(AsyncConnection):
         maxsize: int = ...,
         headers: Optional[Mapping[str, str]] = ...,
         ssl_context: Optional[Any] = ...,
-        http_compress: Optional[bool] = ...,
+        http_compress: Optional[Union[bool, str]] = ...,
         opaque_id: Optional[str] = ...,
         loop: Optional[AbstractEventLoop] = ...,
         trust_env: bool = ...,
+        offload_threshold: Optional[int] = ...,
+        offload_executor: Optional[Executor] = ...,
         **kwargs: Any
     ) -> None: ...
+    async def _compress_offloaded(self, body: Any, headers: Dict[str, str]) -> Any: ...
+
+class AIOHttpResponseStream(object):
+    response: aiohttp.ClientResponse
+    def __init__(self, response: aiohttp.ClientResponse) -> None: ...
+    async def read(self, size: int = ...) -> bytes: ...
+    def close(self) -> None: ...
@@ -28,8 +28,12 @@
 import asyncio
 import logging
 import sys
+from collections import deque
 from itertools import chain
 
+from ..client.utils import _bulk_body
+from ..compat import Iterator, Mapping, string_types
+from ..connection.base import _is_streamed
 from ..connection_pool import ConnectionPool
 from ..exceptions import (
     ConnectionError,
@@ -45,6 +49,30 @@ from .http_aiohttp import AIOHttpConnection
 logger = logging.getLogger("opensearch")
 
 
+def _approximate_size(data, limit):
+    """
+    Rough size in bytes of ``data`` serialized as JSON, only walking it
+    until the size reaches ``limit`` so that large bodies cost little.
+    """
+    size = 0
+    pending = [data]
+    while pending and size < limit:
+        item = pending.pop()
+        if isinstance(item, string_types):
+            size += len(item) + 2
+        elif isinstance(item, Mapping):
+            size += 2
+            for key, value in item.items():
+                pending.append(key)
+                pending.append(value)
+        elif isinstance(item, (list, tuple)):
+            size += 2
+            pending.extend(item)
+        else:
+            size += 8
+    return size
+
+
 class AsyncTransport(Transport):
     """
     Encapsulation of transport-related to logic. Handles instantiation of the
@@ -71,7 +99,19 @@ class AsyncTransport(Transport):
         max_retries=3,
         retry_on_status=(502, 503, 504),
         retry_on_timeout=False,
+        retry_backoff=0,
+        retry_backoff_max=10,
+        retry_budget=None,
         send_get_body_as="GET",
+        hedging=None,
+        concurrency_limiter=None,
+        metrics=None,
+        tracing=None,
+        response_cache=None,
+        health_check_interval=None,
+        health_check_timeout=1,
+        offload_threshold=None,
+        offload_executor=None,
         **kwargs
     ):
         """
@@ -101,20 +141,71 @@ class AsyncTransport(Transport):
             on a different node. defaults to ``(502, 503, 504)``
         :arg retry_on_timeout: should timeout trigger a retry on different
             node? (default `False`)
+        :arg retry_backoff: number of seconds to wait before the first retry,
+            doubled on every following retry up to ``retry_backoff_max``. The
+            actual wait is random between 0 and that value. (default `0`, no
+            waiting)
+        :arg retry_backoff_max: maximum number of seconds to wait before a
+            retry
+        :arg retry_budget: :class:`~opensearchpy.RetryBudget` instance, or
+            ``True`` for the defaults, limiting the retries to a fraction of
+            the successful requests
         :arg send_get_body_as: for GET requests with body this option allows
             you to specify an alternate way of execution for environments that
             don't support passing bodies with GET requests. If you set this to
             'POST' a POST method will be used instead, if to 'source' then the body
             will be serialized and passed as a query parameter `source`.
+        :arg hedging: :class:`~opensearchpy.RequestHedging` instance, or
+            ``True`` for the defaults, to send a duplicate of slow read
+            requests to another node and use the first response
+        :arg concurrency_limiter: :class:`~opensearchpy.ConcurrencyLimiter`
+            instance, or ``True`` for the defaults, adapting the number of
+            requests in flight to the latency of the cluster
+        :arg metrics: :class:`~opensearchpy.TransportMetrics` instance
+            notified of the requests, retries and connection pool changes,
+            e.g. a :class:`~opensearchpy.HistogramCollector`
+        :arg tracing: :class:`~opensearchpy.Tracing` instance, or ``True``
+            for the defaults, creating OpenTelemetry spans for the API calls
+            and the requests
+        :arg response_cache: :class:`~opensearchpy.ResponseCache` instance,
+            or ``True`` for the defaults, caching the responses to read
+            requests for a few seconds
+        :arg health_check_interval: number of seconds between health checks of
+            dead connections from a background task. When set, a dead
+            connection only returns to the pool after responding to a health
+            check once its timeout is over.
+        :arg health_check_timeout: timeout used for the health check request
+        :arg offload_threshold: size in bytes from which request bodies are
+            serialized, response bodies deserialized and request bodies
+            compressed by the connections in ``offload_executor`` rather than
+            on the event loop (default: ``None``, never). The serialized size
+            of a request body is estimated by walking it until the threshold
+            is reached.
+        :arg offload_executor: :class:`concurrent.futures.Executor` running
+            the offloaded work, defaults to the event loop's default executor.
+            Serializing and deserializing JSON hold the GIL, pass a
+            :class:`~concurrent.futures.ProcessPoolExecutor` to run them
+            without blocking the event loop's thread.
 
         Any extra keyword arguments will be passed to the `connection_class`
         when creating and instance unless overridden by that connection's
-        options provided as part of the hosts parameter.
+        options provided as part of the hosts parameter. They're also passed
+        to the `connection_pool_class`, e.g. ``circuit_breaker`` to give the
+        pool a :class:`~opensearchpy.CircuitBreaker`.
         """
         self.sniffing_task = None
+        self.health_check_task = None
         self.loop = None
         self._async_init_called = False
         self._sniff_on_start_event = None  # type: asyncio.Event
+        # requests waiting for the concurrency limiter
+        self._concurrency_waiters = deque()
+        self.offload_threshold = offload_threshold
+        self.offload_executor = offload_executor
+        if offload_threshold is not None:
+            # the connections compress the request bodies
+            kwargs["offload_threshold"] = offload_threshold
+            kwargs["offload_executor"] = offload_executor
 
         super(AsyncTransport, self).__init__(
             hosts=[],
@@ -131,15 +222,26 @@ class AsyncTransport(Transport):
             max_retries=max_retries,
             retry_on_status=retry_on_status,
             retry_on_timeout=retry_on_timeout,
+            retry_backoff=retry_backoff,
+            retry_backoff_max=retry_backoff_max,
+            retry_budget=retry_budget,
             send_get_body_as=send_get_body_as,
+            hedging=hedging,
+            concurrency_limiter=concurrency_limiter,
+            metrics=metrics,
+            tracing=tracing,
+            response_cache=response_cache,
+            health_check_timeout=health_check_timeout,
             **kwargs
         )
 
         # Since we defer connections / sniffing to not occur
         # within the constructor we never want to signal to
         # our parent to 'sniff_on_start' or non-empty 'hosts'.
+        # Health checks run in a task rather than in the parent's thread.
         self.hosts = hosts
         self.sniff_on_start = sniff_on_start
+        self.health_check_interval = health_check_interval
 
     async def _async_init(self):
         """This is our stand-in for an async constructor. Everything
@@ -158,6 +260,9 @@ class AsyncTransport(Transport):
         self.set_connections(self.hosts)
         self.seed_connections = list(self.connection_pool.connections[:])
 
+        if self.health_check_interval:
+            self.health_check_task = self.loop.create_task(self._health_check_loop())
+
         # ... and we can start sniffing in the background.
         if self.sniffing_task is None and self.sniff_on_start:
             # Create an asyncio.Event for future calls to block on
@@ -326,6 +431,49 @@ class AsyncTransport(Transport):
         if self.sniffing_task is None:
             self.sniffing_task = self.loop.create_task(self.sniff_hosts(initial))
 
+    async def _health_check_loop(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_dead_connections()
+            except Exception:
+                logger.warning(
+                    "Health check of dead connections failed.", exc_info=True
+                )
+
+    async def check_health(self, connection):
+        """
+        Probe a dead connection with a ``HEAD /`` request. Returns ``True`` if
+        the node responded successfully.
+
+        Override this method to use a different request, e.g.
+        ``GET /_cluster/health?local=true``.
+
+        :arg connection: instance of :class:`~opensearchpy.Connection` to probe
+        """
+        try:
+            await connection.perform_request(
+                "HEAD", "/", timeout=self.health_check_timeout
+            )
+        except TransportError:
+            return False
+        return True
+
+    async def check_dead_connections(self):
+        """
+        Health check all the dead connections whose timeout is over, in
+        parallel. Those that pass return to the connection pool, the others
+        are put on a longer timeout.
+        """
+        connection_pool = self.connection_pool
+        connections = connection_pool.get_dead_connections()
+        results = await asyncio.gather(*map(self.check_health, connections))
+        for connection, healthy in zip(connections, results):
+            if healthy:
+                connection_pool.health_check_passed(connection)
+            else:
+                connection_pool.health_check_failed(connection)
+
     def mark_dead(self, connection):
         """
         Mark a connection as dead (failed) in the connection pool. If sniffing
@@ -359,70 +507,509 @@ class AsyncTransport(Transport):
         :arg params: dictionary of query parameters, will be handed over to the
             underlying :class:`~opensearchpy.Connection` class for serialization
         :arg body: body of the request, will be serialized using serializer and
-            passed to the connection
+            passed to the connection. An iterator of ``bytes`` chunks is instead
+            streamed to the node with chunked transfer encoding, and so not
+            retried.
+        """
+        await self._async_call()
+
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.request_started(method, url)
+            start = self.loop.time()
+        status = error = None
+        cache = self.response_cache
+        # key to release once this request, which missed the cache, completes,
+        # and the raw response to share with the identical requests waiting
+        claimed = shared = None
+
+        try:
+            # a streamed body is consumed by the first attempt
+            streamed = _is_streamed(body)
+            max_retries = 0 if streamed else self.max_retries
+            hedge = (
+                not streamed
+                and self.hedging is not None
+                and self.hedging.is_hedgeable(method, url, params)
+            )
+            ignore_cache = params.pop("ignore_cache", False) if params else False
+            cached = (
+                not streamed
+                and cache is not None
+                and cache.is_cacheable(method, url, params)
+            )
+            serialized = self._is_large_body(body)
+            if serialized:
+                body = await self._dumps_offloaded(body)
+            method, params, body, ignore, timeout = self._resolve_request_args(
+                method, params, body, serialized
+            )
+
+            if cached:
+                cache_key = cache.key(
+                    method, url, params, headers, body, ignore, timeout
+                )
+                if not ignore_cache:
+                    # wait for an identical request in flight, if any
+                    response, flight = cache.claim(cache_key, asyncio.Event)
+                    if flight is not None:
+                        await flight.event.wait()
+                        response = cache.wait_result(flight)
+                    if metrics is not None:
+                        metrics.cache_lookup(method, url, response is not None)
+                    if response is not None:
+                        status, headers_response, data = response
+                        if method == "HEAD":
+                            return 200 <= status < 300
+                        if data:
+                            data = await self._loads_offloaded(
+                                data, headers_response.get("content-type")
+                            )
+                        return data
+                    if flight is None:
+                        claimed = cache_key
+
+            for attempt in range(max_retries + 1):
+                connection = await self._acquire_connection(timeout)
+
+                try:
+                    if self.tracing is None:
+                        connection, response = await self._send(
+                            hedge,
+                            connection,
+                            method,
+                            url,
+                            params,
+                            body,
+                            headers=headers,
+                            ignore=ignore,
+                            timeout=timeout,
+                        )
+                    else:
+                        connection, response = await self._send_traced(
+                            attempt,
+                            hedge,
+                            connection,
+                            method,
+                            url,
+                            params,
+                            body,
+                            headers=headers,
+                            ignore=ignore,
+                            timeout=timeout,
+                        )
+                    status, headers_response, data = response
+
+                    # Lowercase all the header names for consistency in accessing them.
+                    headers_response = {
+                        header.lower(): value
+                        for header, value in headers_response.items()
+                    }
+                except TransportError as e:
+                    if isinstance(e.status_code, int):
+                        status = e.status_code
+                    if method == "HEAD" and e.status_code == 404:
+                        shared = (404, {}, None)
+                        return False
+
+                    delay = self._prepare_retry(
+                        e, connection, method, url, attempt, max_retries
+                    )
+                    if delay:
+                        await asyncio.sleep(delay)
+
+                else:
+                    # connection didn't fail, confirm its live status
+                    self.connection_pool.mark_live(connection)
+                    if self.retry_budget is not None:
+                        self.retry_budget.record_success()
+                    shared = (status, headers_response, data)
+                    if cached and 200 <= status < 300:
+                        cache.set(
+                            cache_key,
+                            (status, headers_response, data),
+                            len(data) if data else 0,
+                        )
+
+                    if method == "HEAD":
+                        return 200 <= status < 300
+
+                    if data:
+                        data = await self._loads_offloaded(
+                            data, headers_response.get("content-type")
+                        )
+                    return data
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if claimed is not None:
+                cache.release(
+                    claimed,
+                    shared,
+                    error if isinstance(error, TransportError) else None,
+                )
+            if metrics is not None:
+                metrics.request_finished(
+                    method, url, self.loop.time() - start, status, error
+                )
+
+    async def perform_stream_request(
+        self, method, url, headers=None, params=None, body=None
+    ):
+        """
+        Same as :meth:`perform_request`, but return the body of the response
+        as a file-like object whose ``read()`` is a coroutine, to read
+        incrementally instead of deserializing it, e.g. with
+        :func:`~opensearchpy.helpers.async_stream_hits`. The request is
+        retried as usual, but not once reading the body failed. Close the
+        stream once done with it to release the connection.
+
+        Streamed requests aren't hedged nor traced. They're reported to the
+        connection pool and the metrics, and hold their slot of the
+        concurrency limit, until the headers of the response are received.
+
+        :arg method: HTTP method to use
+        :arg url: absolute url (without host) to target
+        :arg headers: dictionary of headers, will be handed over to the
+            underlying :class:`~opensearchpy.Connection` class
+        :arg params: dictionary of query parameters, will be handed over to the
+            underlying :class:`~opensearchpy.Connection` class for serialization
+        :arg body: body of the request, will be serialized using serializer and
+            passed to the connection. An iterator of ``bytes`` chunks is instead
+            streamed to the node with chunked transfer encoding, and so not
+            retried.
         """
         await self._async_call()
 
-        method, params, body, ignore, timeout = self._resolve_request_args(
-            method, params, body
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.request_started(method, url)
+            start = self.loop.time()
+        status = error = None
+
+        try:
+            max_retries = 0 if _is_streamed(body) else self.max_retries
+            # streamed responses aren't cached
+            if params:
+                params.pop("ignore_cache", None)
+            serialized = self._is_large_body(body)
+            if serialized:
+                body = await self._dumps_offloaded(body)
+            method, params, body, ignore, timeout = self._resolve_request_args(
+                method, params, body, serialized
+            )
+
+            for attempt in range(max_retries + 1):
+                connection = await self._acquire_connection(timeout)
+
+                try:
+                    status, _, stream = await self._perform_on_connection(
+                        connection,
+                        method,
+                        url,
+                        params,
+                        body,
+                        headers=headers,
+                        ignore=ignore,
+                        timeout=timeout,
+                        stream=True,
+                    )
+                except TransportError as e:
+                    if isinstance(e.status_code, int):
+                        status = e.status_code
+                    delay = self._prepare_retry(
+                        e, connection, method, url, attempt, max_retries
+                    )
+                    if delay:
+                        await asyncio.sleep(delay)
+                else:
+                    self.connection_pool.mark_live(connection)
+                    if self.retry_budget is not None:
+                        self.retry_budget.record_success()
+                    return stream
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if metrics is not None:
+                metrics.request_finished(
+                    method, url, self.loop.time() - start, status, error
+                )
+
+    async def _bulk_body(self, body):
+        """
+        Same as ``Transport._bulk_body()``, but serialize a list of lines of
+        at least ``offload_threshold`` bytes in ``offload_executor``.
+        """
+        if isinstance(body, Iterator) or not self._is_large_body(body):
+            return _bulk_body(self.serializer, body)
+        await self._async_call()
+        return await self.loop.run_in_executor(
+            self.offload_executor, _bulk_body, self.serializer, body
         )
 
-        for attempt in range(self.max_retries + 1):
-            connection = self.get_connection()
+    def _is_large_body(self, body):
+        """
+        Whether a request body is worth serializing in ``offload_executor``.
+        """
+        return (
+            self.offload_threshold is not None
+            and body is not None
+            and not isinstance(body, string_types)
+            and not _is_streamed(body)
+            and _approximate_size(body, self.offload_threshold)
+            >= self.offload_threshold
+        )
+
+    async def _dumps_offloaded(self, data):
+        """
+        Same as ``_dumps()``, in ``offload_executor``.
+        """
+        if self.tracing is not None:
+            with self.tracing.span("serialize"):
+                return await self._timed_offloaded_dumps(data)
+        return await self._timed_offloaded_dumps(data)
 
+    async def _timed_offloaded_dumps(self, data):
+        start = self.loop.time()
+        data = await self.loop.run_in_executor(
+            self.offload_executor, self.serializer.dumps, data
+        )
+        if self.metrics is not None:
+            self.metrics.serialized(self.loop.time() - start)
+        return data
+
+    async def _loads_offloaded(self, data, mimetype):
+        """
+        Same as ``_loads()``, but deserialize bodies of at least
+        ``offload_threshold`` bytes in ``offload_executor``.
+        """
+        if self.offload_threshold is None or len(data) < self.offload_threshold:
+            return self._loads(data, mimetype)
+        if self.tracing is not None:
+            with self.tracing.span("deserialize"):
+                return await self._timed_offloaded_loads(data, mimetype)
+        return await self._timed_offloaded_loads(data, mimetype)
+
+    async def _timed_offloaded_loads(self, data, mimetype):
+        start = self.loop.time()
+        data = await self.loop.run_in_executor(
+            self.offload_executor, self.deserializer.loads, data, mimetype
+        )
+        if self.metrics is not None:
+            self.metrics.deserialized(self.loop.time() - start)
+        return data
+
+    async def _send(self, hedge, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection``, hedged or not. Returns the
+        connection that got the response and the response.
+        """
+        if hedge:
+            return await self._perform_hedged(connection, method, url, *args, **kwargs)
+        response = await self._perform_on_connection(
+            connection, method, url, *args, **kwargs
+        )
+        return connection, response
+
+    async def _send_traced(
+        self,
+        attempt,
+        hedge,
+        connection,
+        method,
+        url,
+        params,
+        body,
+        headers=None,
+        **kwargs
+    ):
+        """
+        Same as `_send` within a span for the attempt, whose trace context
+        is added to the request headers.
+        """
+        with self.tracing.attempt_span(connection, method, url, attempt) as span:
+            headers = dict(headers) if headers else {}
+            self.tracing.inject(headers)
             try:
-                status, headers_response, data = await connection.perform_request(
+                connection, response = await self._send(
+                    hedge,
+                    connection,
                     method,
                     url,
                     params,
                     body,
                     headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
+                    **kwargs
                 )
-
-                # Lowercase all the header names for consistency in accessing them.
-                headers_response = {
-                    header.lower(): value for header, value in headers_response.items()
-                }
             except TransportError as e:
-                if method == "HEAD" and e.status_code == 404:
-                    return False
+                if isinstance(e.status_code, int):
+                    span.set_attribute("http.response.status_code", e.status_code)
+                raise
+            span.set_attribute("http.response.status_code", response[0])
+            return connection, response
 
-                retry = False
-                if isinstance(e, ConnectionTimeout):
-                    retry = self.retry_on_timeout
-                elif isinstance(e, ConnectionError):
-                    retry = True
-                elif e.status_code in self.retry_on_status:
-                    retry = True
+    async def _acquire_connection(self, timeout):
+        """
+        Same as ``Transport._acquire_connection()``, but awaiting the slot.
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self.get_connection()
+        if timeout is None:
+            timeout = self.kwargs.get("timeout", 10)
+        if self.tracing is not None:
+            with self.tracing.span("queue"):
+                acquired = await self._acquire_concurrency(limiter, timeout)
+        else:
+            acquired = await self._acquire_concurrency(limiter, timeout)
+        if not acquired:
+            message = (
+                "Timed out after %s seconds waiting for the concurrency limit" % timeout
+            )
+            raise ConnectionTimeout("TIMEOUT", message, message)
+        try:
+            return self.get_connection()
+        except Exception:
+            self._cancel_slot()
+            raise
 
-                if retry:
-                    try:
-                        # only mark as dead if we are retrying
-                        self.mark_dead(connection)
-                    except TransportError:
-                        # If sniffing on failure, it could fail too. Catch the
-                        # exception not to interrupt the retries.
-                        pass
-                    # raise exception on last retry
-                    if attempt == self.max_retries:
-                        raise e
+    def _cancel_slot(self):
+        self.concurrency_limiter.cancel()
+        self._wake_concurrency_waiters()
+
+    async def _perform_on_connection(self, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection``, reporting its duration and outcome
+        to the connection pool and releasing its slot of the concurrency
+        limit, if any, which the caller took. With
+        ``stream=True`` the request is sent with
+        :meth:`~opensearchpy.AsyncConnection.perform_stream_request` and
+        completes once the headers of the response are received.
+        """
+        if kwargs.pop("stream", False):
+            perform = connection.perform_stream_request
+        else:
+            perform = connection.perform_request
+        limiter = self.concurrency_limiter
+        # report the outcome to the pool the connection was selected from,
+        # even if a sniff replaced it in the meantime
+        pool = self.connection_pool
+        pool.request_started(connection)
+        start = self.loop.time()
+        failed = True
+        status = None
+        try:
+            response = await perform(method, url, *args, **kwargs)
+            failed = False
+            status = response[0]
+            return response
+        except TransportError as e:
+            # an error status still means the node responded
+            failed = isinstance(e, ConnectionError)
+            if not failed:
+                status = e.status_code
+            raise
+        finally:
+            duration = self.loop.time() - start
+            pool.request_finished(connection, duration, failed, status=status)
+            if limiter is not None:
+                limiter.release(duration, failed, status)
+                self._wake_concurrency_waiters()
+
+    async def _acquire_concurrency(self, limiter, timeout):
+        # wait in line until the limiter has room for another request, or
+        # for at most timeout seconds, returns whether it got a slot
+        deadline = None if timeout is None else self.loop.time() + timeout
+        while not limiter.try_acquire():
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    return False
+            waiter = self.loop.create_future()
+            self._concurrency_waiters.append(waiter)
+            try:
+                await asyncio.wait([waiter], timeout=remaining)
+            except asyncio.CancelledError:
+                # pass on the wake up this request won't use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_concurrency_waiters()
                 else:
-                    raise e
+                    waiter.cancel()
+                raise
+            if not waiter.done():
+                # timed out, the waiter is skipped when waking up requests
+                waiter.cancel()
+        return True
 
-            else:
-                # connection didn't fail, confirm its live status
-                self.connection_pool.mark_live(connection)
+    def _wake_concurrency_waiters(self):
+        available = self.concurrency_limiter.available()
+        while available > 0 and self._concurrency_waiters:
+            waiter = self._concurrency_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
 
-                if method == "HEAD":
-                    return 200 <= status < 300
+    async def _perform_timed(self, connection, method, url, *args, **kwargs):
+        # record the latency of successful requests for the hedging delay
+        start = self.loop.time()
+        response = await self._perform_on_connection(
+            connection, method, url, *args, **kwargs
+        )
+        self.hedging.record(self.loop.time() - start)
+        return response
 
-                if data:
-                    data = self.deserializer.loads(
-                        data, headers_response.get("content-type")
-                    )
-                return data
+    async def _perform_hedged(self, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection`` and, if it hasn't completed after
+        the hedging delay, a duplicate over another connection. Returns the
+        connection and response of the first attempt that succeeds, the
+        other one is cancelled. If all the attempts fail the error of the
+        first one is raised.
+        """
+        delay = self.hedging.get_delay()
+        if delay is None or not self.hedging.has_budget():
+            response = await self._perform_timed(
+                connection, method, url, *args, **kwargs
+            )
+            return connection, response
+
+        def start_attempt(conn):
+            task = self.loop.create_task(
+                self._perform_timed(conn, method, url, *args, **kwargs)
+            )
+            tasks[task] = conn
+            return task
+
+        tasks = {}
+        pending = {start_attempt(connection)}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                hedge_connection = self._get_hedge_connection(connection)
+                if hedge_connection is not None:
+                    pending.add(start_attempt(hedge_connection))
+
+            errors = {}
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task], task.result()
+                    errors[tasks[task]] = task.exception()
+                if not pending:
+                    raise errors[connection]
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # don't leave exceptions of the other attempts unretrieved
+                    task.exception()
 
     async def close(self):
         """
@@ -436,5 +1023,13 @@ class AsyncTransport(Transport):
                 pass
             self.sniffing_task = None
 
+        if self.health_check_task:
+            try:
+                self.health_check_task.cancel()
+                await self.health_check_task
+            except asyncio.CancelledError:
+                pass
+            self.health_check_task = None
+
         for connection in self.connection_pool.connections:
             await connection.close()
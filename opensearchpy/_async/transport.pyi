@@ -24,11 +24,18 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+from concurrent.futures import Executor
 from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Type, Union
 
+from ..cache import ResponseCache
+from ..concurrency import ConcurrencyLimiter
 from ..connection import Connection
 from ..connection_pool import ConnectionPool
+from ..hedging import RequestHedging
+from ..metrics import TransportMetrics
+from ..retry import RetryBudget
 from ..serializer import Deserializer, Serializer
+from ..tracing import Tracing
 
 class AsyncTransport(object):
     DEFAULT_CONNECTION_CLASS: Type[Connection]
@@ -37,6 +44,9 @@ class AsyncTransport(object):
 
     max_retries: int
     retry_on_timeout: bool
+    retry_backoff: float
+    retry_backoff_max: float
+    retry_budget: Optional[RetryBudget]
     retry_on_status: Collection[int]
     send_get_body_as: str
     serializer: Serializer
@@ -50,6 +60,15 @@ class AsyncTransport(object):
     sniff_on_connection_fail: bool
     last_sniff: float
     sniff_timeout: Optional[float]
+    hedging: Optional[RequestHedging]
+    concurrency_limiter: Optional[ConcurrencyLimiter]
+    metrics: Optional[TransportMetrics]
+    tracing: Optional[Tracing]
+    response_cache: Optional[ResponseCache]
+    health_check_interval: Optional[float]
+    health_check_timeout: Optional[float]
+    offload_threshold: Optional[int]
+    offload_executor: Optional[Executor]
     host_info_callback: Callable[
         [Dict[str, Any], Optional[Dict[str, Any]]], Dict[str, Any]
     ]
@@ -71,13 +90,27 @@ class AsyncTransport(object):
         max_retries: int = ...,
         retry_on_status: Collection[int] = ...,
         retry_on_timeout: bool = ...,
+        retry_backoff: float = ...,
+        retry_backoff_max: float = ...,
+        retry_budget: Union[bool, RetryBudget, None] = ...,
         send_get_body_as: str = ...,
+        hedging: Union[bool, RequestHedging, None] = ...,
+        concurrency_limiter: Union[bool, ConcurrencyLimiter, None] = ...,
+        metrics: Optional[TransportMetrics] = ...,
+        tracing: Union[bool, Tracing, None] = ...,
+        response_cache: Union[bool, ResponseCache, None] = ...,
+        health_check_interval: Optional[float] = ...,
+        health_check_timeout: Optional[float] = ...,
+        offload_threshold: Optional[int] = ...,
+        offload_executor: Optional[Executor] = ...,
         **kwargs: Any
     ) -> None: ...
     def add_connection(self, host: Any) -> None: ...
     def set_connections(self, hosts: Collection[Any]) -> None: ...
     def get_connection(self) -> Connection: ...
     def sniff_hosts(self, initial: bool = ...) -> None: ...
+    async def check_health(self, connection: Connection) -> bool: ...
+    async def check_dead_connections(self) -> None: ...
     def mark_dead(self, connection: Connection) -> None: ...
     async def perform_request(
         self,
@@ -87,4 +120,13 @@ class AsyncTransport(object):
         params: Optional[Mapping[str, Any]] = ...,
         body: Optional[Any] = ...,
     ) -> Union[bool, Any]: ...
+    async def perform_stream_request(  # type: ignore
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = ...,
+        params: Optional[Mapping[str, Any]] = ...,
+        body: Optional[Any] = ...,
+    ) -> Any: ...
+    async def _bulk_body(self, body: Any) -> Any: ...
     async def close(self) -> None: ...
@@ -0,0 +1,218 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+import time
+from collections import OrderedDict
+
+from .hedging import _is_read_request
+
+
+class _Flight(object):
+    """
+    Request in flight that the identical requests wait for, and its outcome
+    once it completes: the raw response or the error it raised, if any.
+    """
+
+    def __init__(self, event):
+        self.event = event
+        self.response = None
+        self.error = None
+
+    def result(self):
+        """
+        The response shared by the completed request, ``None`` when it has
+        none to share and the waiting request has to be sent.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class ResponseCache(object):
+    """
+    Cache of the responses to read requests of a
+    :class:`~opensearchpy.Transport`, to be passed to the transport as
+    ``response_cache``.
+
+    Responses are cached for ``ttl`` seconds, keyed on the method, path,
+    query parameters, headers and serialized body of the request, and the
+    least recently used ones are evicted beyond ``max_size`` responses or
+    ``max_bytes`` bytes. Concurrent identical requests share one request to
+    the cluster: the first one is sent while the others wait for its
+    response, or the error it raised, cached or not. Every hit deserializes
+    its own copy of the response.
+
+    Only ``GET`` and ``HEAD`` requests and ``POST`` requests to search, count
+    and multi get endpoints are cached, scrolls never are. Pass
+    ``ignore_cache=True`` to an API method to always send it to the cluster,
+    its response still replaces the cached one.
+
+    :arg max_size: maximum number of responses cached
+    :arg ttl: number of seconds a response is cached for
+    :arg max_bytes: maximum total size in bytes of the cached response
+        bodies, unbounded by default
+
+    .. attribute:: hits
+
+        number of requests answered from the cache
+
+    .. attribute:: shared
+
+        number of requests answered by an identical request in flight
+
+    .. attribute:: misses
+
+        number of cacheable requests sent to the cluster
+
+    .. attribute:: evictions
+
+        number of responses evicted before they expired
+    """
+
+    def __init__(self, max_size=1000, ttl=10, max_bytes=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+        # key -> (expiry time, size, response), least recently used first
+        self._entries = OrderedDict()
+        # key -> _Flight of the request in flight for it
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, method, url, params=None):
+        """
+        Whether the response to a request can be cached, i.e. the request is
+        idempotent and only reads data.
+        """
+        return _is_read_request(method, url, params)
+
+    def key(self, method, url, params, headers, body, ignore=(), timeout=None):
+        """
+        Key a request is cached under, once its body is serialized. Requests
+        ignoring other status codes or with another timeout can fail
+        differently and so don't share their responses.
+        """
+        return (
+            method,
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+            body,
+            tuple(sorted(ignore)),
+            timeout,
+        )
+
+    def claim(self, key, event_class=threading.Event):
+        """
+        Look a request up. Returns the cached response and ``None`` on a
+        hit. Returns ``None`` and the identical request in flight if any,
+        whose ``event`` is set once it completes and whose ``result()`` then
+        returns the response to share, raises the error to share or returns
+        ``None`` when the caller has to send the request itself. Otherwise
+        returns ``None, None`` and the caller sends the request, then calls
+        :meth:`release`.
+
+        :arg key: key of the request
+        :arg event_class: class of the event created for the request in
+            flight, e.g. :class:`asyncio.Event` for an async transport
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                if entry[0] > time.time():
+                    # move it to the end as the most recently used
+                    self._entries[key] = entry
+                    self.hits += 1
+                    return entry[2], None
+                self.size -= entry[1]
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                return None, flight
+            self._in_flight[key] = _Flight(event_class())
+            self.misses += 1
+            return None, None
+
+    def get(self, key):
+        """
+        Return the cached response to a request, or the outcome of an
+        identical request in flight once it completes, and whether the
+        caller claimed the request. Returns ``None, True`` on a miss, the
+        caller then sends the request and calls :meth:`release`, and
+        ``None, False`` when the request in flight had no outcome to share,
+        the caller then sends the request alongside the other waiters.
+        """
+        response, flight = self.claim(key)
+        if flight is None:
+            return response, response is None
+        flight.event.wait()
+        return self.wait_result(flight), False
+
+    def wait_result(self, flight):
+        """
+        Outcome of a completed request in flight, see :meth:`claim`.
+        """
+        response = flight.result()
+        if response is not None:
+            with self._lock:
+                self.shared += 1
+        return response
+
+    def set(self, key, response, size=0):
+        """
+        Cache the response to a request.
+
+        :arg key: key of the request
+        :arg response: the response
+        :arg size: size in bytes of the response body
+        """
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+            self._entries[key] = (time.time() + self.ttl, size, response)
+            self.size += size
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def release(self, key, response=None, error=None):
+        """
+        Called once a request the cache missed completes, cached or not, to
+        wake up the identical requests waiting for it. They all share its
+        response or error, if given, or are otherwise sent at once.
+
+        :arg key: key of the request
+        :arg response: the raw response to share with the waiting requests
+        :arg error: the error to raise in the waiting requests
+        """
+        with self._lock:
+            flight = self._in_flight.pop(key, None)
+        if flight is not None:
+            flight.response = response
+            flight.error = error
+            flight.event.set()
+
+    def clear(self):
+        """
+        Remove all the cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import (
+    Any,
+    Collection,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+class _Flight(object):
+    event: Any
+    response: Optional[Any]
+    error: Optional[BaseException]
+    def __init__(self, event: Any) -> None: ...
+    def result(self) -> Optional[Any]: ...
+
+class ResponseCache(object):
+    max_size: int
+    ttl: float
+    max_bytes: Optional[int]
+    size: int
+    hits: int
+    misses: int
+    shared: int
+    evictions: int
+    def __init__(
+        self,
+        max_size: int = ...,
+        ttl: float = ...,
+        max_bytes: Optional[int] = ...,
+    ) -> None: ...
+    def is_cacheable(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]] = ...
+    ) -> bool: ...
+    def key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        body: Optional[bytes],
+        ignore: Collection[int] = ...,
+        timeout: Optional[Union[int, float]] = ...,
+    ) -> Hashable: ...
+    def claim(
+        self, key: Hashable, event_class: Type[Any] = ...
+    ) -> Tuple[Optional[Any], Optional[_Flight]]: ...
+    def get(self, key: Hashable) -> Tuple[Optional[Any], bool]: ...
+    def wait_result(self, flight: _Flight) -> Optional[Any]: ...
+    def set(self, key: Hashable, response: Any, size: int = ...) -> None: ...
+    def release(
+        self,
+        key: Hashable,
+        response: Optional[Any] = ...,
+        error: Optional[BaseException] = ...,
+    ) -> None: ...
+    def clear(self) -> None: ...
@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger("opensearch")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit(object):
+    __slots__ = ("state", "outcomes", "failures", "trials", "successes")
+
+    def __init__(self, window):
+        self.state = CLOSED
+        # True for every failed request in the window
+        self.outcomes = deque(maxlen=window)
+        self.failures = 0
+        self.trials = 0
+        self.successes = 0
+
+
+class CircuitBreaker(object):
+    """
+    Per node circuit breaker, to be passed to the
+    :class:`~opensearchpy.Transport` as ``circuit_breaker``, which hands it
+    to the :class:`~opensearchpy.ConnectionPool`.
+
+    A node that failed ``failure_rate`` of the last ``window`` requests sent
+    to it, counting connection errors, timeouts and responses with one of the
+    ``failure_status`` codes, is tripped: the circuit opens and the node is
+    marked as dead so it gets no traffic while on its timeout. Once the pool
+    resurrects it the circuit is half open and the node only gets
+    ``half_open_requests`` trial requests. If all of them succeed the circuit
+    closes and the node is marked as live, if any of them fails the circuit
+    opens again with a longer timeout.
+
+    Nodes are only tracked from their first failed request on, so requests to
+    healthy nodes don't pay for the bookkeeping.
+
+    :arg failure_rate: fraction of failed requests in the window that trips
+        the circuit
+    :arg window: number of recent requests to a node the failure rate is
+        computed from
+    :arg min_requests: number of requests in the window needed before the
+        circuit can trip
+    :arg half_open_requests: number of trial requests a node gets while the
+        circuit is half open
+    :arg failure_status: status codes counted as failures
+    :arg on_state_change: callable called with the connection, the old and
+        the new state whenever a circuit changes state
+    """
+
+    CLOSED = CLOSED
+    OPEN = OPEN
+    HALF_OPEN = HALF_OPEN
+
+    def __init__(
+        self,
+        failure_rate=0.5,
+        window=20,
+        min_requests=10,
+        half_open_requests=3,
+        failure_status=(429, 502, 503, 504),
+        on_state_change=None,
+    ):
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_requests = min(min_requests, window)
+        self.half_open_requests = half_open_requests
+        self.failure_status = frozenset(failure_status)
+        self.on_state_change = on_state_change
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def get_state(self, connection):
+        """
+        Return the state of the circuit for ``connection``.
+        """
+        circuit = self._circuits.get(connection)
+        return CLOSED if circuit is None else circuit.state
+
+    def is_limited(self, connection):
+        """
+        Whether ``connection`` is only getting trial traffic.
+        """
+        circuit = self._circuits.get(connection)
+        return circuit is not None and circuit.state != CLOSED
+
+    def allow_request(self, connection):
+        """
+        Called by the pool for the connection it selected, returns ``False``
+        if the request should be sent to another connection as the node is
+        out of trial requests. A connection with an open circuit is only
+        selected once the pool resurrected it, which turns the circuit half
+        open. The trial is only taken by :meth:`request_started`, as the
+        selected connection may not get the request after all.
+        """
+        circuit = self._circuits.get(connection)
+        if circuit is None or circuit.state == CLOSED:
+            return True
+        change = None
+        with self._lock:
+            if circuit.state == OPEN:
+                circuit.trials = circuit.successes = 0
+                change = self._set_state(circuit, HALF_OPEN)
+            elif circuit.state != HALF_OPEN:
+                return True
+            allowed = circuit.trials < self.half_open_requests
+        if change is not None:
+            self._state_changed(connection, *change)
+        return allowed
+
+    def request_started(self, connection):
+        """
+        Called by the pool when a request is sent over ``connection``, takes
+        one of its trial requests if the circuit is half open.
+        """
+        circuit = self._circuits.get(connection)
+        if circuit is None or circuit.state != HALF_OPEN:
+            return
+        with self._lock:
+            if circuit.state == HALF_OPEN:
+                circuit.trials += 1
+
+    def record(self, pool, connection, failed=False, status=None):
+        """
+        Record the outcome of a request sent over ``connection`` and trip or
+        reset its circuit in ``pool`` if needed.
+
+        :arg pool: the :class:`~opensearchpy.ConnectionPool` the connection
+            belongs to
+        :arg connection: the connection the request was sent over
+        :arg failed: whether the request failed to get a response from the node
+        :arg status: status code of the response, if any
+        """
+        failed = failed or status in self.failure_status
+        circuit = self._circuits.get(connection)
+        if circuit is None:
+            if not failed:
+                return
+            with self._lock:
+                circuit = self._circuits.setdefault(connection, _Circuit(self.window))
+
+        with self._lock:
+            if circuit.state == CLOSED:
+                if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                    circuit.failures -= circuit.outcomes[0]
+                circuit.outcomes.append(failed)
+                circuit.failures += failed
+                if len(
+                    circuit.outcomes
+                ) < self.min_requests or circuit.failures < self.failure_rate * len(
+                    circuit.outcomes
+                ):
+                    return
+                action = pool.mark_dead
+                change = self._set_state(circuit, OPEN)
+            elif circuit.state == HALF_OPEN:
+                if failed:
+                    action = pool.mark_dead
+                    change = self._set_state(circuit, OPEN)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes < self.half_open_requests:
+                        return
+                    action = pool.mark_live
+                    circuit.outcomes.clear()
+                    circuit.failures = 0
+                    change = self._set_state(circuit, CLOSED)
+            else:
+                # a late response to a request sent before the circuit opened
+                return
+
+        action(connection)
+        self._state_changed(connection, *change)
+
+    def _set_state(self, circuit, state):
+        # the caller holds self._lock, listeners are called after releasing it
+        old, circuit.state = circuit.state, state
+        return old, state
+
+    def _state_changed(self, connection, old, new):
+        logger.warning(
+            "Circuit breaker for connection %r changed from %s to %s.",
+            connection,
+            old,
+            new,
+        )
+        if self.on_state_change is not None:
+            self.on_state_change(connection, old, new)
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import logging
+from typing import Any, Callable, FrozenSet, Iterable, Optional
+
+from .connection import Connection
+
+logger: logging.Logger
+
+CLOSED: str
+OPEN: str
+HALF_OPEN: str
+
+class CircuitBreaker(object):
+    CLOSED: str
+    OPEN: str
+    HALF_OPEN: str
+    failure_rate: float
+    window: int
+    min_requests: int
+    half_open_requests: int
+    failure_status: FrozenSet[int]
+    on_state_change: Optional[Callable[[Connection, str, str], Any]]
+    def __init__(
+        self,
+        failure_rate: float = ...,
+        window: int = ...,
+        min_requests: int = ...,
+        half_open_requests: int = ...,
+        failure_status: Iterable[int] = ...,
+        on_state_change: Optional[Callable[[Connection, str, str], Any]] = ...,
+    ) -> None: ...
+    def get_state(self, connection: Connection) -> str: ...
+    def is_limited(self, connection: Connection) -> bool: ...
+    def allow_request(self, connection: Connection) -> bool: ...
+    def request_started(self, connection: Connection) -> None: ...
+    def record(
+        self,
+        pool: Any,
+        connection: Connection,
+        failed: bool = ...,
+        status: Optional[int] = ...,
+    ) -> None: ...
@@ -43,7 +43,7 @@ from .remote import RemoteClient
 from .security import SecurityClient
 from .snapshot import SnapshotClient
 from .tasks import TasksClient
-from .utils import SKIP_IN_PATH, _bulk_body, _make_path, _normalize_hosts, query_params
+from .utils import SKIP_IN_PATH, _make_path, _normalize_hosts, query_params
 
 logger = logging.getLogger("opensearch")
 
@@ -413,7 +413,7 @@ class OpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = self.transport._bulk_body(body)
         return self.transport.perform_request(
             "POST",
             _make_path(index, "_bulk"),
@@ -1101,7 +1101,7 @@ class OpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = self.transport._bulk_body(body)
         return self.transport.perform_request(
             "POST",
             _make_path(index, "_msearch"),
@@ -1141,7 +1141,7 @@ class OpenSearch(object):
         if body in SKIP_IN_PATH:
             raise ValueError("Empty value passed for a required argument 'body'.")
 
-        body = _bulk_body(self.transport.serializer, body)
+        body = self.transport._bulk_body(body)
         return self.transport.perform_request(
             "POST",
             _make_path(index, "_msearch", "template"),
@@ -32,11 +32,24 @@ import weakref
 from datetime import date, datetime
 from functools import wraps
 
-from ..compat import PY2, quote, string_types, to_bytes, to_str, unquote, urlparse
+from ..compat import (
+    PY2,
+    Iterator,
+    quote,
+    string_types,
+    to_bytes,
+    to_str,
+    unquote,
+    urlparse,
+)
+from ..tracing import _api_name, _get_tracing, _index_position
 
 # parts of URL to be omitted
 SKIP_IN_PATH = (None, "", b"", [], ())
 
+# size of the chunks a bulk body streamed from an iterator is sent in
+BULK_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 def _normalize_hosts(hosts):
     """
@@ -133,50 +146,77 @@ def _make_path(*parts):
 GLOBAL_PARAMS = ("pretty", "human", "error_trace", "format", "filter_path")
 
 
+def _get_params_and_headers(kwargs, opensearch_query_params):
+    """
+    Pop the query parameters and headers of an API method call from its
+    kwargs.
+    """
+    params = (kwargs.pop("params", None) or {}).copy()
+    headers = {
+        k.lower(): v for k, v in (kwargs.pop("headers", None) or {}).copy().items()
+    }
+
+    if "opaque_id" in kwargs:
+        headers["x-opaque-id"] = kwargs.pop("opaque_id")
+
+    http_auth = kwargs.pop("http_auth", None)
+    api_key = kwargs.pop("api_key", None)
+
+    if http_auth is not None and api_key is not None:
+        raise ValueError(
+            "Only one of 'http_auth' and 'api_key' may be passed at a time"
+        )
+    elif http_auth is not None:
+        headers["authorization"] = "Basic %s" % (_base64_auth_header(http_auth),)
+    elif api_key is not None:
+        headers["authorization"] = "ApiKey %s" % (_base64_auth_header(api_key),)
+
+    # don't escape ignore, ignore_cache, request_timeout, or timeout
+    for p in ("ignore", "ignore_cache", "request_timeout", "timeout"):
+        if p in kwargs:
+            params[p] = kwargs.pop(p)
+
+    for p in opensearch_query_params + GLOBAL_PARAMS:
+        if p in kwargs:
+            v = kwargs.pop(p)
+            if v is not None:
+                params[p] = _escape(v)
+
+    return params, headers
+
+
+def _get_api_span(tracing, name, index_position, args, kwargs):
+    if "index" in kwargs:
+        index = kwargs["index"]
+    elif index_position is not None and index_position < len(args):
+        index = args[index_position]
+    else:
+        index = None
+    return tracing.api_span(name, index)
+
+
 def query_params(*opensearch_query_params):
     """
     Decorator that pops all accepted parameters from method's kwargs and puts
     them in the params argument.
+
+    When the transport of the client has ``tracing`` the call is wrapped in
+    a span named after the API.
     """
 
     def _wrapper(func):
+        name = _api_name(func)
+        index_position = _index_position(func)
+
         @wraps(func)
         def _wrapped(*args, **kwargs):
-            params = (kwargs.pop("params", None) or {}).copy()
-            headers = {
-                k.lower(): v
-                for k, v in (kwargs.pop("headers", None) or {}).copy().items()
-            }
-
-            if "opaque_id" in kwargs:
-                headers["x-opaque-id"] = kwargs.pop("opaque_id")
-
-            http_auth = kwargs.pop("http_auth", None)
-            api_key = kwargs.pop("api_key", None)
-
-            if http_auth is not None and api_key is not None:
-                raise ValueError(
-                    "Only one of 'http_auth' and 'api_key' may be passed at a time"
-                )
-            elif http_auth is not None:
-                headers["authorization"] = "Basic %s" % (
-                    _base64_auth_header(http_auth),
-                )
-            elif api_key is not None:
-                headers["authorization"] = "ApiKey %s" % (_base64_auth_header(api_key),)
-
-            # don't escape ignore, request_timeout, or timeout
-            for p in ("ignore", "request_timeout", "timeout"):
-                if p in kwargs:
-                    params[p] = kwargs.pop(p)
+            params, headers = _get_params_and_headers(kwargs, opensearch_query_params)
 
-            for p in opensearch_query_params + GLOBAL_PARAMS:
-                if p in kwargs:
-                    v = kwargs.pop(p)
-                    if v is not None:
-                        params[p] = _escape(v)
-
-            return func(*args, params=params, headers=headers, **kwargs)
+            tracing = _get_tracing(args[0]) if args else None
+            if tracing is None:
+                return func(*args, params=params, headers=headers, **kwargs)
+            with _get_api_span(tracing, name, index_position, args, kwargs):
+                return func(*args, params=params, headers=headers, **kwargs)
 
         return _wrapped
 
@@ -184,9 +224,18 @@ def query_params(*opensearch_query_params):
 
 
 def _bulk_body(serializer, body):
+    # stream the lines of an iterator as they're serialized
+    if isinstance(body, Iterator):
+        return _bulk_stream(serializer, body)
+
     # if not passed in a string, serialize items and join by newline
     if not isinstance(body, string_types):
-        body = "\n".join(map(serializer.dumps, body))
+        lines = [serializer.dumps(line) for line in body]
+        # serializers such as OrjsonSerializer produce bytes directly
+        if any(isinstance(line, bytes) for line in lines):
+            body = b"\n".join(to_bytes(line, "utf-8") for line in lines)
+        else:
+            body = "\n".join(lines)
 
     # bulk body must end with a newline
     if isinstance(body, bytes):
@@ -198,6 +247,28 @@ def _bulk_body(serializer, body):
     return body
 
 
+def _bulk_stream(serializer, lines):
+    """
+    Serialize the lines of a bulk body as the connection consumes them,
+    yielding them as ``bytes`` chunks of about ``BULK_STREAM_CHUNK_SIZE``
+    ending with a newline.
+    """
+    chunk = []
+    size = 0
+    for line in lines:
+        line = to_bytes(serializer.dumps(line), "utf-8")
+        chunk.append(line)
+        size += len(line) + 1
+        if size >= BULK_STREAM_CHUNK_SIZE:
+            chunk.append(b"")
+            yield b"\n".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        chunk.append(b"")
+        yield b"\n".join(chunk)
+
+
 def _base64_auth_header(auth_value):
     """Takes either a 2-tuple or a base64-encoded string
     and returns a base64-encoded string to be used
@@ -31,6 +31,7 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -44,6 +45,7 @@ from ..transport import Transport
 
 T = TypeVar("T")
 SKIP_IN_PATH: Collection[Any]
+BULK_STREAM_CHUNK_SIZE: int
 
 def _normalize_hosts(
     hosts: Optional[Union[str, Collection[Union[str, Dict[str, Any]]]]]
@@ -57,8 +59,9 @@ def query_params(
     *es_query_params: str,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]: ...
 def _bulk_body(
-    serializer: Serializer, body: Union[str, bytes, Collection[Any]]
-) -> str: ...
+    serializer: Serializer, body: Union[str, bytes, Collection[Any], Iterator[Any]]
+) -> Union[str, bytes, Iterator[bytes]]: ...
+def _bulk_stream(serializer: Serializer, lines: Iterator[Any]) -> Iterator[bytes]: ...
 
 class NamespacedClient:
     client: OpenSearch
@@ -34,7 +34,7 @@ if PY2:
     from itertools import imap as map
     from urllib import quote, quote_plus, unquote, urlencode
 
-    from Queue import Queue
+    from Queue import Empty, Full, Queue
     from urlparse import urlparse
 
     def to_str(x, encoding="ascii"):
@@ -49,7 +49,7 @@ else:
     from urllib.parse import quote, quote_plus, unquote, urlencode, urlparse
 
     map = map
-    from queue import Queue
+    from queue import Empty, Full, Queue
 
     def to_str(x, encoding="ascii"):
         if not isinstance(x, str):
@@ -63,9 +63,15 @@ else:
 
 
 try:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
 except ImportError:
-    from collections import Mapping
+    from collections import Iterator, Mapping
+
+
+try:
+    from contextvars import copy_context
+except ImportError:
+    copy_context = None
 
 
 try:
@@ -91,5 +97,9 @@ __all__ = [
     "urlparse",
     "map",
     "Queue",
+    "Empty",
+    "Full",
     "Mapping",
+    "Iterator",
+    "copy_context",
 ]
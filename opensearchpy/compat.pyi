@@ -25,7 +25,7 @@
 #  under the License.
 
 import sys
-from typing import Callable, Tuple, Type, Union
+from typing import Any, Callable, Optional, Tuple, Type, Union
 
 PY2: bool
 string_types: Tuple[type, ...]
@@ -33,6 +33,7 @@ string_types: Tuple[type, ...]
 to_str: Callable[[Union[str, bytes]], str]
 to_bytes: Callable[[Union[str, bytes]], bytes]
 reraise_exceptions: Tuple[Type[Exception], ...]
+copy_context: Optional[Callable[[], Any]]
 
 if sys.version_info[0] == 2:
     from itertools import imap as map
@@ -41,6 +42,8 @@ if sys.version_info[0] == 2:
     from urllib import unquote as unquote
     from urllib import urlencode as urlencode
 
+    from Queue import Empty as Empty
+    from Queue import Full as Full
     from Queue import Queue as Queue
     from urlparse import urlparse as urlparse
 else:
@@ -51,4 +54,6 @@ else:
     from urllib.parse import urlparse as urlparse
 
     map = map
+    from queue import Empty as Empty
+    from queue import Full as Full
     from queue import Queue as Queue
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import math
+import threading
+import time
+
+
+class ConcurrencyLimiter(object):
+    """
+    Adaptive limit on the number of requests a
+    :class:`~opensearchpy.Transport` has in flight, to be passed to the
+    transport as ``concurrency_limiter``.
+
+    The limit follows the latency of the requests: it grows while they're as
+    fast as they've been over the long run and shrinks, down to half of its
+    value per step, once they get slower than ``tolerance`` times that,
+    which means the cluster is queueing them. Requests failing with a
+    connection error, a timeout or one of the ``drop_status`` codes shrink it
+    by ``backoff_ratio``. Requests over the limit wait for one in flight to
+    complete, blocking the thread with the synchronous client and awaiting
+    with ``AsyncOpenSearch``.
+
+    :arg initial_limit: number of requests allowed in flight to begin with
+    :arg min_limit: lowest the limit can get
+    :arg max_limit: highest the limit can get
+    :arg tolerance: how much slower than the long term latency requests can
+        get before the limit shrinks
+    :arg smoothing: how fast the limit moves towards its new value, between 0
+        and 1
+    :arg long_window: number of requests the long term latency is averaged
+        over
+    :arg backoff_ratio: factor the limit is multiplied with when a request
+        fails
+    :arg drop_status: status codes meaning the cluster rejected the request
+    """
+
+    def __init__(
+        self,
+        initial_limit=20,
+        min_limit=1,
+        max_limit=200,
+        tolerance=1.5,
+        smoothing=0.2,
+        long_window=600,
+        backoff_ratio=0.9,
+        drop_status=(429, 503),
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.long_window = long_window
+        self.backoff_ratio = backoff_ratio
+        self.drop_status = frozenset(drop_status)
+        self.in_flight = 0
+        self.long_latency = None
+        self._condition = threading.Condition(threading.Lock())
+
+    def available(self):
+        """
+        Number of requests that can be sent before reaching the limit.
+        """
+        return max(0, int(self.limit) - self.in_flight)
+
+    def try_acquire(self):
+        """
+        Take a slot for a request if the limit allows it, returns whether it
+        did.
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self, timeout=None):
+        """
+        Take a slot for a request, blocking until the limit allows it or for
+        at most ``timeout`` seconds. Returns whether it did.
+        """
+        with self._condition:
+            if timeout is not None:
+                deadline = time.time() + timeout
+            while self.in_flight >= int(self.limit):
+                if timeout is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            return True
+
+    def cancel(self):
+        """
+        Give back the slot of a request that wasn't sent, leaving the limit
+        as it is.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if self.in_flight < int(self.limit):
+                self._condition.notify()
+
+    def release(self, latency, failed=False, status=None):
+        """
+        Give back the slot of a completed request and adjust the limit.
+
+        :arg latency: time in seconds the request took
+        :arg failed: whether the request failed to get a response from the node
+        :arg status: status code of the response, if any
+        """
+        with self._condition:
+            in_flight = self.in_flight
+            self.in_flight -= 1
+            if failed or status in self.drop_status:
+                self._set_limit(self.limit * self.backoff_ratio)
+            else:
+                self._update(latency, in_flight)
+            available = int(self.limit) - self.in_flight
+            if available > 0:
+                self._condition.notify(available)
+
+    def _update(self, latency, in_flight):
+        # the caller holds self._condition
+        if self.long_latency is None:
+            self.long_latency = latency
+        else:
+            self.long_latency += (latency - self.long_latency) / self.long_window
+            # recover quickly once a period of high latency is over
+            if self.long_latency > 2 * latency:
+                self.long_latency *= 0.95
+        # a limit that isn't used doesn't say anything about the cluster
+        if in_flight < self.limit / 2:
+            return
+        gradient = max(
+            0.5, min(1.0, self.tolerance * self.long_latency / max(latency, 1e-6))
+        )
+        # leave room for a few queued requests to discover a higher limit
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        self._set_limit(self.limit * (1 - self.smoothing) + new_limit * self.smoothing)
+
+    def _set_limit(self, limit):
+        self.limit = max(self.min_limit, min(self.max_limit, limit))
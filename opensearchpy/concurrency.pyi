@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import FrozenSet, Iterable, Optional
+
+class ConcurrencyLimiter(object):
+    limit: float
+    min_limit: float
+    max_limit: float
+    tolerance: float
+    smoothing: float
+    long_window: int
+    backoff_ratio: float
+    drop_status: FrozenSet[int]
+    in_flight: int
+    long_latency: Optional[float]
+    def __init__(
+        self,
+        initial_limit: float = ...,
+        min_limit: float = ...,
+        max_limit: float = ...,
+        tolerance: float = ...,
+        smoothing: float = ...,
+        long_window: int = ...,
+        backoff_ratio: float = ...,
+        drop_status: Iterable[int] = ...,
+    ) -> None: ...
+    def available(self) -> int: ...
+    def try_acquire(self) -> bool: ...
+    def acquire(self, timeout: Optional[float] = ...) -> bool: ...
+    def cancel(self) -> None: ...
+    def release(
+        self, latency: float, failed: bool = ..., status: Optional[int] = ...
+    ) -> None: ...
@@ -25,12 +25,11 @@
 #  under the License.
 
 
-import gzip
-import io
 import logging
 import os
 import re
 import warnings
+import zlib
 from platform import python_version
 
 try:
@@ -38,8 +37,19 @@ try:
 except ImportError:
     import json
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .. import __versionstr__
-from ..exceptions import HTTP_EXCEPTIONS, OpenSearchWarning, TransportError
+from ..compat import Iterator
+from ..exceptions import (
+    HTTP_EXCEPTIONS,
+    ImproperlyConfigured,
+    OpenSearchWarning,
+    TransportError,
+)
 
 logger = logging.getLogger("opensearch")
 
@@ -52,6 +62,49 @@ if not _tracer_already_configured:
 
 _WARNING_RE = re.compile(r"\"([^\"]*)\"")
 
+# default compression level of each ``http_compress`` encoding
+_COMPRESS_LEVELS = {"gzip": 9, "deflate": 9, "zstd": 3}
+
+
+def _is_streamed(body):
+    """
+    Whether a request body is an iterator (or async iterator) of chunks, to be
+    sent with chunked transfer encoding as it is consumed rather than all at
+    once.
+    """
+    return isinstance(body, Iterator) or hasattr(body, "__anext__")
+
+
+def _compressobj(encoding, level):
+    """
+    New compressor of an ``http_compress`` encoding, with the ``compress()``
+    and ``flush()`` methods of ``zlib`` compressors.
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    # gzip and deflate (zlib) wrap the same deflate stream
+    wbits = 31 if encoding == "gzip" else 15
+    return zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+
+def _compress_bytes(encoding, level, body):
+    # a function rather than a method to run in a process pool
+    compressor = _compressobj(encoding, level)
+    return compressor.compress(body) + compressor.flush()
+
+
+def _compress_chunks(compressor, chunks):
+    """
+    Compress the chunks of a streamed request body as they're consumed.
+    """
+    for chunk in chunks:
+        if not isinstance(chunk, bytes):
+            chunk = chunk.encode("utf-8")
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
 
 class Connection(object):
     """
@@ -66,9 +119,25 @@ class Connection(object):
     :arg use_ssl: use ssl for the connection if `True`
     :arg url_prefix: optional url prefix for opensearch
     :arg timeout: default timeout in seconds (float, default: 10)
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Compress request bodies and accept compressed
+        responses. ``True`` or ``"gzip"`` for gzip, ``"deflate"`` or
+        ``"zstd"`` for encodings the nodes may support too, ``"zstd"``
+        requires the ``zstandard`` package.
+    :arg http_compress_level: compression level of the ``http_compress``
+        encoding (default: 9 for gzip and deflate, 3 for zstd)
+    :arg http_compress_min_size: size in bytes under which request bodies
+        are sent uncompressed (default: 0). Streamed bodies are always
+        compressed, chunk by chunk as they are sent.
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
+    :arg decode_response: decode the response body into ``str``. Set to
+        ``False`` to return the raw ``bytes`` instead, the transport's
+        deserializer then parses them directly (default: ``True``)
+    :arg max_log_body_size: maximum number of bytes of the request and
+        response bodies included in debug logs and trace curls, longer bodies
+        are truncated (default: no limit)
+    :arg metrics: :class:`~opensearchpy.TransportMetrics` instance notified
+        of every request sent to the node, set by the transport
     """
 
     def __init__(
@@ -80,7 +149,12 @@ class Connection(object):
         timeout=10,
         headers=None,
         http_compress=None,
+        http_compress_level=None,
+        http_compress_min_size=0,
         opaque_id=None,
+        decode_response=True,
+        max_log_body_size=None,
+        metrics=None,
         **kwargs
     ):
         if port is None:
@@ -107,6 +181,19 @@ class Connection(object):
 
         if http_compress:
             self.headers["accept-encoding"] = "gzip,deflate"
+            if http_compress is True:
+                http_compress = "gzip"
+            if http_compress not in _COMPRESS_LEVELS:
+                raise ImproperlyConfigured(
+                    "Unknown http_compress encoding %r, use one of %s."
+                    % (http_compress, ", ".join(sorted(_COMPRESS_LEVELS)))
+                )
+            if http_compress == "zstd" and zstandard is None:
+                raise ImproperlyConfigured(
+                    "Please install zstandard to use zstd compression."
+                )
+            if http_compress_level is None:
+                http_compress_level = _COMPRESS_LEVELS[http_compress]
 
         scheme = kwargs.get("scheme", "http")
         if use_ssl or scheme == "https":
@@ -114,6 +201,8 @@ class Connection(object):
             use_ssl = True
         self.use_ssl = use_ssl
         self.http_compress = http_compress or False
+        self.http_compress_level = http_compress_level
+        self.http_compress_min_size = http_compress_min_size
 
         self.scheme = scheme
         self.hostname = host
@@ -128,6 +217,9 @@ class Connection(object):
             url_prefix = "/" + url_prefix.strip("/")
         self.url_prefix = url_prefix
         self.timeout = timeout
+        self.decode_response = decode_response
+        self.max_log_body_size = max_log_body_size
+        self.metrics = metrics
 
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.host)
@@ -140,11 +232,22 @@ class Connection(object):
     def __hash__(self):
         return id(self)
 
-    def _gzip_compress(self, body):
-        buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb") as f:
-            f.write(body)
-        return buf.getvalue()
+    def _compress(self, body, headers):
+        """
+        Compress a request body and set its ``content-encoding`` header in
+        ``headers``. Bodies shorter than ``http_compress_min_size`` are
+        returned as they are, streamed bodies are compressed as they are
+        consumed.
+        """
+        if isinstance(body, Iterator):
+            compressor = _compressobj(self.http_compress, self.http_compress_level)
+            body = _compress_chunks(compressor, body)
+        elif len(body) < self.http_compress_min_size:
+            return body
+        else:
+            body = _compress_bytes(self.http_compress, self.http_compress_level, body)
+        headers["content-encoding"] = self.http_compress
+        return body
 
     def _raise_warnings(self, warning_headers):
         """If 'headers' contains a 'Warning' header raise
@@ -173,6 +276,40 @@ class Connection(object):
         for message in warning_messages:
             warnings.warn(message, category=OpenSearchWarning)
 
+    def _decode_response(self, response):
+        """Decode a raw response body returned with ``decode_response=False``."""
+        if isinstance(response, bytes):
+            return response.decode("utf-8", "surrogatepass")
+        return response
+
+    def _format_body(self, body, errors="ignore"):
+        """
+        Decode a request or response body for logging, truncated to
+        ``max_log_body_size`` bytes. Only to be called once we know the
+        result is going to be logged.
+        """
+        if not body:
+            return body
+
+        limit = self.max_log_body_size
+        # a character takes up to 4 bytes in UTF-8, only encode text whose
+        # size in bytes may be over the limit
+        if limit is not None and not isinstance(body, bytes) and len(body) * 4 > limit:
+            body = body.encode("utf-8", "surrogatepass")
+
+        truncated = 0
+        if limit is not None and len(body) > limit:
+            truncated = len(body) - limit
+            body = body[:limit]
+            # the cut may have split a multi-byte character
+            errors = "ignore"
+
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors)
+        if truncated:
+            body = "%s... [truncated %d bytes]" % (body, truncated)
+        return body
+
     def _pretty_json(self, data):
         # pretty JSON in tracer curl logs
         try:
@@ -183,9 +320,12 @@ class Connection(object):
             # non-json data or a bulk request
             return data
 
+    def _is_tracing(self):
+        return tracer.isEnabledFor(logging.INFO) and bool(tracer.handlers)
+
     def _log_trace(self, method, path, body, status_code, response, duration):
-        if not tracer.isEnabledFor(logging.INFO) or not tracer.handlers:
-            return
+        # the body and the response are formatted already, the response only
+        # if the tracer logs at DEBUG level
 
         # include pretty in trace curls
         path = path.replace("?", "?pretty&", 1) if "?" in path else path + "?pretty"
@@ -219,27 +359,61 @@ class Connection(object):
     ):
         raise NotImplementedError()
 
+    def perform_stream_request(
+        self,
+        method,
+        url,
+        params=None,
+        body=None,
+        timeout=None,
+        ignore=(),
+        headers=None,
+    ):
+        """
+        Same as :meth:`perform_request`, but return the body of a successful
+        response as a file-like object instead of reading it. The caller must
+        close it to release the connection.
+        """
+        raise NotImplementedError()
+
     def log_request_success(
         self, method, full_url, path, body, status_code, response, duration
     ):
         """Log a successful API call."""
         #  TODO: optionally pass in params instead of full_url and do urlencode only when needed
-
-        # body has already been serialized to utf-8, deserialize it for logging
-        # TODO: find a better way to avoid (de)encoding the body back and forth
-        if body:
-            try:
-                body = body.decode("utf-8", "ignore")
-            except AttributeError:
-                pass
-
         logger.info(
             "%s %s [status:%s request:%.3fs]", method, full_url, status_code, duration
         )
-        logger.debug("> %s", body)
-        logger.debug("< %s", response)
 
-        self._log_trace(method, path, body, status_code, response, duration)
+        # body has already been serialized to utf-8, only decode it for
+        # logging when the record is actually going to be emitted, and only
+        # once for both loggers
+        debug = logger.isEnabledFor(logging.DEBUG)
+        trace = self._is_tracing()
+        if debug or trace:
+            logged_body = self._format_body(body)
+            logged_response = None
+            if debug or tracer.isEnabledFor(logging.DEBUG):
+                logged_response = self._format_body(response, "surrogatepass")
+            if debug:
+                logger.debug("> %s", logged_body)
+                logger.debug("< %s", logged_response)
+            if trace:
+                self._log_trace(
+                    method, path, logged_body, status_code, logged_response, duration
+                )
+
+        if self.metrics is not None:
+            self.metrics.connection_request(
+                self,
+                method,
+                path,
+                duration,
+                status_code,
+                len(body) if body else 0,
+                # the body of a streamed response isn't read yet
+                None if response is None else len(response),
+            )
 
     def log_request_fail(
         self,
@@ -253,6 +427,18 @@ class Connection(object):
         exception=None,
     ):
         """Log an unsuccessful API call."""
+        if self.metrics is not None:
+            self.metrics.connection_request(
+                self,
+                method,
+                path,
+                duration,
+                status_code,
+                len(body) if body else 0,
+                len(response) if response else 0,
+                exception,
+            )
+
         # do not log 404s on HEAD requests
         if method == "HEAD" and status_code == 404:
             return
@@ -265,23 +451,28 @@ class Connection(object):
             exc_info=exception is not None,
         )
 
-        # body has already been serialized to utf-8, deserialize it for logging
-        # TODO: find a better way to avoid (de)encoding the body back and forth
-        if body:
-            try:
-                body = body.decode("utf-8", "ignore")
-            except AttributeError:
-                pass
-
-        logger.debug("> %s", body)
-
-        self._log_trace(method, path, body, status_code, response, duration)
-
-        if response is not None:
-            logger.debug("< %s", response)
+        # body has already been serialized to utf-8, only decode it for
+        # logging when the record is actually going to be emitted, and only
+        # once for both loggers
+        debug = logger.isEnabledFor(logging.DEBUG)
+        trace = self._is_tracing()
+        if debug or trace:
+            logged_body = self._format_body(body)
+            logged_response = None
+            if debug or tracer.isEnabledFor(logging.DEBUG):
+                logged_response = self._format_body(response, "surrogatepass")
+            if debug:
+                logger.debug("> %s", logged_body)
+            if trace:
+                self._log_trace(
+                    method, path, logged_body, status_code, logged_response, duration
+                )
+            if response is not None and debug:
+                logger.debug("< %s", logged_response)
 
     def _raise_error(self, status_code, raw_data, content_type=None):
         """Locate appropriate exception and raise it."""
+        raw_data = self._decode_response(raw_data)
         error_message = raw_data
         additional_info = None
         try:
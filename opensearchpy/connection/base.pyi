@@ -39,19 +39,30 @@ from typing import (
     Union,
 )
 
+from ..metrics import TransportMetrics
+
 logger: logging.Logger
 tracer: logging.Logger
 
+def _is_streamed(body: Any) -> bool: ...
+def _compressobj(encoding: str, level: int) -> Any: ...
+def _compress_bytes(encoding: str, level: int, body: bytes) -> bytes: ...
+
 class Connection(object):
     headers: Dict[str, str]
     use_ssl: bool
-    http_compress: bool
+    http_compress: Union[bool, str]
+    http_compress_level: Optional[int]
+    http_compress_min_size: int
     scheme: str
     hostname: str
     port: Optional[int]
     host: str
     url_prefix: str
     timeout: Optional[Union[float, int]]
+    decode_response: bool
+    max_log_body_size: Optional[int]
+    metrics: Optional[TransportMetrics]
     def __init__(
         self,
         host: str = ...,
@@ -60,15 +71,22 @@ class Connection(object):
         url_prefix: str = ...,
         timeout: Optional[Union[float, int]] = ...,
         headers: Optional[Mapping[str, str]] = ...,
-        http_compress: Optional[bool] = ...,
+        http_compress: Optional[Union[bool, str]] = ...,
+        http_compress_level: Optional[int] = ...,
+        http_compress_min_size: int = ...,
         opaque_id: Optional[str] = ...,
+        decode_response: bool = ...,
+        max_log_body_size: Optional[int] = ...,
+        metrics: Optional[TransportMetrics] = ...,
         **kwargs: Any
     ) -> None: ...
     def __repr__(self) -> str: ...
     def __eq__(self, other: object) -> bool: ...
     def __hash__(self) -> int: ...
-    def _gzip_compress(self, body: bytes) -> bytes: ...
+    def _compress(self, body: Any, headers: Dict[str, str]) -> Any: ...
     def _raise_warnings(self, warning_headers: Sequence[str]) -> None: ...
+    def _decode_response(self, response: Any) -> Any: ...
+    def _format_body(self, body: Any, errors: str = ...) -> Any: ...
     def _pretty_json(self, data: Any) -> str: ...
     def _log_trace(
         self,
@@ -89,6 +107,16 @@ class Connection(object):
         ignore: Collection[int] = ...,
         headers: Optional[Mapping[str, str]] = ...,
     ) -> Tuple[int, Mapping[str, str], str]: ...
+    def perform_stream_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = ...,
+        body: Optional[bytes] = ...,
+        timeout: Optional[Union[int, float]] = ...,
+        ignore: Collection[int] = ...,
+        headers: Optional[Mapping[str, str]] = ...,
+    ) -> Tuple[int, Mapping[str, str], Any]: ...
     def log_request_success(
         self,
         method: str,
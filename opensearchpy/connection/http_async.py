@@ -16,7 +16,7 @@ import warnings
 
 from .._async._extra_imports import aiohttp, aiohttp_exceptions
 from .._async.compat import get_running_loop
-from .._async.http_aiohttp import AIOHttpConnection
+from .._async.http_aiohttp import AIOHttpConnection, _chunks
 from ..compat import reraise_exceptions, string_types, urlencode
 from ..exceptions import (
     ConnectionError,
@@ -24,6 +24,7 @@ from ..exceptions import (
     ImproperlyConfigured,
     SSLError,
 )
+from .base import _is_streamed
 
 VERIFY_CERTS_DEFAULT = object()
 SSL_SHOW_WARN_DEFAULT = object()
@@ -144,13 +145,21 @@ class AsyncHttpConnection(AIOHttpConnection):
         self._http_auth = http_auth
         self._ssl_context = ssl_context
 
-    async def perform_request(
-        self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None
+    async def _perform_request(
+        self, method, url, params, body, timeout, ignore, headers, stream=False
     ):
+        """
+        Send a request, returning the response to read the body from instead
+        of the body when ``stream`` is set.
+        """
         if self.session is None:
             await self._create_aiohttp_session()
         assert self.session is not None
         orig_body = body
+        streamed = _is_streamed(body)
+        if streamed:
+            # the chunks can only be consumed once, to send them
+            orig_body = None
         url_path = self.url_prefix + url
         if params:
             query_string = urlencode(params)
@@ -161,7 +170,7 @@ class AsyncHttpConnection(AIOHttpConnection):
         # of the connection in the pool when method=HEAD.
         # See: https://github.com/aio-libs/aiohttp/issues/1769
         is_head = False
-        if method == "HEAD":
+        if method == "HEAD" and not stream:
             method = "GET"
             is_head = True
 
@@ -179,17 +188,24 @@ class AsyncHttpConnection(AIOHttpConnection):
             url = "%s?%s" % (url, query_string)
         url = self.host + url
 
-        timeout = aiohttp.ClientTimeout(
-            total=timeout if timeout is not None else self.timeout
-        )
+        if timeout is None:
+            timeout = self.timeout
+        if stream:
+            # bound each read rather than the whole body, which is read later on
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=timeout, sock_read=timeout
+            )
+        else:
+            timeout = aiohttp.ClientTimeout(total=timeout)
 
         req_headers = self.headers.copy()
         if headers:
             req_headers.update(headers)
 
+        if streamed:
+            body = _chunks(body)
         if self.http_compress and body:
-            body = self._gzip_compress(body)
-            req_headers["content-encoding"] = "gzip"
+            body = await self._compress_offloaded(body, req_headers)
 
         auth = (
             self._http_auth if isinstance(self._http_auth, aiohttp.BasicAuth) else None
@@ -201,8 +217,9 @@ class AsyncHttpConnection(AIOHttpConnection):
             }
 
         start = self.loop.time()
+        raw_data = None
         try:
-            async with self.session.request(
+            request = self.session.request(
                 method,
                 url,
                 data=body,
@@ -210,13 +227,25 @@ class AsyncHttpConnection(AIOHttpConnection):
                 headers=req_headers,
                 timeout=timeout,
                 fingerprint=self.ssl_assert_fingerprint,
-            ) as response:
-                if is_head:  # We actually called 'GET' so throw away the data.
-                    await response.release()
-                    raw_data = ""
-                else:
-                    raw_data = await response.text()
-                duration = self.loop.time() - start
+            )
+            if stream:
+                response = await request
+                # a streamed response is only read to raise its error
+                if not (200 <= response.status < 300 or response.status in ignore):
+                    if self.decode_response:
+                        raw_data = await response.text()
+                    else:
+                        raw_data = await response.read()
+            else:
+                async with request as response:
+                    if is_head:  # We actually called 'GET' so throw away the data.
+                        await response.release()
+                        raw_data = ""
+                    elif self.decode_response:
+                        raw_data = await response.text()
+                    else:
+                        raw_data = await response.read()
+            duration = self.loop.time() - start
 
         # We want to reraise a cancellation or recursion error.
         except reraise_exceptions:
@@ -253,12 +282,18 @@ class AsyncHttpConnection(AIOHttpConnection):
                 status_code=response.status,
                 response=raw_data,
             )
-            self._raise_error(response.status, raw_data)
+            self._raise_error(
+                response.status,
+                raw_data,
+                response.headers.get("content-type"),
+            )
 
         self.log_request_success(
             method, str(url), url_path, orig_body, response.status, raw_data, duration
         )
 
+        if stream:
+            return response.status, response.headers, response
         return response.status, response.headers, raw_data
 
     async def close(self):
@@ -7,7 +7,7 @@
 # Modifications Copyright OpenSearch Contributors. See
 # GitHub history for details.
 
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Union
 
 from .._async._extra_imports import aiohttp  # type: ignore
 from .._async.http_aiohttp import AIOHttpConnection
@@ -30,7 +30,7 @@ class AsyncHttpConnection(AIOHttpConnection):
         maxsize: Optional[int] = ...,
         headers: Optional[Mapping[str, str]] = ...,
         ssl_context: Optional[Any] = ...,
-        http_compress: Optional[bool] = ...,
+        http_compress: Optional[Union[bool, str]] = ...,
         opaque_id: Optional[str] = ...,
         loop: Optional[Any] = ...,
         **kwargs: Any
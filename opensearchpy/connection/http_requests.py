@@ -42,7 +42,7 @@ from ..exceptions import (
     ImproperlyConfigured,
     SSLError,
 )
-from .base import Connection
+from .base import Connection, _is_streamed
 
 
 class RequestsHttpConnection(Connection):
@@ -63,11 +63,13 @@ class RequestsHttpConnection(Connection):
     :arg client_key: path to the file containing the private key if using
         separate cert and key files (client_cert will contain only the cert)
     :arg headers: any custom http headers to be add to requests
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Use gzip compression, or ``"deflate"`` or ``"zstd"``
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
     :arg pool_maxsize: Maximum connection pool size used by pool-manager
         For custom connection-pooling on current session
+    :arg decode_response: set to ``False`` to return the raw response ``bytes``
+        instead of decoding them into ``str``
     """
 
     def __init__(
@@ -165,15 +167,61 @@ class RequestsHttpConnection(Connection):
         ignore=(),
         headers=None,
     ):
+        return self._perform_request(
+            method, url, params, body, timeout, allow_redirects, ignore, headers
+        )
+
+    def perform_stream_request(
+        self,
+        method,
+        url,
+        params=None,
+        body=None,
+        timeout=None,
+        allow_redirects=True,
+        ignore=(),
+        headers=None,
+    ):
+        return self._perform_request(
+            method,
+            url,
+            params,
+            body,
+            timeout,
+            allow_redirects,
+            ignore,
+            headers,
+            stream=True,
+        )
+
+    def _perform_request(
+        self,
+        method,
+        url,
+        params,
+        body,
+        timeout,
+        allow_redirects,
+        ignore,
+        headers,
+        stream=False,
+    ):
+        """
+        Send a request, returning the raw urllib3 response to read the body
+        from instead of the body when ``stream`` is set.
+        """
         url = self.base_url + url
         headers = headers or {}
         if params:
             url = "%s?%s" % (url, urlencode(params or {}))
 
         orig_body = body
+        if _is_streamed(body):
+            # the chunks can only be consumed once, to send them, requests
+            # uses chunked transfer encoding for them
+            orig_body = None
         if self.http_compress and body:
-            body = self._gzip_compress(body)
-            headers["content-encoding"] = "gzip"
+            body = self._compress(body, headers)
 
         start = time.time()
         request = requests.Request(method=method, headers=headers, url=url, data=body)
@@ -186,10 +234,20 @@ class RequestsHttpConnection(Connection):
             "allow_redirects": allow_redirects,
         }
         send_kwargs.update(settings)
+        if stream:
+            send_kwargs["stream"] = True
+        raw_data = None
         try:
             response = self.session.send(prepared_request, **send_kwargs)
             duration = time.time() - start
-            raw_data = response.content.decode("utf-8", "surrogatepass")
+            # a streamed response is only read to raise its error
+            if not stream or (
+                not (200 <= response.status_code < 300)
+                and response.status_code not in ignore
+            ):
+                raw_data = response.content
+                if self.decode_response:
+                    raw_data = raw_data.decode("utf-8", "surrogatepass")
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -243,6 +301,10 @@ class RequestsHttpConnection(Connection):
             duration,
         )
 
+        if stream:
+            # read the body through urllib3, decompressed
+            response.raw.decode_content = True
+            return response.status_code, response.headers, response.raw
         return response.status_code, response.headers, raw_data
 
     @property
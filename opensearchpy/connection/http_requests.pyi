@@ -24,7 +24,7 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Union
 
 import requests
 
@@ -44,7 +44,7 @@ class RequestsHttpConnection(Connection):
         client_cert: Optional[Any] = ...,
         client_key: Optional[Any] = ...,
         headers: Optional[Mapping[str, str]] = ...,
-        http_compress: Optional[bool] = ...,
+        http_compress: Optional[Union[bool, str]] = ...,
         opaque_id: Optional[str] = ...,
         **kwargs: Any
     ) -> None: ...
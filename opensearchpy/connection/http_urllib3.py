@@ -40,7 +40,7 @@ from ..exceptions import (
     ImproperlyConfigured,
     SSLError,
 )
-from .base import Connection
+from .base import Connection, _is_streamed
 
 # sentinel value for `verify_certs` and `ssl_show_warn`.
 # This is used to detect if a user is passing in a value
@@ -90,9 +90,11 @@ class Urllib3HttpConnection(Connection):
         host. See https://urllib3.readthedocs.io/en/1.4/pools.html#api for more
         information.
     :arg headers: any custom http headers to be add to requests
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Use gzip compression, or ``"deflate"`` or ``"zstd"``
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
+    :arg decode_response: set to ``False`` to return the raw response ``bytes``
+        instead of decoding them into ``str``
     """
 
     def __init__(
@@ -213,6 +215,25 @@ class Urllib3HttpConnection(Connection):
     def perform_request(
         self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None
     ):
+        return self._perform_request(
+            method, url, params, body, timeout, ignore, headers
+        )
+
+    def perform_stream_request(
+        self, method, url, params=None, body=None, timeout=None, ignore=(), headers=None
+    ):
+        # the connection goes back to the pool once the body is read
+        return self._perform_request(
+            method, url, params, body, timeout, ignore, headers, stream=True
+        )
+
+    def _perform_request(
+        self, method, url, params, body, timeout, ignore, headers, stream=False
+    ):
+        """
+        Send a request, returning the urllib3 response to read the body from
+        instead of the body when ``stream`` is set.
+        """
         url = self.url_prefix + url
         if params:
             url = "%s?%s" % (url, urlencode(params))
@@ -220,6 +241,11 @@ class Urllib3HttpConnection(Connection):
         full_url = self.host + url
         start = time.time()
         orig_body = body
+        streamed = _is_streamed(body)
+        if streamed:
+            # the chunks can only be consumed once, to send them
+            orig_body = None
+        raw_data = None
         try:
             kw = {}
             if timeout:
@@ -237,14 +263,23 @@ class Urllib3HttpConnection(Connection):
             request_headers.update(headers or ())
 
             if self.http_compress and body:
-                body = self._gzip_compress(body)
-                request_headers["content-encoding"] = "gzip"
+                body = self._compress(body, request_headers)
+            if streamed:
+                kw["chunked"] = True
+            if stream:
+                kw["preload_content"] = False
 
             response = self.pool.urlopen(
                 method, url, body, retries=Retry(False), headers=request_headers, **kw
             )
             duration = time.time() - start
-            raw_data = response.data.decode("utf-8", "surrogatepass")
+            # a streamed response is only read to raise its error
+            if not stream or (
+                not (200 <= response.status < 300) and response.status not in ignore
+            ):
+                raw_data = response.data
+                if self.decode_response:
+                    raw_data = raw_data.decode("utf-8", "surrogatepass")
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -276,6 +311,8 @@ class Urllib3HttpConnection(Connection):
             method, full_url, url, orig_body, response.status, raw_data, duration
         )
 
+        if stream:
+            return response.status, response.headers, response
         return response.status, response.headers, raw_data
 
     def get_response_headers(self, response):
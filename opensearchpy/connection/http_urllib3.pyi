@@ -58,7 +58,7 @@ class Urllib3HttpConnection(Connection):
         maxsize: int = ...,
         headers: Optional[Mapping[str, str]] = ...,
         ssl_context: Optional[Any] = ...,
-        http_compress: Optional[bool] = ...,
+        http_compress: Optional[Union[bool, str]] = ...,
         opaque_id: Optional[str] = ...,
         **kwargs: Any
     ) -> None: ...
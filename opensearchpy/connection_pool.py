@@ -25,15 +25,16 @@
 #  under the License.
 
 
+import heapq
 import logging
 import random
 import threading
 import time
 
 try:
-    from Queue import Empty, PriorityQueue
+    from Queue import PriorityQueue
 except ImportError:
-    from queue import PriorityQueue, Empty
+    from queue import PriorityQueue
 
 from .exceptions import ImproperlyConfigured
 
@@ -73,6 +74,26 @@ class ConnectionSelector(object):
         """
         pass
 
+    def request_started(self, connection):
+        """
+        Called by the transport right before a request is sent over a
+        connection.
+
+        :arg connection: the connection the request is sent over
+        """
+        pass
+
+    def request_finished(self, connection, duration, failed=False):
+        """
+        Called by the transport once a request sent over a connection
+        completed, whether it succeeded or not.
+
+        :arg connection: the connection the request was sent over
+        :arg duration: time in seconds the request took
+        :arg failed: whether the request failed to get a response from the node
+        """
+        pass
+
 
 class RandomSelector(ConnectionSelector):
     """
@@ -98,6 +119,143 @@ class RoundRobinSelector(ConnectionSelector):
         return connections[self.data.rr]
 
 
+class LatencySelector(ConnectionSelector):
+    """
+    Selector preferring the connections that respond the fastest.
+
+    For every connection it tracks an exponentially weighted moving average
+    (EWMA) of the request latency and the number of requests in flight, as
+    reported by the transport. A connection's cost is its latency times its
+    in-flight requests plus one. The selector samples ``choices`` live
+    connections at random and picks the one with the lowest cost
+    (power-of-two-choices). With ``choices=None`` it compares all live
+    connections, which amounts to least outstanding requests weighted by
+    latency.
+
+    Connections without any measurement are considered the fastest so each
+    one gets probed. The latency of a connection is halved every
+    ``half_life`` seconds it gets no response, so a node that was slow or
+    failed gets probed again once the others have been faster for long
+    enough. To change the parameters pass a :func:`functools.partial` of
+    this class as ``selector_class``.
+
+    :arg opts: dictionary of connection instances and their options
+    :arg choices: number of connections sampled for each selection
+    :arg decay: weight of the latest request in the latency average, between
+        0 and 1
+    :arg failure_penalty: latency in seconds recorded for a request that
+        failed to get any response from the node
+    :arg half_life: number of seconds after which the latency of a connection
+        without responses since is halved
+    """
+
+    def __init__(
+        self, opts, choices=2, decay=0.3, failure_penalty=10.0, half_life=10.0
+    ):
+        super(LatencySelector, self).__init__(opts)
+        self.choices = choices
+        self.decay = decay
+        self.failure_penalty = failure_penalty
+        self.half_life = half_life
+        # connection -> [latency EWMA, requests in flight, time of the latency]
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def cost(self, connection):
+        """
+        Estimated cost of sending a request over ``connection``.
+        """
+        stats = self.stats.get(connection)
+        if stats is None:
+            return (0.0, 0)
+        in_flight = stats[1]
+        return (self._latency(stats, time.time()) * (in_flight + 1), in_flight)
+
+    def _latency(self, stats, now):
+        latency, _, measured = stats
+        if latency and self.half_life:
+            latency *= 0.5 ** (max(0.0, now - measured) / self.half_life)
+        return latency
+
+    def select(self, connections):
+        if self.choices and len(connections) > self.choices:
+            connections = random.sample(connections, self.choices)
+        return min(connections, key=self.cost)
+
+    def request_started(self, connection):
+        # connections no longer in the pool, e.g. replaced by a sniff while
+        # the request was in flight, aren't tracked
+        if connection not in self.connection_opts:
+            return
+        with self._lock:
+            self.stats.setdefault(connection, [0.0, 0, 0.0])[1] += 1
+
+    def request_finished(self, connection, duration, failed=False):
+        if connection not in self.connection_opts:
+            return
+        if failed:
+            duration = max(duration, self.failure_penalty)
+        now = time.time()
+        with self._lock:
+            stats = self.stats.setdefault(connection, [0.0, 0, 0.0])
+            stats[1] = max(0, stats[1] - 1)
+            latency = self._latency(stats, now)
+            if latency:
+                stats[0] = latency + self.decay * (duration - latency)
+            else:
+                stats[0] = duration
+            stats[2] = now
+
+
+class ZoneAwareSelector(ConnectionSelector):
+    """
+    Selector preferring connections to nodes in the same zone as the client.
+
+    A connection's zone is read from the ``attributes`` in its options, which
+    sniffing fills in from the node's attributes (``node.attr.zone`` in the
+    node settings). Hosts passed to the client can set it too, e.g.
+    ``{"host": "node1", "attributes": {"zone": "us-east-1a"}}``. Connections
+    in other zones are only selected when no connection in ``zone`` is live.
+    The choice among the candidates is left to ``selector_class``.
+
+    To set the zone pass a :func:`functools.partial` of this class as
+    ``selector_class``.
+
+    :arg opts: dictionary of connection instances and their options
+    :arg zone: zone of the client, without it all connections are local
+    :arg attribute: name of the node attribute holding the zone
+    :arg selector_class: :class:`~opensearchpy.ConnectionSelector` subclass
+        choosing among the connections of a zone
+    """
+
+    def __init__(
+        self, opts, zone=None, attribute="zone", selector_class=RoundRobinSelector
+    ):
+        super(ZoneAwareSelector, self).__init__(opts)
+        self.zone = zone
+        self.attribute = attribute
+        self.selector = selector_class(opts)
+        self.local = frozenset(
+            c
+            for c, o in opts.items()
+            if zone is None or (o.get("attributes") or {}).get(attribute) == zone
+        )
+
+    def select(self, connections):
+        local = [c for c in connections if c in self.local]
+        if local:
+            connections = local
+        if len(connections) == 1:
+            return connections[0]
+        return self.selector.select(connections)
+
+    def request_started(self, connection):
+        self.selector.request_started(connection)
+
+    def request_finished(self, connection, duration, failed=False):
+        self.selector.request_finished(connection, duration, failed)
+
+
 class ConnectionPool(object):
     """
     Container holding the :class:`~opensearchpy.Connection` instances,
@@ -119,6 +277,21 @@ class ConnectionPool(object):
     the timeout is over the connection will be resurrected and returned to the
     live pool. A connection that has been previously marked as dead and
     succeeds will be marked as live (its fail count will be deleted).
+
+    With ``health_check`` enabled connections aren't resurrected when their
+    timeout is over. Instead the `Transport` probes the connections returned
+    by `get_dead_connections` and reports the outcome via
+    `health_check_passed` or `health_check_failed`, so only connections that
+    responded return to the live pool.
+
+    With a ``circuit_breaker`` the outcome of every request reported via
+    `request_finished` is passed to the :class:`~opensearchpy.CircuitBreaker`,
+    which marks nodes failing too many requests as dead and limits the
+    traffic resurrected nodes get until they proved to be healthy again.
+
+    With ``metrics`` the :class:`~opensearchpy.TransportMetrics` are notified
+    when connections are marked as dead or resurrected, and of the number of
+    live and dead connections.
     """
 
     def __init__(
@@ -128,6 +301,9 @@ class ConnectionPool(object):
         timeout_cutoff=5,
         selector_class=RoundRobinSelector,
         randomize_hosts=True,
+        health_check=False,
+        circuit_breaker=None,
+        metrics=None,
         **kwargs
     ):
         """
@@ -141,30 +317,52 @@ class ConnectionPool(object):
             subclass to use if more than one connection is live
         :arg randomize_hosts: shuffle the list of connections upon arrival to
             avoid dog piling effect across processes
+        :arg health_check: only resurrect dead connections after they passed
+            a health check, instead of once their timeout is over
+        :arg circuit_breaker: :class:`~opensearchpy.CircuitBreaker` instance
+            deciding which nodes get traffic based on their error rate
+        :arg metrics: :class:`~opensearchpy.TransportMetrics` instance
+            notified of changes to the live and dead connections
         """
         if not connections:
             raise ImproperlyConfigured(
                 "No defined connections, you need to " "specify at least one host."
             )
         self.connection_opts = connections
-        self.connections = [c for (c, opts) in connections]
+        connections_list = [c for (c, opts) in connections]
         # remember original connection list for resurrect(force=True)
-        self.orig_connections = tuple(self.connections)
-        # PriorityQueue for thread safety and ease of timeout management
-        self.dead = PriorityQueue(len(self.connections))
+        self.orig_connections = tuple(connections_list)
+        # PriorityQueue for ease of timeout management, only touched when a
+        # connection fails or is due for resurrection
+        self.dead = PriorityQueue(len(connections_list))
         self.dead_count = {}
+        # serializes changes to the live connections and the dead queue
+        self._lock = threading.Lock()
+        # earliest time a dead connection becomes eligible for resurrection
+        self._next_resurrection = float("inf")
 
         if randomize_hosts:
             # randomize the connection list to avoid all clients hitting same node
             # after startup/restart
-            random.shuffle(self.connections)
+            random.shuffle(connections_list)
+
+        # snapshot of the live connections. It's never modified in place, each
+        # change replaces it with a new list so readers never need to copy it
+        # or take a lock.
+        self.connections = connections_list
 
         # default timeout after which to try resurrecting a connection
         self.dead_timeout = dead_timeout
         self.timeout_cutoff = timeout_cutoff
+        self.health_check = health_check
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
 
         self.selector = selector_class(dict(connections))
 
+        if metrics is not None:
+            metrics.pool_size(len(self.connections), 0)
+
     def mark_dead(self, connection, now=None):
         """
         Mark the connection as dead (failed). Remove it from the live pool and
@@ -174,26 +372,50 @@ class ConnectionPool(object):
         """
         # allow inject for testing purposes
         now = now if now else time.time()
-        try:
-            self.connections.remove(connection)
-        except ValueError:
-            logger.info(
-                "Attempted to remove %r, but it does not exist in the connection pool.",
-                connection,
-            )
-            # connection not alive or another thread marked it already, ignore
-            return
-        else:
-            dead_count = self.dead_count.get(connection, 0) + 1
-            self.dead_count[connection] = dead_count
-            timeout = self.dead_timeout * 2 ** min(dead_count - 1, self.timeout_cutoff)
-            self.dead.put((now + timeout, connection))
-            logger.warning(
-                "Connection %r has failed for %i times in a row, putting on %i second timeout.",
-                connection,
-                dead_count,
-                timeout,
-            )
+        with self._lock:
+            connections = [c for c in self.connections if c != connection]
+            if len(connections) == len(self.connections):
+                logger.info(
+                    "Attempted to remove %r, but it does not exist in the connection pool.",
+                    connection,
+                )
+                # connection not alive or another thread marked it already, ignore
+                return
+            self.connections = connections
+            dead_count, timeout = self._put_dead(connection, now)
+        logger.warning(
+            "Connection %r has failed for %i times in a row, putting on %i second timeout.",
+            connection,
+            dead_count,
+            timeout,
+        )
+        if self.metrics is not None:
+            self.metrics.connection_marked_dead(connection)
+            self._report_pool_size()
+
+    def _report_pool_size(self):
+        self.metrics.pool_size(len(self.connections), self.dead.qsize())
+
+    def _put_dead(self, connection, now):
+        # put the connection on a timeout, the caller holds self._lock
+        dead_count = self.dead_count.get(connection, 0) + 1
+        self.dead_count[connection] = dead_count
+        timeout = self.dead_timeout * 2 ** min(dead_count - 1, self.timeout_cutoff)
+        self.dead.put((now + timeout, connection))
+        self._next_resurrection = min(self._next_resurrection, now + timeout)
+        return dead_count, timeout
+
+    def _remove_dead(self, connection):
+        # take the connection off its timeout, the caller holds self._lock
+        for i, (_, dead) in enumerate(self.dead.queue):
+            if dead == connection:
+                del self.dead.queue[i]
+                heapq.heapify(self.dead.queue)
+                self._next_resurrection = (
+                    self.dead.queue[0][0] if self.dead.queue else float("inf")
+                )
+                return True
+        return False
 
     def mark_live(self, connection):
         """
@@ -219,36 +441,109 @@ class ConnectionPool(object):
             always returns a connection.
 
         """
-        # no dead connections
-        if self.dead.empty():
-            # we are forced to return a connection, take one from the original
-            # list. This is to avoid a race condition where get_connection can
-            # see no live connections but when it calls resurrect self.dead is
-            # also empty. We assume that other threat has resurrected all
-            # available connections so we can safely return one at random.
-            if force:
-                return random.choice(self.orig_connections)
-            return
+        with self._lock:
+            # no dead connections
+            if self.dead.empty():
+                # we are forced to return a connection, take one from the
+                # original list. This is to avoid a race condition where
+                # get_connection can see no live connections but when it calls
+                # resurrect self.dead is also empty. We assume that other
+                # thread has resurrected all available connections so we can
+                # safely return one at random.
+                self._next_resurrection = float("inf")
+                if force:
+                    return random.choice(self.orig_connections)
+                return
+
+            # peek at the connection with the earliest timeout
+            timeout, connection = self.dead.queue[0]
+            if not force and timeout > time.time():
+                # not eligible and not forced
+                self._next_resurrection = timeout
+                return
+
+            # either we were forced or the connection is eligible to be retried
+            self.dead.get(block=False)
+            self.connections = self.connections + [connection]
+            self._next_resurrection = (
+                self.dead.queue[0][0] if not self.dead.empty() else float("inf")
+            )
+        logger.info("Resurrecting connection %r (force=%s).", connection, force)
+        if self.metrics is not None:
+            self.metrics.connection_resurrected(connection)
+            self._report_pool_size()
+        return connection
 
-        try:
-            # retrieve a connection to check
-            timeout, connection = self.dead.get(block=False)
-        except Empty:
-            # other thread has been faster and the queue is now empty. If we
-            # are forced, return a connection at random again.
-            if force:
-                return random.choice(self.orig_connections)
-            return
+    def get_dead_connections(self, now=None):
+        """
+        Return the dead connections whose timeout is over and which are due
+        for a health check.
+        """
+        now = now if now else time.time()
+        with self._lock:
+            return [c for (timeout, c) in sorted(self.dead.queue) if timeout <= now]
 
-        if not force and timeout > time.time():
-            # return it back if not eligible and not forced
-            self.dead.put((timeout, connection))
-            return
+    def health_check_passed(self, connection):
+        """
+        Return a dead connection that responded to a health check to the live
+        pool and reset its fail counter.
 
-        # either we were forced or the connection is eligible to be retried
-        self.connections.append(connection)
-        logger.info("Resurrecting connection %r (force=%s).", connection, force)
-        return connection
+        :arg connection: the connection that passed the health check
+        """
+        with self._lock:
+            if not self._remove_dead(connection):
+                # resurrected by force or by another check in the meantime
+                return
+            self.connections = self.connections + [connection]
+            self.dead_count.pop(connection, None)
+        logger.info("Resurrecting connection %r after a health check.", connection)
+        if self.metrics is not None:
+            self.metrics.connection_resurrected(connection)
+            self._report_pool_size()
+
+    def health_check_failed(self, connection, now=None):
+        """
+        Put a dead connection that failed a health check on a new, longer,
+        timeout.
+
+        :arg connection: the connection that failed the health check
+        """
+        now = now if now else time.time()
+        with self._lock:
+            if not self._remove_dead(connection):
+                return
+            dead_count, timeout = self._put_dead(connection, now)
+        logger.warning(
+            "Connection %r has failed %i health checks in a row, putting on %i second timeout.",
+            connection,
+            dead_count,
+            timeout,
+        )
+
+    def request_started(self, connection):
+        """
+        Called by the transport before a request is sent over the connection,
+        passed on to the selector and the circuit breaker.
+
+        :arg connection: the connection the request is sent over
+        """
+        self.selector.request_started(connection)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.request_started(connection)
+
+    def request_finished(self, connection, duration, failed=False, status=None):
+        """
+        Called by the transport once a request sent over the connection
+        completed, passed on to the selector and the circuit breaker.
+
+        :arg connection: the connection the request was sent over
+        :arg duration: time in seconds the request took
+        :arg failed: whether the request failed to get a response from the node
+        :arg status: status code of the response, if any
+        """
+        self.selector.request_finished(connection, duration, failed)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(self, connection, failed, status)
 
     def get_connection(self):
         """
@@ -261,19 +556,36 @@ class ConnectionPool(object):
 
         Returns a connection instance and its current fail count.
         """
-        self.resurrect()
-        connections = self.connections[:]
+        # only look at the dead connections once one of them is due, with
+        # health checks they're resurrected by the transport instead
+        if not self.health_check and self._next_resurrection <= time.time():
+            self.resurrect()
+        connections = self.connections
 
         # no live nodes, resurrect one by force and return it
         if not connections:
-            return self.resurrect(True)
+            connection = self.resurrect(True)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.allow_request(connection)
+            return connection
 
         # only call selector if we have a selection
         if len(connections) > 1:
-            return self.selector.select(connections)
-
-        # only one connection, no need for a selector
-        return connections[0]
+            connection = self.selector.select(connections)
+        else:
+            # only one connection, no need for a selector
+            connection = connections[0]
+
+        if self.circuit_breaker is not None and not (
+            self.circuit_breaker.allow_request(connection)
+        ):
+            # the node is out of trial requests, use one with a closed circuit
+            closed = [c for c in connections if not self.circuit_breaker.is_limited(c)]
+            if closed:
+                connection = (
+                    self.selector.select(closed) if len(closed) > 1 else closed[0]
+                )
+        return connection
 
     def close(self):
         """
@@ -306,10 +618,14 @@ class DummyConnectionPool(ConnectionPool):
         """
         self.connection.close()
 
+    def get_dead_connections(self, now=None):
+        return []
+
     def _noop(self, *args, **kwargs):
         pass
 
-    mark_dead = mark_live = resurrect = _noop
+    mark_dead = mark_live = resurrect = request_started = request_finished = _noop
+    health_check_passed = health_check_failed = _noop
 
 
 class EmptyConnectionPool(ConnectionPool):
@@ -322,7 +638,12 @@ class EmptyConnectionPool(ConnectionPool):
     def get_connection(self):
         raise ImproperlyConfigured("No connections were configured")
 
+    def get_dead_connections(self, now=None):
+        return []
+
     def _noop(self, *args, **kwargs):
         pass
 
     close = mark_dead = mark_live = resurrect = _noop
+    request_started = request_finished = _noop
+    health_check_passed = health_check_failed = _noop
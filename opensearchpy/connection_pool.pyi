@@ -25,9 +25,21 @@
 #  under the License.
 
 import logging
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
+from .circuit_breaker import CircuitBreaker
 from .connection import Connection
+from .metrics import TransportMetrics
 
 try:
     from Queue import PriorityQueue
@@ -40,10 +52,43 @@ class ConnectionSelector(object):
     connection_opts: Sequence[Tuple[Connection, Any]]
     def __init__(self, opts: Sequence[Tuple[Connection, Any]]) -> None: ...
     def select(self, connections: Sequence[Connection]) -> Connection: ...
+    def request_started(self, connection: Connection) -> None: ...
+    def request_finished(
+        self, connection: Connection, duration: float, failed: bool = ...
+    ) -> None: ...
 
 class RandomSelector(ConnectionSelector): ...
 class RoundRobinSelector(ConnectionSelector): ...
 
+class LatencySelector(ConnectionSelector):
+    choices: Optional[int]
+    decay: float
+    failure_penalty: float
+    half_life: Optional[float]
+    stats: Dict[Connection, List[Union[float, int]]]
+    def __init__(
+        self,
+        opts: Sequence[Tuple[Connection, Any]],
+        choices: Optional[int] = ...,
+        decay: float = ...,
+        failure_penalty: float = ...,
+        half_life: Optional[float] = ...,
+    ) -> None: ...
+    def cost(self, connection: Connection) -> Tuple[float, int]: ...
+
+class ZoneAwareSelector(ConnectionSelector):
+    zone: Optional[str]
+    attribute: str
+    selector: ConnectionSelector
+    local: FrozenSet[Connection]
+    def __init__(
+        self,
+        opts: Sequence[Tuple[Connection, Any]],
+        zone: Optional[str] = ...,
+        attribute: str = ...,
+        selector_class: Type[ConnectionSelector] = ...,
+    ) -> None: ...
+
 class ConnectionPool(object):
     connections_opts: Sequence[Tuple[Connection, Any]]
     connections: Sequence[Connection]
@@ -52,6 +97,9 @@ class ConnectionPool(object):
     dead_count: Dict[Connection, int]
     dead_timeout: float
     timeout_cutoff: int
+    health_check: bool
+    circuit_breaker: Optional[CircuitBreaker]
+    metrics: Optional[TransportMetrics]
     selector: ConnectionSelector
     def __init__(
         self,
@@ -60,11 +108,27 @@ class ConnectionPool(object):
         timeout_cutoff: int = ...,
         selector_class: Type[ConnectionSelector] = ...,
         randomize_hosts: bool = ...,
+        health_check: bool = ...,
+        circuit_breaker: Optional[CircuitBreaker] = ...,
+        metrics: Optional[TransportMetrics] = ...,
         **kwargs: Any
     ) -> None: ...
     def mark_dead(self, connection: Connection, now: Optional[float] = ...) -> None: ...
     def mark_live(self, connection: Connection) -> None: ...
     def resurrect(self, force: bool = ...) -> Optional[Connection]: ...
+    def get_dead_connections(self, now: Optional[float] = ...) -> List[Connection]: ...
+    def health_check_passed(self, connection: Connection) -> None: ...
+    def health_check_failed(
+        self, connection: Connection, now: Optional[float] = ...
+    ) -> None: ...
+    def request_started(self, connection: Connection) -> None: ...
+    def request_finished(
+        self,
+        connection: Connection,
+        duration: float,
+        failed: bool = ...,
+        status: Optional[int] = ...,
+    ) -> None: ...
     def get_connection(self) -> Connection: ...
     def close(self) -> None: ...
     def __repr__(self) -> str: ...
@@ -75,11 +139,16 @@ class DummyConnectionPool(ConnectionPool):
     ) -> None: ...
     def get_connection(self) -> Connection: ...
     def close(self) -> None: ...
+    def get_dead_connections(self, now: Optional[float] = ...) -> List[Connection]: ...
     def _noop(self, *args: Any, **kwargs: Any) -> Any: ...
-    mark_dead = mark_live = resurrect = _noop
+    mark_dead = mark_live = resurrect = request_started = request_finished = _noop
+    health_check_passed = health_check_failed = _noop
 
 class EmptyConnectionPool(ConnectionPool):
     def __init__(self, *_: Any, **__: Any) -> None: ...
     def get_connection(self) -> Connection: ...
+    def get_dead_connections(self, now: Optional[float] = ...) -> List[Connection]: ...
     def _noop(self, *args: Any, **kwargs: Any) -> Any: ...
     close = mark_dead = mark_live = resurrect = _noop
+    request_started = request_finished = _noop
+    health_check_passed = health_check_failed = _noop
@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+from collections import deque
+
+from .compat import Empty, Queue, copy_context
+
+# POST endpoints that only read data, in addition to GET and HEAD requests
+_HEDGEABLE_ENDPOINTS = ("_search", "_msearch", "_count", "_mget")
+# endpoints with a document id as the last segment
+_DOCUMENT_ENDPOINTS = ("_doc", "_create", "_update", "_source")
+
+
+def _is_read_request(method, url, params=None):
+    # idempotent requests that only read data
+    segments = url.split("?", 1)[0].rstrip("/").split("/")
+    # scrolls move forward with every request, searches with a scroll
+    # parameter open a new one
+    if "scroll" in segments[-2:] or (params and "scroll" in params):
+        return False
+    if method in ("GET", "HEAD"):
+        return True
+    if method != "POST":
+        return False
+    if segments[-1] == "template":
+        # search templates, e.g. /_search/template
+        segments = segments[:-1]
+    # a document id can look like an endpoint, e.g. /index/_doc/_search
+    if len(segments) > 1 and segments[-2] in _DOCUMENT_ENDPOINTS:
+        return False
+    return segments[-1] in _HEDGEABLE_ENDPOINTS
+
+
+class _Workers(object):
+    """
+    Reusable daemon threads running the attempts of hedged requests and the
+    parallel sniffing requests, in the context of the thread submitting them
+    so that e.g. their trace spans keep their parent. Threads idle for
+    ``idle_timeout`` seconds exit. With ``max_workers`` set, tasks submitted
+    while that many threads are busy wait for one of them to be done.
+    """
+
+    def __init__(self, max_workers=None, idle_timeout=60):
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        # task queues of the idle threads, most recently used last
+        self._idle = []
+        # tasks waiting for a thread when there are max_workers of them
+        self._backlog = deque()
+        self._threads = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        """
+        Run ``fn(*args)`` in an idle thread, or a new one if there's none
+        and there are less than ``max_workers`` threads.
+        """
+        if copy_context is not None:
+            fn, args = copy_context().run, (fn,) + args
+        with self._lock:
+            if self._idle:
+                tasks = self._idle.pop()
+            elif self.max_workers is not None and self._threads >= self.max_workers:
+                self._backlog.append((fn, args))
+                return
+            else:
+                tasks = None
+                self._threads += 1
+        if tasks is None:
+            tasks = Queue()
+            thread = threading.Thread(target=self._work, args=(tasks,))
+            thread.daemon = True
+            thread.start()
+        tasks.put((fn, args))
+
+    def _work(self, tasks):
+        while True:
+            try:
+                fn, args = tasks.get(timeout=self.idle_timeout)
+            except Empty:
+                with self._lock:
+                    if tasks in self._idle:
+                        self._idle.remove(tasks)
+                        self._threads -= 1
+                        return
+                # a task was submitted while timing out
+                continue
+            while fn is not None:
+                try:
+                    fn(*args)
+                except BaseException:
+                    with self._lock:
+                        self._threads -= 1
+                    raise
+                with self._lock:
+                    if self._backlog:
+                        fn, args = self._backlog.popleft()
+                    else:
+                        fn = None
+                        self._idle.append(tasks)
+
+
+class RequestHedging(object):
+    """
+    Policy for hedged requests, to be passed to the
+    :class:`~opensearchpy.Transport` as ``hedging``.
+
+    When a read request hasn't got a response after the given percentile of
+    the recent request latencies, a duplicate of it is sent to another node
+    and the first response wins. Hedging is limited to ``budget`` times the
+    number of read requests so it can't amplify the load on a struggling
+    cluster by more than that.
+
+    Only ``GET`` and ``HEAD`` requests and ``POST`` requests to search, count
+    and multi get endpoints are hedged, scrolls never are.
+
+    :arg percentile: percentile of the recent latencies after which a request
+        is hedged
+    :arg budget: maximum fraction of the read requests that are hedged
+    :arg min_delay: minimum number of seconds to wait before hedging
+    :arg window: number of recent latencies the percentile is computed from
+    :arg min_samples: number of latencies needed before requests get hedged
+    :arg max_burst: maximum number of hedges unused budget can be saved for
+    """
+
+    def __init__(
+        self,
+        percentile=95,
+        budget=0.05,
+        min_delay=0.005,
+        window=1000,
+        min_samples=100,
+        max_burst=10,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_burst = max_burst
+        self.latencies = deque(maxlen=window)
+        self.tokens = 0.0
+        self._delay = None
+        self._update_every = max(1, window // 20)
+        self._recorded = 0
+        self._lock = threading.Lock()
+
+    def is_hedgeable(self, method, url, params=None):
+        """
+        Whether a request is idempotent and only reads data.
+        """
+        return _is_read_request(method, url, params)
+
+    def get_delay(self):
+        """
+        Called for every hedgeable request, returns the number of seconds
+        after which it should be hedged or ``None`` if there aren't enough
+        latencies recorded yet.
+        """
+        with self._lock:
+            self.tokens = min(self.tokens + self.budget, self.max_burst)
+            return self._delay
+
+    def has_budget(self):
+        return self.tokens >= 1
+
+    def acquire(self):
+        """
+        Take a hedge from the budget, returns ``False`` if it's exhausted.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def record(self, latency):
+        """
+        Record the latency of a successful request.
+
+        :arg latency: time in seconds the request took
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            self._recorded += 1
+            if len(self.latencies) < self.min_samples:
+                return
+            if self._delay is None or self._recorded >= self._update_every:
+                self._recorded = 0
+                latencies = sorted(self.latencies)
+                index = int(len(latencies) * self.percentile / 100.0)
+                self._delay = max(
+                    latencies[min(index, len(latencies) - 1)], self.min_delay
+                )
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any, Callable, Deque, Mapping, Optional
+
+class _Workers(object):
+    max_workers: Optional[int]
+    idle_timeout: float
+    def __init__(
+        self, max_workers: Optional[int] = ..., idle_timeout: float = ...
+    ) -> None: ...
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None: ...
+
+class RequestHedging(object):
+    percentile: float
+    budget: float
+    min_delay: float
+    min_samples: int
+    max_burst: float
+    latencies: Deque[float]
+    tokens: float
+    def __init__(
+        self,
+        percentile: float = ...,
+        budget: float = ...,
+        min_delay: float = ...,
+        window: int = ...,
+        min_samples: int = ...,
+        max_burst: float = ...,
+    ) -> None: ...
+    def is_hedgeable(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]] = ...
+    ) -> bool: ...
+    def get_delay(self) -> Optional[float]: ...
+    def has_budget(self) -> bool: ...
+    def acquire(self) -> bool: ...
+    def record(self, latency: float) -> None: ...
@@ -28,13 +28,16 @@
 import sys
 
 from .actions import (
+    AdaptiveChunkSize,
     _chunk_actions,
     _process_bulk_chunk,
     bulk,
     expand_action,
     parallel_bulk,
+    parallel_scan,
     reindex,
     scan,
+    stream_hits,
     streaming_bulk,
 )
 from .asyncsigner import AWSV4SignerAsyncAuth
@@ -42,13 +45,16 @@ from .errors import BulkIndexError, ScanError
 from .signer import AWSV4SignerAuth
 
 __all__ = [
+    "AdaptiveChunkSize",
     "BulkIndexError",
     "ScanError",
     "expand_action",
     "streaming_bulk",
     "bulk",
     "parallel_bulk",
+    "parallel_scan",
     "scan",
+    "stream_hits",
     "reindex",
     "_chunk_actions",
     "_process_bulk_chunk",
@@ -61,9 +67,20 @@ __all__ = [
 if sys.version_info >= (3, 6):
     from .._async.helpers.actions import (
         async_bulk,
+        async_parallel_bulk,
+        async_parallel_scan,
         async_reindex,
         async_scan,
+        async_stream_hits,
         async_streaming_bulk,
     )
 
-    __all__ += ["async_scan", "async_bulk", "async_reindex", "async_streaming_bulk"]
+    __all__ += [
+        "async_scan",
+        "async_bulk",
+        "async_reindex",
+        "async_streaming_bulk",
+        "async_parallel_bulk",
+        "async_parallel_scan",
+        "async_stream_hits",
+    ]
@@ -26,13 +26,16 @@
 
 import sys
 
+from .actions import AdaptiveChunkSize as AdaptiveChunkSize
 from .actions import _chunk_actions as _chunk_actions
 from .actions import _process_bulk_chunk as _process_bulk_chunk
 from .actions import bulk as bulk
 from .actions import expand_action as expand_action
 from .actions import parallel_bulk as parallel_bulk
+from .actions import parallel_scan as parallel_scan
 from .actions import reindex as reindex
 from .actions import scan as scan
+from .actions import stream_hits as stream_hits
 from .actions import streaming_bulk as streaming_bulk
 from .errors import BulkIndexError as BulkIndexError
 from .errors import ScanError as ScanError
@@ -43,8 +46,11 @@ try:
         raise ImportError
 
     from .._async.helpers.actions import async_bulk as async_bulk
+    from .._async.helpers.actions import async_parallel_bulk as async_parallel_bulk
+    from .._async.helpers.actions import async_parallel_scan as async_parallel_scan
     from .._async.helpers.actions import async_reindex as async_reindex
     from .._async.helpers.actions import async_scan as async_scan
+    from .._async.helpers.actions import async_stream_hits as async_stream_hits
     from .._async.helpers.actions import async_streaming_bulk as async_streaming_bulk
     from .asyncsigner import AWSV4SignerAsyncAuth as AWSV4SignerAsyncAuth
     from .signer import AWSV4SignerAuth as AWSV4SignerAuth
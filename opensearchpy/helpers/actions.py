@@ -26,11 +26,15 @@
 
 
 import logging
+import threading
 import time
+from collections import deque
+from itertools import islice
 from operator import methodcaller
 
-from ..compat import Mapping, Queue, map, string_types
-from ..exceptions import TransportError
+from ..client.utils import _get_params_and_headers, _make_path
+from ..compat import Empty, Full, Mapping, Queue, map, string_types
+from ..exceptions import ConnectionTimeout, ImproperlyConfigured, TransportError
 from .errors import BulkIndexError, ScanError
 
 logger = logging.getLogger("opensearchpy.helpers")
@@ -103,11 +107,181 @@ def expand_action(data):
     return action, data.get("_source", data)
 
 
+def _serialize_line(serializer, data):
+    """
+    Serialize one line of a bulk request straight to ``bytes`` so it only
+    needs to be encoded once, both for measuring and for sending.
+    """
+    line = serializer.dumps(data)
+    if not isinstance(line, bytes):
+        line = line.encode("utf-8", "surrogatepass")
+    return line
+
+
+def _bulk_lines_body(bulk_actions):
+    """
+    Join the serialized lines of a chunk into a bulk request body. The body is
+    allocated once at its final size, the empty last line provides the
+    trailing newline without another copy.
+    """
+    lines = list(bulk_actions)
+    lines.append(b"")
+    return b"\n".join(lines)
+
+
+def _is_rejected(item):
+    """
+    Tell whether a bulk response item was rejected because the node was
+    overloaded.
+    """
+    if item.get("status") == 429:
+        return True
+    error = item.get("error")
+    if isinstance(error, Mapping):
+        error = error.get("type")
+    return isinstance(error, string_types) and error.endswith(
+        "rejected_execution_exception"
+    )
+
+
+class AdaptiveChunkSize(object):
+    """
+    Adjust the size of bulk chunks while indexing, based on how the cluster
+    handles the chunks sent so far.
+
+    The number of documents per chunk and the byte size of a chunk grow
+    additively as long as requests complete within ``target_latency`` without
+    rejections. They shrink multiplicatively when a request is slower than
+    that, times out, or when any document is rejected with ``429`` /
+    ``rejected_execution_exception`` (AIMD).
+
+    Pass an instance as ``adaptive_chunking`` to the bulk helpers, or pass
+    ``True`` to use the defaults, starting from the helper's ``chunk_size``
+    and ``max_chunk_bytes``.
+
+    :arg chunk_size: initial number of docs in one chunk
+    :arg max_chunk_bytes: initial maximum size of a chunk in bytes, chunks
+        never grow beyond it
+    :arg min_chunk_size: lower bound for the number of docs in one chunk
+    :arg max_chunk_size: upper bound for the number of docs in one chunk
+    :arg min_chunk_bytes: lower bound for the size of a chunk in bytes
+    :arg target_latency: time in seconds a bulk request should take. The
+        ``took`` reported by the server is used, falling back to the latency
+        observed by the client
+    :arg increase_step: number of docs added to a chunk after a request that
+        stayed within target
+    :arg decrease_factor: factor applied to the chunk size after a request
+        that was rejected or slower than target
+    """
+
+    def __init__(
+        self,
+        chunk_size=500,
+        max_chunk_bytes=100 * 1024 * 1024,
+        min_chunk_size=10,
+        max_chunk_size=10000,
+        min_chunk_bytes=1024 * 1024,
+        target_latency=1.0,
+        increase_step=50,
+        decrease_factor=0.5,
+    ):
+        self.min_chunk_size = min(min_chunk_size, chunk_size)
+        self.max_chunk_size = max(max_chunk_size, chunk_size)
+        self.min_chunk_bytes = min(min_chunk_bytes, max_chunk_bytes)
+        self.max_chunk_bytes_limit = max_chunk_bytes
+        self.target_latency = target_latency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        # parallel_bulk reports results from multiple threads
+        self._lock = threading.Lock()
+
+    def observe_response(self, resp, bulk_actions, bulk_data, latency):
+        """
+        Update chunk sizes from the response to a bulk request.
+
+        :arg resp: deserialized response of the bulk request
+        :arg bulk_actions: serialized lines of the chunk that was sent
+        :arg bulk_data: actions of the chunk that was sent
+        :arg latency: time in seconds the request took, as seen by the client
+        """
+        rejected = False
+        for item in resp.get("items", ()):
+            for result in item.values():
+                if _is_rejected(result):
+                    rejected = True
+                    break
+            if rejected:
+                break
+
+        took = resp.get("took")
+        if took is not None:
+            latency = took / 1000.0
+
+        if rejected or latency > self.target_latency:
+            self._decrease(bulk_actions)
+        else:
+            self._increase(bulk_actions, bulk_data)
+
+    def observe_error(self, error, bulk_actions, bulk_data):
+        """
+        Update chunk sizes after a bulk request failed as a whole.
+
+        :arg error: the ``TransportError`` raised by the request
+        :arg bulk_actions: serialized lines of the chunk that was sent
+        :arg bulk_data: actions of the chunk that was sent
+        """
+        if error.status_code == 429 or isinstance(error, ConnectionTimeout):
+            self._decrease(bulk_actions)
+
+    def _decrease(self, bulk_actions):
+        chunk_bytes = _chunk_bytes(bulk_actions)
+        with self._lock:
+            self.chunk_size = max(
+                self.min_chunk_size, int(self.chunk_size * self.decrease_factor)
+            )
+            # shrink from what was actually sent, the byte limit might not
+            # have been reached by the chunk
+            self.max_chunk_bytes = max(
+                self.min_chunk_bytes,
+                int(min(self.max_chunk_bytes, chunk_bytes) * self.decrease_factor),
+            )
+
+    def _increase(self, bulk_actions, bulk_data):
+        # grow the byte limit by the size of ``increase_step`` average docs
+        doc_bytes = _chunk_bytes(bulk_actions) // max(1, len(bulk_data))
+        with self._lock:
+            self.chunk_size = min(
+                self.max_chunk_size, self.chunk_size + self.increase_step
+            )
+            self.max_chunk_bytes = min(
+                self.max_chunk_bytes_limit,
+                self.max_chunk_bytes + doc_bytes * self.increase_step,
+            )
+
+
+def _chunk_bytes(bulk_actions):
+    # +1 for the new line character after each line
+    return sum(len(line) + 1 for line in bulk_actions)
+
+
+def _adaptive_chunk_size(adaptive_chunking, chunk_size, max_chunk_bytes):
+    """
+    Resolve the ``adaptive_chunking`` argument of the bulk helpers.
+    """
+    if adaptive_chunking is True:
+        return AdaptiveChunkSize(chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes)
+    return adaptive_chunking or None
+
+
 class _ActionChunker:
-    def __init__(self, chunk_size, max_chunk_bytes, serializer):
+    def __init__(self, chunk_size, max_chunk_bytes, serializer, chunk_sizer=None):
         self.chunk_size = chunk_size
         self.max_chunk_bytes = max_chunk_bytes
         self.serializer = serializer
+        self.chunk_sizer = chunk_sizer
 
         self.size = 0
         self.action_count = 0
@@ -115,20 +289,30 @@ class _ActionChunker:
         self.bulk_data = []
 
     def feed(self, action, data):
-        ret = None
         raw_data, raw_action = data, action
-        action = self.serializer.dumps(action)
-        # +1 to account for the trailing new line character
-        cur_size = len(action.encode("utf-8")) + 1
+        action = _serialize_line(self.serializer, action)
+        if data is not None:
+            data = _serialize_line(self.serializer, data)
+        return self.feed_serialized(raw_action, raw_data, action, data)
 
+    def feed_serialized(self, raw_action, raw_data, action, data):
+        """
+        Same as ``feed()`` for an action and data line already serialized.
+        """
+        ret = None
+        if self.chunk_sizer is not None:
+            self.chunk_size = self.chunk_sizer.chunk_size
+            self.max_chunk_bytes = self.chunk_sizer.max_chunk_bytes
+
+        # +1 to account for the trailing new line character
+        cur_size = len(action) + 1
         if data is not None:
-            data = self.serializer.dumps(data)
-            cur_size += len(data.encode("utf-8")) + 1
+            cur_size += len(data) + 1
 
         # full chunk, send it and start a new one
         if self.bulk_actions and (
             self.size + cur_size > self.max_chunk_bytes
-            or self.action_count == self.chunk_size
+            or self.action_count >= self.chunk_size
         ):
             ret = (self.bulk_data, self.bulk_actions)
             self.bulk_actions, self.bulk_data = [], []
@@ -153,13 +337,17 @@ class _ActionChunker:
         return ret
 
 
-def _chunk_actions(actions, chunk_size, max_chunk_bytes, serializer):
+def _chunk_actions(actions, chunk_size, max_chunk_bytes, serializer, chunk_sizer=None):
     """
-    Split actions into chunks by number or size, serialize them into strings in
-    the process.
+    Split actions into chunks by number or size, serialize them into bytes in
+    the process. When ``chunk_sizer`` is given, its current limits are used
+    instead of ``chunk_size`` and ``max_chunk_bytes``.
     """
     chunker = _ActionChunker(
-        chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        chunk_sizer=chunk_sizer,
     )
     for action, data in actions:
         ret = chunker.feed(action, data)
@@ -170,6 +358,76 @@ def _chunk_actions(actions, chunk_size, max_chunk_bytes, serializer):
         yield ret
 
 
+def _serialize_actions(task):
+    """
+    Expand and serialize a batch of actions, run in the worker processes of
+    :func:`~opensearchpy.helpers.parallel_bulk`. Returns the raw and
+    serialized action and data lines of every action.
+    """
+    actions, expand_action_callback, serializer = task
+    serialized = []
+    for action, data in map(expand_action_callback, actions):
+        serialized.append(
+            (
+                action,
+                data,
+                _serialize_line(serializer, action),
+                None if data is None else _serialize_line(serializer, data),
+            )
+        )
+    return serialized
+
+
+def _chunk_actions_in_processes(
+    pool,
+    window,
+    actions,
+    chunk_size,
+    max_chunk_bytes,
+    serializer,
+    expand_action_callback,
+    chunk_sizer=None,
+):
+    """
+    Split actions into batches of ``chunk_size`` and have ``pool``, a
+    :class:`multiprocessing.pool.Pool` or a
+    :class:`concurrent.futures.Executor`, expand and serialize them, with at
+    most ``window`` batches being serialized at once. The serialized actions
+    are then split into chunks as by ``_chunk_actions()``, across batches,
+    and yielded in the order of the actions.
+    """
+    chunker = _ActionChunker(
+        chunk_size=chunk_size,
+        max_chunk_bytes=max_chunk_bytes,
+        serializer=serializer,
+        chunk_sizer=chunk_sizer,
+    )
+    actions = iter(actions)
+    pending = deque()
+    while True:
+        if chunk_sizer is not None:
+            chunk_size = chunk_sizer.chunk_size
+
+        batch = list(islice(actions, chunk_size))
+        if batch:
+            task = (batch, expand_action_callback, serializer)
+            if hasattr(pool, "apply_async"):
+                pending.append(pool.apply_async(_serialize_actions, (task,)).get)
+            else:
+                pending.append(pool.submit(_serialize_actions, task).result)
+
+        if pending and (not batch or len(pending) >= window):
+            for serialized in pending.popleft()():
+                ret = chunker.feed_serialized(*serialized)
+                if ret:
+                    yield ret
+        elif not batch:
+            ret = chunker.flush()
+            if ret:
+                yield ret
+            return
+
+
 def _process_bulk_chunk_success(resp, bulk_data, ignore_status, raise_on_error=True):
     # if raise on error is set, we need to collect errors per chunk before raising them
     errors = []
@@ -233,6 +491,7 @@ def _process_bulk_chunk(
     raise_on_exception=True,
     raise_on_error=True,
     ignore_status=(),
+    chunk_sizer=None,
     *args,
     **kwargs
 ):
@@ -242,10 +501,13 @@ def _process_bulk_chunk(
     if not isinstance(ignore_status, (list, tuple)):
         ignore_status = (ignore_status,)
 
+    start = time.time()
     try:
         # send the actual request
-        resp = client.bulk("\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = client.bulk(_bulk_lines_body(bulk_actions), *args, **kwargs)
     except TransportError as e:
+        if chunk_sizer is not None:
+            chunk_sizer.observe_error(e, bulk_actions, bulk_data)
         gen = _process_bulk_chunk_error(
             error=e,
             bulk_data=bulk_data,
@@ -254,6 +516,10 @@ def _process_bulk_chunk(
             raise_on_error=raise_on_error,
         )
     else:
+        if chunk_sizer is not None:
+            chunk_sizer.observe_response(
+                resp, bulk_actions, bulk_data, time.time() - start
+            )
         gen = _process_bulk_chunk_success(
             resp=resp,
             bulk_data=bulk_data,
@@ -277,6 +543,7 @@ def streaming_bulk(
     max_backoff=600,
     yield_ok=True,
     ignore_status=(),
+    adaptive_chunking=False,
     *args,
     **kwargs
 ):
@@ -312,11 +579,20 @@ def streaming_bulk(
     :arg max_backoff: maximum number of seconds a retry will wait
     :arg yield_ok: if set to False will skip successful documents in the output
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg adaptive_chunking: if ``True``, grow or shrink ``chunk_size`` and
+        ``max_chunk_bytes`` based on how fast and how many documents the cluster
+        accepts, see :class:`~opensearchpy.helpers.AdaptiveChunkSize`. Also
+        accepts an instance of it to control the bounds.
     """
     actions = map(expand_action_callback, actions)
+    chunk_sizer = _adaptive_chunk_size(adaptive_chunking, chunk_size, max_chunk_bytes)
 
     for bulk_data, bulk_actions in _chunk_actions(
-        actions, chunk_size, max_chunk_bytes, client.transport.serializer
+        actions,
+        chunk_size,
+        max_chunk_bytes,
+        client.transport.serializer,
+        chunk_sizer,
     ):
         for attempt in range(max_retries + 1):
             to_retry, to_retry_data = [], []
@@ -333,6 +609,7 @@ def streaming_bulk(
                         raise_on_exception,
                         raise_on_error,
                         ignore_status,
+                        chunk_sizer,
                         *args,
                         **kwargs
                     ),
@@ -346,10 +623,11 @@ def streaming_bulk(
                             and info["status"] == 429
                             and (attempt + 1) <= max_retries
                         ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
+                            # _process_bulk_chunk expects serialized lines so we
+                            # need to re-serialize the data
                             to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
+                                _serialize_line(client.transport.serializer, line)
+                                for line in data
                             )
                             to_retry_data.append(data)
                         else:
@@ -427,12 +705,22 @@ def parallel_bulk(
     queue_size=4,
     expand_action_callback=expand_action,
     ignore_status=(),
+    adaptive_chunking=False,
+    process_count=None,
+    process_pool=None,
     *args,
     **kwargs
 ):
     """
     Parallel version of the bulk helper run in multiple threads at once.
 
+    Actions are expanded and serialized in the calling thread unless
+    ``process_count`` or ``process_pool`` is set, in which case a pool of
+    processes does that work and the threads only send the serialized chunks.
+    The actions, ``expand_action_callback`` and the client's serializer then
+    need to be picklable. Chunks are the same and results are yielded in the
+    order of the actions either way.
+
     :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
     :arg actions: iterator containing the actions
     :arg thread_count: size of the threadpool to use for the bulk requests
@@ -448,12 +736,25 @@ def parallel_bulk(
     :arg queue_size: size of the task queue between the main thread (producing
         chunks to send) and the processing threads.
     :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg adaptive_chunking: if ``True``, grow or shrink ``chunk_size`` and
+        ``max_chunk_bytes`` based on how fast and how many documents the cluster
+        accepts, see :class:`~opensearchpy.helpers.AdaptiveChunkSize`. Also
+        accepts an instance of it to control the bounds.
+    :arg process_count: size of the process pool used to expand and serialize
+        actions, by default they are serialized in the calling thread. With
+        ``process_pool``, the number of batches of ``chunk_size`` actions
+        serialized at once
+    :arg process_pool: :class:`multiprocessing.pool.Pool` or
+        :class:`concurrent.futures.Executor`, e.g. a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, to expand and
+        serialize actions in instead of creating a pool of ``process_count``
+        processes, so that it can be reused across calls. It's left open
     """
     # Avoid importing multiprocessing unless parallel_bulk is used
     # to avoid exceptions on restricted environments like App Engine
-    from multiprocessing.pool import ThreadPool
+    from multiprocessing.pool import Pool, ThreadPool
 
-    actions = map(expand_action_callback, actions)
+    chunk_sizer = _adaptive_chunk_size(adaptive_chunking, chunk_size, max_chunk_bytes)
 
     class BlockingPool(ThreadPool):
         def _setup_queues(self):
@@ -463,9 +764,31 @@ def parallel_bulk(
             self._inqueue = Queue(max(queue_size, thread_count))
             self._quick_put = self._inqueue.put
 
-    pool = BlockingPool(thread_count)
-
+    own_pool = pool = None
     try:
+        if process_count and process_pool is None:
+            process_pool = own_pool = Pool(process_count)
+        if process_pool is not None:
+            chunks = _chunk_actions_in_processes(
+                process_pool,
+                max(queue_size, process_count or 0),
+                actions,
+                chunk_size,
+                max_chunk_bytes,
+                client.transport.serializer,
+                expand_action_callback,
+                chunk_sizer,
+            )
+        else:
+            chunks = _chunk_actions(
+                map(expand_action_callback, actions),
+                chunk_size,
+                max_chunk_bytes,
+                client.transport.serializer,
+                chunk_sizer,
+            )
+
+        pool = BlockingPool(thread_count)
         for result in pool.imap(
             lambda bulk_chunk: list(
                 _process_bulk_chunk(
@@ -473,20 +796,81 @@ def parallel_bulk(
                     bulk_chunk[1],
                     bulk_chunk[0],
                     ignore_status=ignore_status,
+                    chunk_sizer=chunk_sizer,
                     *args,
                     **kwargs
                 )
             ),
-            _chunk_actions(
-                actions, chunk_size, max_chunk_bytes, client.transport.serializer
-            ),
+            chunks,
         ):
             for item in result:
                 yield item
 
     finally:
-        pool.close()
-        pool.join()
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if own_pool is not None:
+            # all serialized chunks have been consumed by now
+            own_pool.terminate()
+            own_pool.join()
+
+
+class _ScrollPrefetcher(object):
+    """
+    Fetch the pages of a scroll ahead of the consumer in a background thread,
+    at most ``prefetch`` pages are fetched before the consumer gets to them.
+    """
+
+    def __init__(self, client, resp, scroll, scroll_kwargs, prefetch):
+        self.scroll_id = resp.get("_scroll_id")
+        self._pages = Queue()
+        # one token per page that may be fetched ahead of the consumer
+        self._slots = Queue()
+        for _ in range(prefetch):
+            self._slots.put(None)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(client, resp, scroll, scroll_kwargs)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, client, resp, scroll, scroll_kwargs):
+        try:
+            # request exactly the pages the consumer will ask for
+            while self.scroll_id and resp["hits"]["hits"]:
+                if not self._acquire_slot():
+                    return
+                resp = client.scroll(
+                    body={"scroll_id": self.scroll_id, "scroll": scroll},
+                    **scroll_kwargs
+                )
+                self.scroll_id = resp.get("_scroll_id")
+                self._pages.put(resp)
+        except Exception as e:
+            self._pages.put(e)
+
+    def _acquire_slot(self):
+        # give up once the consumer went away
+        while not self._stop.is_set():
+            try:
+                self._slots.get(timeout=0.1)
+                return True
+            except Empty:
+                pass
+        return False
+
+    def next_page(self):
+        page = self._pages.get()
+        self._slots.put(None)
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
 
 
 def scan(
@@ -499,6 +883,7 @@ def scan(
     request_timeout=None,
     clear_scroll=True,
     scroll_kwargs=None,
+    prefetch=0,
     **kwargs
 ):
     """
@@ -529,6 +914,9 @@ def scan(
         to true.
     :arg scroll_kwargs: additional kwargs to be passed to
         :meth:`~opensearchpy.OpenSearch.scroll`
+    :arg prefetch: number of pages to fetch ahead in a background thread while
+        the current page is being consumed. By default (``0``) the next page
+        is only requested once all hits of the current one have been consumed.
 
     Any additional keyword arguments will be passed to the initial
     :meth:`~opensearchpy.OpenSearch.search` call::
@@ -566,6 +954,10 @@ def scan(
     )
     scroll_id = resp.get("_scroll_id")
 
+    prefetcher = None
+    if prefetch:
+        prefetcher = _ScrollPrefetcher(client, resp, scroll, scroll_kwargs, prefetch)
+
     try:
         while scroll_id and resp["hits"]["hits"]:
             for hit in resp["hits"]["hits"]:
@@ -595,18 +987,288 @@ def scan(
                             shards_total,
                         ),
                     )
-            resp = client.scroll(
-                body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
-            )
+            if prefetcher is not None:
+                resp = prefetcher.next_page()
+            else:
+                resp = client.scroll(
+                    body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+                )
             scroll_id = resp.get("_scroll_id")
 
     finally:
+        if prefetcher is not None:
+            prefetcher.close()
+            # the prefetched pages might have moved the scroll on
+            scroll_id = prefetcher.scroll_id
         if scroll_id and clear_scroll:
             client.clear_scroll(
                 body={"scroll_id": [scroll_id]}, ignore=(404,), **transport_kwargs
             )
 
 
+def _import_ijson():
+    try:
+        import ijson
+    except ImportError:
+        raise ImproperlyConfigured("Please install ijson to stream hits.")
+    return ijson
+
+
+def _stream_hits_request(index, kwargs):
+    """
+    Path, query parameters and headers of the search request whose hits are
+    streamed, with every keyword argument taken as a query parameter.
+    """
+    params, headers = _get_params_and_headers(kwargs, tuple(kwargs))
+    return _make_path(index, "_search"), params, headers
+
+
+def stream_hits(client, query=None, index=None, **kwargs):
+    """
+    Run a :meth:`~opensearchpy.OpenSearch.search` and yield its hits as they
+    are read from the response, instead of once the whole response has been
+    received and deserialized. Memory use is then bounded by the largest hit
+    rather than by the size of the page. The rest of the response, e.g. the
+    aggregations, is skipped.
+
+    The hits are parsed with `ijson <https://github.com/ICRAR/ijson>`_,
+    which has to be installed. Numbers are returned as ``int`` and ``float``
+    like the default serializer does.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg index: index (or list of indices) to search
+
+    Any additional keyword arguments are passed as parameters of the search
+    request::
+
+        for hit in stream_hits(client,
+            query={"query": {"match": {"title": "python"}}},
+            index="orders-*",
+            size=10000,
+        ):
+            print(hit["_id"])
+
+    """
+    ijson = _import_ijson()
+    path, params, headers = _stream_hits_request(index, kwargs)
+    stream = client.transport.perform_stream_request(
+        "POST", path, params=params, headers=headers, body=query
+    )
+    try:
+        for hit in ijson.items(stream, "hits.hits.item", use_float=True):
+            yield hit
+    finally:
+        stream.close()
+
+
+def _pit_slice_body(query, pit_id, keep_alive, slice_id, slices, size, search_after):
+    """
+    Body of the search request for one page of a slice of a point in time.
+    """
+    body = query.copy() if query else {}
+    body["pit"] = {"id": pit_id, "keep_alive": keep_alive}
+    body["size"] = size
+    body.setdefault("sort", ["_doc"])
+    if slices > 1:
+        body["slice"] = {"id": slice_id, "max": slices}
+    if search_after is not None:
+        body["search_after"] = search_after
+    return body
+
+
+def _check_pit_shards(resp, pit_id, raise_on_error):
+    """
+    Log and, with ``raise_on_error``, raise when a page of a point in time
+    search didn't succeed on all shards.
+    """
+    # Default to 0 if the value isn't included in the response
+    shards_successful = resp["_shards"].get("successful", 0)
+    shards_skipped = resp["_shards"].get("skipped", 0)
+    shards_total = resp["_shards"].get("total", 0)
+
+    if (shards_successful + shards_skipped) < shards_total:
+        shards_message = (
+            "Search request has only succeeded on %d (+%d skipped) shards out of %d."
+        )
+        logger.warning(shards_message, shards_successful, shards_skipped, shards_total)
+        if raise_on_error:
+            raise ScanError(
+                pit_id,
+                shards_message % (shards_successful, shards_skipped, shards_total),
+            )
+
+
+def _scan_pit_slice(
+    client,
+    query,
+    pit_id,
+    keep_alive,
+    slice_id,
+    slices,
+    size,
+    raise_on_error,
+    request_timeout,
+    progress_callback,
+    **kwargs
+):
+    """
+    Page through one slice of a point in time with ``search_after``, yields
+    the hits of every page.
+    """
+    search_after = None
+    fetched = 0
+    while True:
+        resp = client.search(
+            body=_pit_slice_body(
+                query, pit_id, keep_alive, slice_id, slices, size, search_after
+            ),
+            request_timeout=request_timeout,
+            **kwargs
+        )
+        pit_id = resp.get("pit_id", pit_id)
+        hits = resp["hits"]["hits"]
+        _check_pit_shards(resp, pit_id, raise_on_error)
+
+        fetched += len(hits)
+        done = len(hits) < size
+        if progress_callback is not None:
+            progress_callback(slice_id, fetched, done)
+        if hits:
+            yield hits
+        if done:
+            return
+        search_after = hits[-1]["sort"]
+
+
+def parallel_scan(
+    client,
+    index,
+    query=None,
+    slices=None,
+    thread_count=4,
+    queue_size=4,
+    size=1000,
+    keep_alive="5m",
+    raise_on_error=True,
+    request_timeout=None,
+    progress_callback=None,
+    **kwargs
+):
+    """
+    Parallel counterpart of :func:`~opensearchpy.helpers.scan`. Opens a point
+    in time on ``index``, splits it into ``slices`` and pages through every
+    slice with ``search_after`` from a pool of threads. Hits of all slices are
+    yielded from a single iterator, in no particular order. The point in time
+    is deleted once the iterator is exhausted, closed or fails.
+
+    Unless ``query`` has a ``sort``, hits are sorted by ``_doc``. That only
+    pages correctly when every slice covers a single shard, which is the
+    case for the default ``slices`` on a single index. Otherwise sort on a
+    field that is unique per document.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg index: index (or comma-separated list of indices) to scan
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg slices: number of slices to split the point in time into, defaults
+        to the number of shards it covers
+    :arg thread_count: number of slices scanned at once
+    :arg queue_size: number of pages of hits fetched ahead of the consumer
+    :arg size: number of hits in each page of a slice
+    :arg keep_alive: how long the point in time should be kept between
+        requests
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg request_timeout: explicit timeout for each search request
+    :arg progress_callback: callable called with the slice id, the number of
+        hits fetched from that slice so far and whether the slice is done,
+        after every page. It is called from the scanning threads.
+
+    Any additional keyword arguments will be passed to every
+    :meth:`~opensearchpy.OpenSearch.search` call.
+    """
+    # Grab options that should be propagated to every
+    # API call within this helper instead of just 'search()'
+    transport_kwargs = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+
+    resp = client.create_pit(index=index, keep_alive=keep_alive, **transport_kwargs)
+    pit_id = resp["pit_id"]
+    if slices is None:
+        slices = resp.get("_shards", {}).get("total") or 1
+
+    slice_ids = Queue()
+    for slice_id in range(slices):
+        slice_ids.put(slice_id)
+    pages = Queue(queue_size)
+    stop = threading.Event()
+
+    def put(page):
+        # give up once the consumer went away
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            while not stop.is_set():
+                try:
+                    slice_id = slice_ids.get_nowait()
+                except Empty:
+                    break
+                for hits in _scan_pit_slice(
+                    client,
+                    query,
+                    pit_id,
+                    keep_alive,
+                    slice_id,
+                    slices,
+                    size,
+                    raise_on_error,
+                    request_timeout,
+                    progress_callback,
+                    **kwargs
+                ):
+                    if not put(hits):
+                        return
+        except Exception as e:
+            put(e)
+        finally:
+            put(None)
+
+    threads = [
+        threading.Thread(target=worker) for _ in range(min(thread_count, slices))
+    ]
+    try:
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        running = len(threads)
+        while running:
+            page = pages.get()
+            if page is None:
+                running -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                for hit in page:
+                    yield hit
+
+    finally:
+        stop.set()
+        for thread in threads:
+            if thread.is_alive():
+                thread.join()
+        client.delete_pit(body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs)
+
+
 def reindex(
     client,
     source_index,
@@ -53,8 +53,45 @@ from ..serializer import Serializer
 logger: logging.Logger
 
 def expand_action(data: Any) -> Tuple[Dict[str, Any], Optional[Any]]: ...
+
+class AdaptiveChunkSize(object):
+    min_chunk_size: int
+    max_chunk_size: int
+    min_chunk_bytes: int
+    max_chunk_bytes_limit: int
+    target_latency: float
+    increase_step: int
+    decrease_factor: float
+    chunk_size: int
+    max_chunk_bytes: int
+    def __init__(
+        self,
+        chunk_size: int = ...,
+        max_chunk_bytes: int = ...,
+        min_chunk_size: int = ...,
+        max_chunk_size: int = ...,
+        min_chunk_bytes: int = ...,
+        target_latency: float = ...,
+        increase_step: int = ...,
+        decrease_factor: float = ...,
+    ) -> None: ...
+    def observe_response(
+        self,
+        resp: Mapping[str, Any],
+        bulk_actions: List[bytes],
+        bulk_data: List[Any],
+        latency: float,
+    ) -> None: ...
+    def observe_error(
+        self, error: Exception, bulk_actions: List[bytes], bulk_data: List[Any]
+    ) -> None: ...
+
 def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Serializer
+    actions: Any,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    serializer: Serializer,
+    chunk_sizer: Optional[AdaptiveChunkSize] = ...,
 ) -> Generator[Any, None, None]: ...
 def _process_bulk_chunk(
     client: OpenSearch,
@@ -62,6 +99,8 @@ def _process_bulk_chunk(
     bulk_data: Any,
     raise_on_exception: bool = ...,
     raise_on_error: bool = ...,
+    ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    chunk_sizer: Optional[AdaptiveChunkSize] = ...,
     *args: Any,
     **kwargs: Any
 ) -> Generator[Tuple[bool, Any], None, None]: ...
@@ -78,6 +117,7 @@ def streaming_bulk(
     max_backoff: Union[float, int] = ...,
     yield_ok: bool = ...,
     ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    adaptive_chunking: Union[bool, AdaptiveChunkSize] = ...,
     *args: Any,
     **kwargs: Any
 ) -> Generator[Tuple[bool, Any], None, None]: ...
@@ -108,6 +148,9 @@ def parallel_bulk(
     queue_size: int = ...,
     expand_action_callback: Callable[[Any], Tuple[Dict[str, Any], Optional[Any]]] = ...,
     ignore_status: Optional[Union[int, Collection[int]]] = ...,
+    adaptive_chunking: Union[bool, AdaptiveChunkSize] = ...,
+    process_count: Optional[int] = ...,
+    process_pool: Optional[Any] = ...,
     *args: Any,
     **kwargs: Any
 ) -> Generator[Tuple[bool, Any], None, None]: ...
@@ -121,6 +164,27 @@ def scan(
     request_timeout: Optional[Union[float, int]] = ...,
     clear_scroll: bool = ...,
     scroll_kwargs: Optional[Mapping[str, Any]] = ...,
+    prefetch: int = ...,
+    **kwargs: Any
+) -> Generator[Any, None, None]: ...
+def stream_hits(
+    client: OpenSearch,
+    query: Optional[Any] = ...,
+    index: Optional[Union[str, Collection[str]]] = ...,
+    **kwargs: Any
+) -> Generator[Any, None, None]: ...
+def parallel_scan(
+    client: OpenSearch,
+    index: Union[str, Collection[str]],
+    query: Optional[Any] = ...,
+    slices: Optional[int] = ...,
+    thread_count: int = ...,
+    queue_size: int = ...,
+    size: int = ...,
+    keep_alive: str = ...,
+    raise_on_error: bool = ...,
+    request_timeout: Optional[Union[float, int]] = ...,
+    progress_callback: Optional[Callable[[int, int, bool], Any]] = ...,
     **kwargs: Any
 ) -> Generator[Any, None, None]: ...
 def reindex(
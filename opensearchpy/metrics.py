@@ -0,0 +1,338 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import math
+import threading
+from collections import defaultdict
+
+# APIs whose path continues with a document id
+_ID_APIS = frozenset(
+    ("_doc", "_create", "_update", "_source", "_explain", "_termvectors")
+)
+
+
+class TransportMetrics(object):
+    """
+    Instrumentation hooks of a :class:`~opensearchpy.Transport`, to be passed
+    to the transport as ``metrics``. The transport hands it on to its
+    connection pool and connections.
+
+    All the methods do nothing, subclass it and override those you're
+    interested in. They're called from the thread (or event loop) performing
+    the request, so they should return quickly and be thread-safe. Without
+    ``metrics`` the transport skips the hooks entirely.
+    """
+
+    def request_started(self, method, url):
+        """
+        Called when :meth:`~opensearchpy.Transport.perform_request` starts.
+
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        """
+
+    def request_finished(self, method, url, duration, status=None, error=None):
+        """
+        Called when :meth:`~opensearchpy.Transport.perform_request` returns or
+        raises, after all the retries.
+
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg duration: time in seconds the request took, including
+            serialization, retries and deserialization
+        :arg status: status code of the last response, if any
+        :arg error: exception raised, if any
+        """
+
+    def connection_request(
+        self,
+        connection,
+        method,
+        url,
+        duration,
+        status=None,
+        bytes_sent=0,
+        bytes_received=0,
+        error=None,
+    ):
+        """
+        Called by a :class:`~opensearchpy.Connection` for every request sent
+        to its node, including the retries.
+
+        :arg connection: the connection the request was sent over
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg duration: time in seconds the node took to respond
+        :arg status: status code of the response, if any
+        :arg bytes_sent: length of the request body, before compression
+        :arg bytes_received: length of the response body, ``None`` if it's
+            streamed to the caller
+        :arg error: exception raised by the HTTP library, if any
+        """
+
+    def retry(self, connection, method, url, attempt, error):
+        """
+        Called before a failed request is retried.
+
+        :arg connection: the connection the request failed on
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg attempt: number of the retry, starting at 1
+        :arg error: the error the request failed with
+        """
+
+    def cache_lookup(self, method, url, hit):
+        """
+        Called when a request is looked up in the transport's
+        :class:`~opensearchpy.ResponseCache`.
+
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg hit: whether the response was found in the cache
+        """
+
+    def serialized(self, duration):
+        """
+        Called once a request body has been serialized.
+
+        :arg duration: time in seconds the serializer took
+        """
+
+    def deserialized(self, duration):
+        """
+        Called once a response body has been deserialized.
+
+        :arg duration: time in seconds the deserializer took
+        """
+
+    def connection_marked_dead(self, connection):
+        """
+        Called when the connection pool marks a connection as dead.
+
+        :arg connection: the failed connection
+        """
+
+    def connection_resurrected(self, connection):
+        """
+        Called when the connection pool returns a dead connection to the live
+        connections.
+
+        :arg connection: the resurrected connection
+        """
+
+    def pool_size(self, live, dead):
+        """
+        Called when the number of live and dead connections in the connection
+        pool changes.
+
+        :arg live: number of live connections
+        :arg dead: number of dead connections
+        """
+
+
+class Histogram(object):
+    """
+    Histogram of durations with logarithmic buckets, each ``growth`` times
+    wider than the previous one. Its size doesn't depend on the number of
+    values recorded and percentiles are accurate to within ``growth``.
+
+    :arg min_value: upper bound of the first bucket
+    :arg growth: ratio between the bounds of consecutive buckets
+    """
+
+    def __init__(self, min_value=1e-4, growth=1.1):
+        self.min_value = min_value
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = int(math.log(value / self.min_value) / self._log_growth) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """
+        Upper bound of the bucket holding the ``percent`` percentile, ``None``
+        if no value has been recorded.
+        """
+        if not self.count:
+            return None
+        rank = max(1, percent / 100.0 * self.count)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.max, self.min_value * self.growth**index)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class HistogramCollector(TransportMetrics):
+    """
+    :class:`~opensearchpy.TransportMetrics` keeping histograms of the
+    request durations per endpoint and per node in memory, along with
+    counters of requests, retries, cache hits, bytes and connection pool
+    changes.
+    :meth:`export` returns them with the p50 and p99 durations.
+
+    Endpoints are the method and the path of the request with the index and
+    document id replaced, e.g. ``GET /{index}/_doc/{id}``. Override
+    :meth:`endpoint` to group requests differently.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Clear all the collected metrics, except for the number of requests in
+        flight.
+        """
+        with self._lock:
+            self.endpoints = defaultdict(Histogram)
+            self.nodes = defaultdict(Histogram)
+            self.serialization = Histogram()
+            self.deserialization = Histogram()
+            self.requests = 0
+            self.errors = 0
+            self.retries = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.marked_dead = 0
+            self.resurrected = 0
+            self.live_connections = None
+            self.dead_connections = None
+
+    def endpoint(self, method, url):
+        """
+        Name of the endpoint a request is recorded under.
+        """
+        parts = url.split("?", 1)[0].split("/")
+        for i, part in enumerate(parts):
+            if not part:
+                continue
+            if i == 1 and not part.startswith("_"):
+                parts[i] = "{index}"
+            elif parts[i - 1] in _ID_APIS:
+                parts[i] = "{id}"
+        return "%s %s" % (method, "/".join(parts))
+
+    def request_started(self, method, url):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, method, url, duration, status=None, error=None):
+        endpoint = self.endpoint(method, url)
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            if error is not None:
+                self.errors += 1
+            self.endpoints[endpoint].record(duration)
+
+    def connection_request(
+        self,
+        connection,
+        method,
+        url,
+        duration,
+        status=None,
+        bytes_sent=0,
+        bytes_received=0,
+        error=None,
+    ):
+        with self._lock:
+            self.nodes[connection.host].record(duration)
+            self.bytes_sent += bytes_sent
+            if bytes_received is not None:
+                self.bytes_received += bytes_received
+
+    def retry(self, connection, method, url, attempt, error):
+        with self._lock:
+            self.retries += 1
+
+    def cache_lookup(self, method, url, hit):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def serialized(self, duration):
+        with self._lock:
+            self.serialization.record(duration)
+
+    def deserialized(self, duration):
+        with self._lock:
+            self.deserialization.record(duration)
+
+    def connection_marked_dead(self, connection):
+        with self._lock:
+            self.marked_dead += 1
+
+    def connection_resurrected(self, connection):
+        with self._lock:
+            self.resurrected += 1
+
+    def pool_size(self, live, dead):
+        with self._lock:
+            self.live_connections = live
+            self.dead_connections = dead
+
+    def export(self):
+        """
+        Return the collected metrics as a dictionary. Durations are in
+        seconds, ``endpoints`` and ``nodes`` map each endpoint and node to the
+        count, p50, p99 and max of its request durations.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "retries": self.retries,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "marked_dead": self.marked_dead,
+                "resurrected": self.resurrected,
+                "live_connections": self.live_connections,
+                "dead_connections": self.dead_connections,
+                "serialization": self.serialization.summary(),
+                "deserialization": self.deserialization.summary(),
+                "endpoints": {
+                    endpoint: histogram.summary()
+                    for endpoint, histogram in self.endpoints.items()
+                },
+                "nodes": {
+                    node: histogram.summary() for node, histogram in self.nodes.items()
+                },
+            }
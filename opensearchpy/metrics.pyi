@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any, Dict, Optional
+
+from .connection import Connection
+
+class TransportMetrics(object):
+    def request_started(self, method: str, url: str) -> None: ...
+    def request_finished(
+        self,
+        method: str,
+        url: str,
+        duration: float,
+        status: Optional[int] = ...,
+        error: Optional[Exception] = ...,
+    ) -> None: ...
+    def connection_request(
+        self,
+        connection: Connection,
+        method: str,
+        url: str,
+        duration: float,
+        status: Optional[int] = ...,
+        bytes_sent: int = ...,
+        bytes_received: Optional[int] = ...,
+        error: Optional[Exception] = ...,
+    ) -> None: ...
+    def retry(
+        self,
+        connection: Connection,
+        method: str,
+        url: str,
+        attempt: int,
+        error: Exception,
+    ) -> None: ...
+    def cache_lookup(self, method: str, url: str, hit: bool) -> None: ...
+    def serialized(self, duration: float) -> None: ...
+    def deserialized(self, duration: float) -> None: ...
+    def connection_marked_dead(self, connection: Connection) -> None: ...
+    def connection_resurrected(self, connection: Connection) -> None: ...
+    def pool_size(self, live: int, dead: int) -> None: ...
+
+class Histogram(object):
+    min_value: float
+    growth: float
+    buckets: Dict[int, int]
+    count: int
+    total: float
+    max: float
+    def __init__(self, min_value: float = ..., growth: float = ...) -> None: ...
+    def record(self, value: float) -> None: ...
+    def percentile(self, percent: float) -> Optional[float]: ...
+    def summary(self) -> Dict[str, Any]: ...
+
+class HistogramCollector(TransportMetrics):
+    endpoints: Dict[str, Histogram]
+    nodes: Dict[str, Histogram]
+    serialization: Histogram
+    deserialization: Histogram
+    in_flight: int
+    requests: int
+    errors: int
+    retries: int
+    cache_hits: int
+    cache_misses: int
+    bytes_sent: int
+    bytes_received: int
+    marked_dead: int
+    resurrected: int
+    live_connections: Optional[int]
+    dead_connections: Optional[int]
+    def __init__(self) -> None: ...
+    def reset(self) -> None: ...
+    def endpoint(self, method: str, url: str) -> str: ...
+    def export(self) -> Dict[str, Any]: ...
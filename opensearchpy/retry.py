@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+
+
+class RetryBudget(object):
+    """
+    Token bucket limiting the retries of a :class:`~opensearchpy.Transport`
+    to a fraction of its successful requests, to be passed to the transport
+    as ``retry_budget``.
+
+    Every successful request adds ``ratio`` tokens to the bucket, up to
+    ``max_tokens``, and every retry takes one. Once the bucket is empty
+    failed requests aren't retried, so clients don't multiply the load on a
+    cluster that is failing most requests. The bucket starts full.
+
+    :arg ratio: number of retries allowed per successful request
+    :arg max_tokens: maximum number of retries the budget can be saved up for
+
+    .. attribute:: retries
+
+        number of retries taken
+
+    .. attribute:: suppressed
+
+        number of retries not taken because the budget was exhausted
+    """
+
+    def __init__(self, ratio=0.1, max_tokens=10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.retries = 0
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def record_success(self):
+        """
+        Record a successful request, adding to the budget.
+        """
+        with self._lock:
+            self.tokens = min(self.tokens + self.ratio, self.max_tokens)
+
+    def acquire(self):
+        """
+        Take a retry from the budget, returns ``False`` if it's exhausted.
+        """
+        with self._lock:
+            if self.tokens < 1:
+                self.suppressed += 1
+                return False
+            self.tokens -= 1
+            self.retries += 1
+            return True
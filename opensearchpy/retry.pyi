@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+class RetryBudget(object):
+    ratio: float
+    max_tokens: float
+    tokens: float
+    retries: int
+    suppressed: int
+    def __init__(self, ratio: float = ..., max_tokens: float = ...) -> None: ...
+    def record_success(self) -> None: ...
+    def acquire(self) -> bool: ...
@@ -30,6 +30,13 @@ try:
 except ImportError:
     import json
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 import uuid
 from datetime import date, datetime
 from decimal import Decimal
@@ -45,6 +52,8 @@ TIME_TYPES = (date, datetime)
 
 class Serializer(object):
     mimetype = ""
+    # whether loads() can parse raw ``bytes`` without them being decoded first
+    accepts_bytes = False
 
     def loads(self, s):
         raise NotImplementedError()
@@ -160,6 +169,45 @@ class JSONSerializer(Serializer):
             raise SerializationError(data, e)
 
 
+class OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer backed by `orjson <https://github.com/ijl/orjson>`_.
+
+    Unlike :class:`JSONSerializer` it emits UTF-8 encoded ``bytes`` which the
+    transport sends as-is instead of encoding the serialized ``str`` again.
+    Together with ``decode_response=False`` on the connections it also
+    parses the raw response ``bytes`` directly. Values orjson can't handle
+    natively (``Decimal``, pandas types, ...) still go through
+    :meth:`JSONSerializer.default`. Note that ``NaN`` and ``Infinity`` are
+    serialized as ``null``.
+    """
+
+    accepts_bytes = True
+
+    def __init__(self):
+        if not ORJSON_AVAILABLE:
+            raise ImproperlyConfigured("Please install orjson to use OrjsonSerializer.")
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data):
+        # don't serialize strings, only make sure they are bytes
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, string_types):
+            return data.encode("utf-8", "surrogatepass")
+
+        try:
+            return orjson.dumps(data, default=self.default, option=self._options)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e)
+
+
 DEFAULT_SERIALIZERS = {
     JSONSerializer.mimetype: JSONSerializer(),
     TextSerializer.mimetype: TextSerializer(),
@@ -194,6 +242,9 @@ class Deserializer(object):
                     "Unknown mimetype, unable to deserialize: %s" % mimetype
                 )
 
+        # connections created with decode_response=False return raw bytes
+        if isinstance(s, bytes) and not getattr(deserializer, "accepts_bytes", False):
+            s = s.decode("utf-8", "surrogatepass")
         return deserializer.loads(s)
 
 
@@ -206,4 +257,8 @@ class AttrJSONSerializer(JSONSerializer):
         return super(AttrJSONSerializer, self).default(data)
 
 
+class AttrOrjsonSerializer(AttrJSONSerializer, OrjsonSerializer):
+    """:class:`AttrJSONSerializer` producing ``bytes`` through orjson."""
+
+
 serializer = AttrJSONSerializer()
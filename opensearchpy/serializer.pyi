@@ -24,10 +24,13 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
+
+ORJSON_AVAILABLE: bool
 
 class Serializer(object):
     mimetype: str
+    accepts_bytes: bool
     def loads(self, s: str) -> Any: ...
     def dumps(self, data: Any) -> str: ...
 
@@ -42,6 +45,11 @@ class JSONSerializer(Serializer):
     def loads(self, s: str) -> Any: ...
     def dumps(self, data: Any) -> str: ...
 
+class OrjsonSerializer(JSONSerializer):
+    def __init__(self) -> None: ...
+    def loads(self, s: Union[str, bytes]) -> Any: ...
+    def dumps(self, data: Any) -> bytes: ...  # type: ignore
+
 DEFAULT_SERIALIZERS: Dict[str, Serializer]
 
 class Deserializer(object):
@@ -50,6 +58,7 @@ class Deserializer(object):
         serializers: Dict[str, Serializer],
         default_mimetype: str = ...,
     ) -> None: ...
-    def loads(self, s: str, mimetype: Optional[str] = ...) -> Any: ...
+    def loads(self, s: Union[str, bytes], mimetype: Optional[str] = ...) -> Any: ...
 
 class AttrJSONSerializer(JSONSerializer): ...
+class AttrOrjsonSerializer(AttrJSONSerializer, OrjsonSerializer): ...
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import re
+
+from ._version import __versionstr__
+from .exceptions import ImproperlyConfigured
+
+_CAMEL_CASE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _api_name(func):
+    # IndicesClient.create -> indices.create, OpenSearch.search -> search
+    owner, _, name = getattr(func, "__qualname__", func.__name__).rpartition(".")
+    if owner.endswith("Client"):
+        namespace = _CAMEL_CASE_RE.sub("_", owner[: -len("Client")]).lower()
+        return "%s.%s" % (namespace, name)
+    return name
+
+
+def _index_position(func):
+    # position of the ``index`` argument, to find it without inspect
+    code = func.__code__
+    try:
+        return code.co_varnames[: code.co_argcount].index("index")
+    except ValueError:
+        return None
+
+
+def _get_tracing(client):
+    # the client of an API method, or None if it doesn't trace its requests
+    return getattr(getattr(client, "transport", None), "tracing", None)
+
+
+class Tracing(object):
+    """
+    Creates `OpenTelemetry <https://opentelemetry.io/>`_ spans for the
+    requests of a :class:`~opensearchpy.Transport`, to be passed to the
+    transport as ``tracing``. Requires the ``opentelemetry-api`` package,
+    which is only imported once an instance is created.
+
+    Each API method called on the client gets a span named after it, e.g.
+    ``search`` or ``indices.create``, with the index as an attribute. Its
+    child spans show where the client spent its time: ``serialize`` and
+    ``deserialize`` for the bodies, ``queue`` for waiting on the
+    concurrency limiter and one span per attempt to send the request to a
+    node, named after the HTTP method, with the node, status code and retry
+    number as attributes. The trace context of the attempt is sent to the
+    node in the request headers.
+
+    :arg tracer: OpenTelemetry tracer creating the spans, defaults to one
+        from the global tracer provider
+    :arg propagate: send the trace context in the request headers
+    """
+
+    def __init__(self, tracer=None, propagate=True):
+        try:
+            from opentelemetry import propagate as otel_propagate
+            from opentelemetry import trace
+        except ImportError:
+            raise ImproperlyConfigured(
+                "Please install opentelemetry-api to use Tracing."
+            )
+
+        if tracer is None:
+            tracer = trace.get_tracer("opensearchpy", __versionstr__)
+        self.tracer = tracer
+        self.propagate = propagate
+        self._inject = otel_propagate.inject
+        self._client_kind = trace.SpanKind.CLIENT
+
+    def span(self, name, attributes=None):
+        """
+        Context manager for an internal span of the client, e.g. the
+        serialization of a body.
+        """
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+    def api_span(self, name, index=None):
+        """
+        Context manager for the span of an API method call.
+
+        :arg name: name of the API, e.g. ``indices.create``
+        :arg index: index (or list of indices) the API is called on, if any
+        """
+        attributes = {"db.system": "opensearch", "db.operation": name}
+        if index is not None:
+            if isinstance(index, (list, tuple)):
+                index = ",".join(index)
+            attributes["db.opensearch.index"] = str(index)
+        return self.tracer.start_as_current_span(
+            name, kind=self._client_kind, attributes=attributes
+        )
+
+    def attempt_span(self, connection, method, url, attempt):
+        """
+        Context manager for the span of an attempt to send a request.
+
+        :arg connection: connection the request is sent over
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg attempt: number of the attempt, starting at 0
+        """
+        attributes = {
+            "http.request.method": method,
+            "url.path": url.split("?", 1)[0],
+            "server.address": connection.hostname,
+        }
+        if connection.port is not None:
+            attributes["server.port"] = connection.port
+        if attempt:
+            attributes["http.request.resend_count"] = attempt
+        return self.tracer.start_as_current_span(
+            method, kind=self._client_kind, attributes=attributes
+        )
+
+    def inject(self, headers):
+        """
+        Add the headers propagating the current trace context, e.g.
+        ``traceparent``, to ``headers``.
+        """
+        if self.propagate:
+            self._inject(headers)
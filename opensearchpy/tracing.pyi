@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any, Callable, ContextManager, Dict, MutableMapping, Optional
+
+from .connection import Connection
+
+def _api_name(func: Callable[..., Any]) -> str: ...
+def _index_position(func: Callable[..., Any]) -> Optional[int]: ...
+def _get_tracing(client: Any) -> Optional[Tracing]: ...
+
+class Tracing(object):
+    tracer: Any
+    propagate: bool
+    def __init__(self, tracer: Any = ..., propagate: bool = ...) -> None: ...
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = ...
+    ) -> ContextManager[Any]: ...
+    def api_span(self, name: str, index: Any = ...) -> ContextManager[Any]: ...
+    def attempt_span(
+        self, connection: Connection, method: str, url: str, attempt: int
+    ) -> ContextManager[Any]: ...
+    def inject(self, headers: MutableMapping[str, str]) -> None: ...
@@ -25,10 +25,19 @@
 #  under the License.
 
 
+import logging
+import random
+import threading
 import time
+import weakref
 from itertools import chain
 
+from .cache import ResponseCache
+from .client.utils import _bulk_body
+from .compat import Empty, Queue
+from .concurrency import ConcurrencyLimiter
 from .connection import Urllib3HttpConnection
+from .connection.base import _is_streamed
 from .connection_pool import ConnectionPool, DummyConnectionPool, EmptyConnectionPool
 from .exceptions import (
     ConnectionError,
@@ -36,7 +45,15 @@ from .exceptions import (
     SerializationError,
     TransportError,
 )
+from .hedging import RequestHedging, _Workers
+from .retry import RetryBudget
 from .serializer import DEFAULT_SERIALIZERS, Deserializer, JSONSerializer
+from .tracing import Tracing
+
+logger = logging.getLogger("opensearch")
+
+# maximum number of sniffing requests sent at once by background sniffs
+_SNIFF_WORKERS = 8
 
 
 def get_host_info(node_info, host):
@@ -59,12 +76,42 @@ def get_host_info(node_info, host):
     return host
 
 
+# node information kept in the hosts for the selector, not connection params
+_NODE_INFO_KEYS = ("roles", "attributes")
+
+
+def _connection_params(host):
+    return {k: v for k, v in host.items() if k not in _NODE_INFO_KEYS}
+
+
+def _health_check_loop(transport_ref, stop, interval):
+    # only hold a weak reference between runs so an abandoned transport can
+    # still be garbage collected
+    while not stop.wait(interval):
+        transport = transport_ref()
+        if transport is None:
+            return
+        try:
+            transport.check_dead_connections()
+        except Exception:
+            logger.warning("Health check of dead connections failed.", exc_info=True)
+        del transport
+
+
 class Transport(object):
     """
     Encapsulation of transport-related to logic. Handles instantiation of the
     individual connections as well as creating a connection pool to hold them.
 
     Main interface is the `perform_request` method.
+
+    .. attribute:: retries
+
+        number of retries taken
+
+    .. attribute:: suppressed_retries
+
+        number of retries not taken because the ``retry_budget`` was exhausted
     """
 
     DEFAULT_CONNECTION_CLASS = Urllib3HttpConnection
@@ -79,6 +126,7 @@ class Transport(object):
         sniffer_timeout=None,
         sniff_timeout=0.1,
         sniff_on_connection_fail=False,
+        sniff_in_background=False,
         serializer=JSONSerializer(),
         serializers=None,
         default_mimetype="application/json",
@@ -86,7 +134,17 @@ class Transport(object):
         pool_maxsize=None,
         retry_on_status=(502, 503, 504),
         retry_on_timeout=False,
+        retry_backoff=0,
+        retry_backoff_max=10,
+        retry_budget=None,
         send_get_body_as="GET",
+        hedging=None,
+        concurrency_limiter=None,
+        metrics=None,
+        tracing=None,
+        response_cache=None,
+        health_check_interval=None,
+        health_check_timeout=1,
         **kwargs
     ):
         """
@@ -106,6 +164,10 @@ class Transport(object):
             to fail quickly. Not used during initial sniffing (if
             ``sniff_on_start`` is on) when the connection still isn't
             initialized.
+        :arg sniff_in_background: flag indicating whether sniffing triggered
+            by ``sniffer_timeout`` or ``sniff_on_connection_fail`` runs in a
+            background thread, querying all nodes in parallel, instead of in
+            the thread making the request
         :arg serializer: serializer instance
         :arg serializers: optional dict of serializer instances that will be
             used for deserializing data coming from the server. (key is the mimetype)
@@ -116,17 +178,48 @@ class Transport(object):
             on a different node. defaults to ``(502, 503, 504)``
         :arg retry_on_timeout: should timeout trigger a retry on different
             node? (default `False`)
+        :arg retry_backoff: number of seconds to wait before the first retry,
+            doubled on every following retry up to ``retry_backoff_max``. The
+            actual wait is random between 0 and that value. (default `0`, no
+            waiting)
+        :arg retry_backoff_max: maximum number of seconds to wait before a
+            retry
+        :arg retry_budget: :class:`~opensearchpy.RetryBudget` instance, or
+            ``True`` for the defaults, limiting the retries to a fraction of
+            the successful requests
         :arg send_get_body_as: for GET requests with body this option allows
             you to specify an alternate way of execution for environments that
             don't support passing bodies with GET requests. If you set this to
             'POST' a POST method will be used instead, if to 'source' then the body
             will be serialized and passed as a query parameter `source`.
+        :arg hedging: :class:`~opensearchpy.RequestHedging` instance, or
+            ``True`` for the defaults, to send a duplicate of slow read
+            requests to another node and use the first response
+        :arg concurrency_limiter: :class:`~opensearchpy.ConcurrencyLimiter`
+            instance, or ``True`` for the defaults, adapting the number of
+            requests in flight to the latency of the cluster
+        :arg metrics: :class:`~opensearchpy.TransportMetrics` instance
+            notified of the requests, retries and connection pool changes,
+            e.g. a :class:`~opensearchpy.HistogramCollector`
+        :arg tracing: :class:`~opensearchpy.Tracing` instance, or ``True``
+            for the defaults, creating OpenTelemetry spans for the API calls
+            and the requests
+        :arg response_cache: :class:`~opensearchpy.ResponseCache` instance,
+            or ``True`` for the defaults, caching the responses to read
+            requests for a few seconds
         :arg pool_maxsize: Maximum connection pool size used by pool-manager
             For custom connection-pooling on current session
+        :arg health_check_interval: number of seconds between health checks of
+            dead connections from a background thread. When set, a dead
+            connection only returns to the pool after responding to a health
+            check once its timeout is over.
+        :arg health_check_timeout: timeout used for the health check request
 
         Any extra keyword arguments will be passed to the `connection_class`
         when creating and instance unless overridden by that connection's
-        options provided as part of the hosts parameter.
+        options provided as part of the hosts parameter. They're also passed
+        to the `connection_pool_class`, e.g. ``circuit_breaker`` to give the
+        pool a :class:`~opensearchpy.CircuitBreaker`.
         """
         if connection_class is None:
             connection_class = self.DEFAULT_CONNECTION_CLASS
@@ -145,7 +238,23 @@ class Transport(object):
         self.pool_maxsize = pool_maxsize
         self.retry_on_timeout = retry_on_timeout
         self.retry_on_status = retry_on_status
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retry_budget = RetryBudget() if retry_budget is True else retry_budget
+        self.retries = self.suppressed_retries = 0
+        self._retry_lock = threading.Lock()
         self.send_get_body_as = send_get_body_as
+        self.hedging = RequestHedging() if hedging is True else hedging
+        # threads sending the attempts of hedged requests
+        self._hedging_workers = _Workers() if self.hedging is not None else None
+        self.concurrency_limiter = (
+            ConcurrencyLimiter() if concurrency_limiter is True else concurrency_limiter
+        )
+        self.metrics = metrics
+        self.tracing = Tracing() if tracing is True else tracing
+        self.response_cache = (
+            ResponseCache() if response_cache is True else response_cache
+        )
 
         # data serializer
         self.serializer = serializer
@@ -158,6 +267,11 @@ class Transport(object):
         self.kwargs = kwargs
         self.hosts = hosts
 
+        # health check config, needed before the connection pool is created
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._health_check_stop = None
+
         # Start with an empty pool specifically for `AsyncTransport`.
         # It should never be used, will be replaced on first call to
         # .set_connections()
@@ -175,6 +289,13 @@ class Transport(object):
         self.sniffer_timeout = sniffer_timeout
         self.sniff_on_start = sniff_on_start
         self.sniff_on_connection_fail = sniff_on_connection_fail
+        self.sniff_in_background = sniff_in_background
+        self.sniffing_thread = None
+        # threads sending the sniffing requests of background sniffs
+        self._sniff_workers = (
+            _Workers(max_workers=_SNIFF_WORKERS) if sniff_in_background else None
+        )
+        self._sniff_lock = threading.Lock()
         self.last_sniff = time.time()
         self.sniff_timeout = sniff_timeout
 
@@ -184,6 +305,9 @@ class Transport(object):
         if sniff_on_start:
             self.sniff_hosts(True)
 
+        if health_check_interval:
+            self._start_health_checks()
+
     def add_connection(self, host):
         """
         Create a new :class:`~opensearchpy.Connection` instance and add it to the pool.
@@ -207,16 +331,19 @@ class Transport(object):
             # if this is not the initial setup look at the existing connection
             # options and identify connections that haven't changed and can be
             # kept around.
+            params = _connection_params(host)
             if hasattr(self, "connection_pool"):
                 for connection, old_host in self.connection_pool.connection_opts:
-                    if old_host == host:
+                    if _connection_params(old_host) == params:
                         return connection
 
             # previously unseen params, create new connection
             kwargs = self.kwargs.copy()
-            kwargs.update(host)
+            kwargs.update(params)
             if self.pool_maxsize and isinstance(self.pool_maxsize, int):
                 kwargs["pool_maxsize"] = self.pool_maxsize
+            if self.metrics is not None:
+                kwargs["metrics"] = self.metrics
             return self.connection_class(**kwargs)
 
         connections = map(_create_connection, hosts)
@@ -226,9 +353,12 @@ class Transport(object):
             self.connection_pool = DummyConnectionPool(connections)
         else:
             # pass the hosts dicts to the connection pool to optionally extract parameters from
-            self.connection_pool = self.connection_pool_class(
-                connections, **self.kwargs
-            )
+            kwargs = self.kwargs
+            if self.health_check_interval:
+                kwargs = dict(kwargs, health_check=True)
+            if self.metrics is not None:
+                kwargs = dict(kwargs, metrics=self.metrics)
+            self.connection_pool = self.connection_pool_class(connections, **kwargs)
 
     def get_connection(self):
         """
@@ -237,7 +367,10 @@ class Transport(object):
         """
         if self.sniffer_timeout:
             if time.time() >= self.last_sniff + self.sniffer_timeout:
-                self.sniff_hosts()
+                if self.sniff_in_background:
+                    self.create_sniff_thread()
+                else:
+                    self.sniff_hosts()
         return self.connection_pool.get_connection()
 
     def _get_sniff_data(self, initial=False):
@@ -252,6 +385,9 @@ class Transport(object):
         custom Transport class to serve data from alternative source like
         configuration management.
         """
+        if self.sniff_in_background:
+            return self._get_sniff_data_in_parallel(initial)
+
         previous_sniff = self.last_sniff
 
         try:
@@ -288,6 +424,47 @@ class Transport(object):
 
         return list(node_info["nodes"].values())
 
+    def _collect_sniff_data(self, connection, timeout, results):
+        try:
+            _, headers, node_info = connection.perform_request(
+                "GET", "/_nodes/_all/http", timeout=timeout
+            )
+            headers = {header.lower(): value for header, value in headers.items()}
+            node_info = self.deserializer.loads(node_info, headers.get("content-type"))
+        except Exception:
+            node_info = None
+        results.put(node_info)
+
+    def _get_sniff_data_in_parallel(self, initial=False):
+        """
+        Same as `_get_sniff_data` but sends the request to all the nodes at
+        once, from up to eight threads reused across sniffs, and uses the
+        first valid response.
+        """
+        previous_sniff = self.last_sniff
+        # reset last_sniff timestamp
+        self.last_sniff = time.time()
+        # use small timeout for the sniffing request, should be a fast api call
+        timeout = self.sniff_timeout if not initial else None
+
+        # go through all current connections as well as the
+        # seed_connections for good measure, without duplicates
+        connections = list(self.connection_pool.connections)
+        connections.extend(c for c in self.seed_connections if c not in connections)
+
+        results = Queue()
+        for c in connections:
+            self._sniff_workers.submit(self._collect_sniff_data, c, timeout, results)
+
+        for _ in connections:
+            node_info = results.get()
+            if node_info is not None:
+                return list(node_info["nodes"].values())
+
+        # keep the previous value on error
+        self.last_sniff = previous_sniff
+        raise TransportError("N/A", "Unable to sniff hosts.")
+
     def _get_host_info(self, host_info):
         host = {}
         address = host_info.get("http", {}).get("publish_address")
@@ -307,6 +484,11 @@ class Transport(object):
             host["host"], host["port"] = address.rsplit(":", 1)
             host["port"] = int(host["port"])
 
+        # keep the node's roles and attributes (e.g. zone) for the selector
+        for key in _NODE_INFO_KEYS:
+            if key in host_info:
+                host[key] = host_info[key]
+
         return self.host_info_callback(host_info, host)
 
     def sniff_hosts(self, initial=False):
@@ -332,6 +514,70 @@ class Transport(object):
 
         self.set_connections(hosts)
 
+    def _sniff_hosts_in_background(self):
+        try:
+            self.sniff_hosts()
+        except Exception:
+            logger.warning("Sniffing hosts in the background failed.", exc_info=True)
+
+    def create_sniff_thread(self):
+        """
+        Initiate sniffing in a background thread, unless it's already running.
+        Requests keep using the current connection pool until sniffing
+        completes and replaces it.
+        """
+        with self._sniff_lock:
+            if self.sniffing_thread is not None and self.sniffing_thread.is_alive():
+                return
+            self.sniffing_thread = threading.Thread(
+                target=self._sniff_hosts_in_background, name="opensearch-sniffer"
+            )
+            self.sniffing_thread.daemon = True
+            self.sniffing_thread.start()
+
+    def _start_health_checks(self):
+        self._health_check_stop = threading.Event()
+        thread = threading.Thread(
+            target=_health_check_loop,
+            args=(
+                weakref.ref(self),
+                self._health_check_stop,
+                self.health_check_interval,
+            ),
+            name="opensearch-health-check",
+        )
+        thread.daemon = True
+        thread.start()
+
+    def check_health(self, connection):
+        """
+        Probe a dead connection with a ``HEAD /`` request. Returns ``True`` if
+        the node responded successfully.
+
+        Override this method to use a different request, e.g.
+        ``GET /_cluster/health?local=true``.
+
+        :arg connection: instance of :class:`~opensearchpy.Connection` to probe
+        """
+        try:
+            connection.perform_request("HEAD", "/", timeout=self.health_check_timeout)
+        except TransportError:
+            return False
+        return True
+
+    def check_dead_connections(self):
+        """
+        Health check all the dead connections whose timeout is over. Those
+        that pass return to the connection pool, the others are put on a
+        longer timeout.
+        """
+        connection_pool = self.connection_pool
+        for connection in connection_pool.get_dead_connections():
+            if self.check_health(connection):
+                connection_pool.health_check_passed(connection)
+            else:
+                connection_pool.health_check_failed(connection)
+
     def mark_dead(self, connection):
         """
         Mark a connection as dead (failed) in the connection pool. If sniffing
@@ -342,7 +588,10 @@ class Transport(object):
         # mark as dead even when sniffing to avoid hitting this host during the sniff process
         self.connection_pool.mark_dead(connection)
         if self.sniff_on_connection_fail:
-            self.sniff_hosts()
+            if self.sniff_in_background:
+                self.create_sniff_thread()
+            else:
+                self.sniff_hosts()
 
     def perform_request(self, method, url, headers=None, params=None, body=None):
         """
@@ -363,80 +612,524 @@ class Transport(object):
         :arg params: dictionary of query parameters, will be handed over to the
             underlying :class:`~opensearchpy.Connection` class for serialization
         :arg body: body of the request, will be serialized using serializer and
-            passed to the connection
+            passed to the connection. An iterator of ``bytes`` chunks is instead
+            streamed to the node with chunked transfer encoding, and so not
+            retried.
         """
-        method, params, body, ignore, timeout = self._resolve_request_args(
-            method, params, body
-        )
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.request_started(method, url)
+            start = time.time()
+        status = error = None
+        cache = self.response_cache
+        # key to release once this request, which missed the cache, completes,
+        # and the raw response to share with the identical requests waiting
+        claimed = shared = None
+
+        try:
+            # a streamed body is consumed by the first attempt
+            streamed = _is_streamed(body)
+            max_retries = 0 if streamed else self.max_retries
+            hedge = (
+                not streamed
+                and self.hedging is not None
+                and self.hedging.is_hedgeable(method, url, params)
+            )
+            ignore_cache = params.pop("ignore_cache", False) if params else False
+            cached = (
+                not streamed
+                and cache is not None
+                and cache.is_cacheable(method, url, params)
+            )
+            method, params, body, ignore, timeout = self._resolve_request_args(
+                method, params, body
+            )
+
+            if cached:
+                cache_key = cache.key(
+                    method, url, params, headers, body, ignore, timeout
+                )
+                if not ignore_cache:
+                    response, claim = cache.get(cache_key)
+                    if metrics is not None:
+                        metrics.cache_lookup(method, url, response is not None)
+                    if response is not None:
+                        status, headers_response, data = response
+                        return self._cached_response(
+                            method, status, headers_response, data
+                        )
+                    if claim:
+                        claimed = cache_key
+
+            for attempt in range(max_retries + 1):
+                connection = self._acquire_connection(timeout)
+
+                try:
+                    if self.tracing is None:
+                        connection, response = self._send(
+                            hedge,
+                            connection,
+                            method,
+                            url,
+                            params,
+                            body,
+                            headers=headers,
+                            ignore=ignore,
+                            timeout=timeout,
+                        )
+                    else:
+                        connection, response = self._send_traced(
+                            attempt,
+                            hedge,
+                            connection,
+                            method,
+                            url,
+                            params,
+                            body,
+                            headers=headers,
+                            ignore=ignore,
+                            timeout=timeout,
+                        )
+                    status, headers_response, data = response
+
+                    # Lowercase all the header names for consistency in accessing them.
+                    headers_response = {
+                        header.lower(): value
+                        for header, value in headers_response.items()
+                    }
+
+                except TransportError as e:
+                    if isinstance(e.status_code, int):
+                        status = e.status_code
+                    if method == "HEAD" and e.status_code == 404:
+                        shared = (404, {}, None)
+                        return False
+
+                    delay = self._prepare_retry(
+                        e, connection, method, url, attempt, max_retries
+                    )
+                    if delay:
+                        time.sleep(delay)
+
+                else:
+                    # connection didn't fail, confirm its live status
+                    self.connection_pool.mark_live(connection)
+                    if self.retry_budget is not None:
+                        self.retry_budget.record_success()
+                    shared = (status, headers_response, data)
+                    if cached and 200 <= status < 300:
+                        cache.set(
+                            cache_key,
+                            (status, headers_response, data),
+                            len(data) if data else 0,
+                        )
+
+                    if method == "HEAD":
+                        return 200 <= status < 300
+
+                    if data:
+                        data = self._loads(data, headers_response.get("content-type"))
+                    return data
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if claimed is not None:
+                cache.release(
+                    claimed,
+                    shared,
+                    error if isinstance(error, TransportError) else None,
+                )
+            if metrics is not None:
+                metrics.request_finished(
+                    method, url, time.time() - start, status, error
+                )
+
+    def perform_stream_request(self, method, url, headers=None, params=None, body=None):
+        """
+        Same as :meth:`perform_request`, but return the body of the response
+        as a file-like object to read incrementally instead of deserializing
+        it, e.g. with :func:`~opensearchpy.helpers.stream_hits`. The request
+        is retried as usual, but not once reading the body failed. Close the
+        stream once done with it to release the connection.
 
-        for attempt in range(self.max_retries + 1):
-            connection = self.get_connection()
+        Streamed requests aren't hedged nor traced. They're reported to the
+        connection pool and the metrics, and hold their slot of the
+        concurrency limit, until the headers of the response are received.
 
+        :arg method: HTTP method to use
+        :arg url: absolute url (without host) to target
+        :arg headers: dictionary of headers, will be handed over to the
+            underlying :class:`~opensearchpy.Connection` class
+        :arg params: dictionary of query parameters, will be handed over to the
+            underlying :class:`~opensearchpy.Connection` class for serialization
+        :arg body: body of the request, will be serialized using serializer and
+            passed to the connection. An iterator of ``bytes`` chunks is instead
+            streamed to the node with chunked transfer encoding, and so not
+            retried.
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.request_started(method, url)
+            start = time.time()
+        status = error = None
+
+        try:
+            max_retries = 0 if _is_streamed(body) else self.max_retries
+            # streamed responses aren't cached
+            if params:
+                params.pop("ignore_cache", None)
+            method, params, body, ignore, timeout = self._resolve_request_args(
+                method, params, body
+            )
+
+            for attempt in range(max_retries + 1):
+                connection = self._acquire_connection(timeout)
+
+                try:
+                    status, _, stream = self._perform_on_connection(
+                        connection,
+                        method,
+                        url,
+                        params,
+                        body,
+                        headers=headers,
+                        ignore=ignore,
+                        timeout=timeout,
+                        stream=True,
+                    )
+                except TransportError as e:
+                    if isinstance(e.status_code, int):
+                        status = e.status_code
+                    delay = self._prepare_retry(
+                        e, connection, method, url, attempt, max_retries
+                    )
+                    if delay:
+                        time.sleep(delay)
+                else:
+                    self.connection_pool.mark_live(connection)
+                    if self.retry_budget is not None:
+                        self.retry_budget.record_success()
+                    return stream
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if metrics is not None:
+                metrics.request_finished(
+                    method, url, time.time() - start, status, error
+                )
+
+    def _send(self, hedge, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection``, hedged or not. Returns the
+        connection that got the response and the response.
+        """
+        if hedge:
+            return self._perform_hedged(connection, method, url, *args, **kwargs)
+        response = self._perform_on_connection(connection, method, url, *args, **kwargs)
+        return connection, response
+
+    def _send_traced(
+        self,
+        attempt,
+        hedge,
+        connection,
+        method,
+        url,
+        params,
+        body,
+        headers=None,
+        **kwargs
+    ):
+        """
+        Same as `_send` within a span for the attempt, whose trace context
+        is added to the request headers.
+        """
+        with self.tracing.attempt_span(connection, method, url, attempt) as span:
+            headers = dict(headers) if headers else {}
+            self.tracing.inject(headers)
             try:
-                status, headers_response, data = connection.perform_request(
+                connection, response = self._send(
+                    hedge,
+                    connection,
                     method,
                     url,
                     params,
                     body,
                     headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
+                    **kwargs
                 )
+            except TransportError as e:
+                if isinstance(e.status_code, int):
+                    span.set_attribute("http.response.status_code", e.status_code)
+                raise
+            span.set_attribute("http.response.status_code", response[0])
+            return connection, response
 
-                # Lowercase all the header names for consistency in accessing them.
-                headers_response = {
-                    header.lower(): value for header, value in headers_response.items()
-                }
+    def _acquire_connection(self, timeout):
+        """
+        Take a slot of the concurrency limit, if any, then return the
+        connection to send a request over. Waiting for the slot takes at most
+        the request ``timeout``, or the default timeout of the connections,
+        after which :class:`~opensearchpy.ConnectionTimeout` is raised.
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            return self.get_connection()
+        if timeout is None:
+            timeout = self.kwargs.get("timeout", 10)
+        if self.tracing is not None:
+            with self.tracing.span("queue"):
+                acquired = limiter.acquire(timeout)
+        else:
+            acquired = limiter.acquire(timeout)
+        if not acquired:
+            message = (
+                "Timed out after %s seconds waiting for the concurrency limit" % timeout
+            )
+            raise ConnectionTimeout("TIMEOUT", message, message)
+        try:
+            return self.get_connection()
+        except Exception:
+            self._cancel_slot()
+            raise
 
-            except TransportError as e:
-                if method == "HEAD" and e.status_code == 404:
-                    return False
-
-                retry = False
-                if isinstance(e, ConnectionTimeout):
-                    retry = self.retry_on_timeout
-                elif isinstance(e, ConnectionError):
-                    retry = True
-                elif e.status_code in self.retry_on_status:
-                    retry = True
-
-                if retry:
-                    try:
-                        # only mark as dead if we are retrying
-                        self.mark_dead(connection)
-                    except TransportError:
-                        # If sniffing on failure, it could fail too. Catch the
-                        # exception not to interrupt the retries.
-                        pass
-                    # raise exception on last retry
-                    if attempt == self.max_retries:
-                        raise e
-                else:
-                    raise e
+    def _cancel_slot(self):
+        # give back the slot of a request that won't be sent
+        self.concurrency_limiter.cancel()
 
+    def _perform_on_connection(self, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection``, reporting its duration and outcome
+        to the connection pool and releasing its slot of the concurrency
+        limit, if any, which the caller took. With
+        ``stream=True`` the request is sent with
+        :meth:`~opensearchpy.Connection.perform_stream_request` and completes
+        once the headers of the response are received.
+        """
+        if kwargs.pop("stream", False):
+            perform = connection.perform_stream_request
+        else:
+            perform = connection.perform_request
+        limiter = self.concurrency_limiter
+        # report the outcome to the pool the connection was selected from,
+        # even if a sniff replaced it in the meantime
+        pool = self.connection_pool
+        pool.request_started(connection)
+        start = time.time()
+        failed = True
+        status = None
+        try:
+            response = perform(method, url, *args, **kwargs)
+            failed = False
+            status = response[0]
+            return response
+        except TransportError as e:
+            # an error status still means the node responded
+            failed = isinstance(e, ConnectionError)
+            if not failed:
+                status = e.status_code
+            raise
+        finally:
+            duration = time.time() - start
+            pool.request_finished(connection, duration, failed, status=status)
+            if limiter is not None:
+                limiter.release(duration, failed, status)
+
+    def _dumps(self, data):
+        """
+        Serialize a request body, timing and tracing it if enabled.
+        """
+        if self.tracing is not None:
+            with self.tracing.span("serialize"):
+                return self._timed_dumps(data)
+        return self._timed_dumps(data)
+
+    def _timed_dumps(self, data):
+        if self.metrics is None:
+            return self.serializer.dumps(data)
+        start = time.time()
+        data = self.serializer.dumps(data)
+        self.metrics.serialized(time.time() - start)
+        return data
+
+    def _loads(self, data, mimetype):
+        """
+        Deserialize a response body, timing and tracing it if enabled.
+        """
+        if self.tracing is not None:
+            with self.tracing.span("deserialize"):
+                return self._timed_loads(data, mimetype)
+        return self._timed_loads(data, mimetype)
+
+    def _timed_loads(self, data, mimetype):
+        if self.metrics is None:
+            return self.deserializer.loads(data, mimetype)
+        start = time.time()
+        data = self.deserializer.loads(data, mimetype)
+        self.metrics.deserialized(time.time() - start)
+        return data
+
+    def _cached_response(self, method, status, headers_response, data):
+        """
+        Return a response from the cache as :meth:`perform_request` does,
+        deserializing a copy of its body.
+        """
+        if method == "HEAD":
+            return 200 <= status < 300
+        if data:
+            data = self._loads(data, headers_response.get("content-type"))
+        return data
+
+    def _acquire_retry(self):
+        """
+        Whether the retry budget, if any, allows another retry, counting the
+        retries taken and suppressed.
+        """
+        acquired = self.retry_budget is None or self.retry_budget.acquire()
+        with self._retry_lock:
+            if acquired:
+                self.retries += 1
             else:
-                # connection didn't fail, confirm its live status
-                self.connection_pool.mark_live(connection)
+                self.suppressed_retries += 1
+        return acquired
+
+    def _get_retry_delay(self, attempt):
+        """
+        Number of seconds to wait before retrying after ``attempt`` failed:
+        exponential backoff with full jitter.
+        """
+        if not self.retry_backoff:
+            return 0
+        return random.uniform(
+            0, min(self.retry_backoff_max, self.retry_backoff * 2**attempt)
+        )
 
-                if method == "HEAD":
-                    return 200 <= status < 300
+    def _prepare_retry(self, e, connection, method, url, attempt, max_retries):
+        """
+        Raise ``e``, which ``attempt`` out of ``max_retries + 1`` failed with,
+        unless the request should be retried. Otherwise mark ``connection`` as
+        dead and return the number of seconds to wait before retrying.
+        """
+        if isinstance(e, ConnectionTimeout):
+            retry = self.retry_on_timeout
+        elif isinstance(e, ConnectionError):
+            retry = True
+        else:
+            retry = e.status_code in self.retry_on_status
+        if not retry:
+            raise e
 
-                if data:
-                    data = self.deserializer.loads(
-                        data, headers_response.get("content-type")
-                    )
-                return data
+        try:
+            # only mark as dead if we are retrying
+            self.mark_dead(connection)
+        except TransportError:
+            # If sniffing on failure, it could fail too. Catch the
+            # exception not to interrupt the retries.
+            pass
+        # raise exception on last retry or when out of retry budget
+        if attempt == max_retries or not self._acquire_retry():
+            raise e
+        if self.metrics is not None:
+            self.metrics.retry(connection, method, url, attempt + 1, e)
+        return self._get_retry_delay(attempt)
+
+    def _get_hedge_connection(self, connection):
+        """
+        Pick a connection other than ``connection`` for a hedged request and
+        take it from the hedging budget and the concurrency limit, if any,
+        without waiting for a slot. Returns ``None`` if there's no other live
+        connection, the budget is exhausted or the limit is reached.
+        """
+        limiter = self.concurrency_limiter
+        if limiter is not None and not limiter.try_acquire():
+            return None
+        for _ in range(3):
+            hedge_connection = self.connection_pool.get_connection()
+            if hedge_connection is not connection:
+                if self.hedging.acquire():
+                    return hedge_connection
+                break
+        if limiter is not None:
+            self._cancel_slot()
+        return None
+
+    def _perform_hedged(self, connection, method, url, *args, **kwargs):
+        """
+        Send a request over ``connection`` and, if it hasn't completed after
+        the hedging delay, a duplicate over another connection. Returns the
+        connection and response of the first attempt that succeeds. If all
+        the attempts fail the error of the first one is raised. The attempts
+        are sent from the reusable threads of the transport, so the calling
+        thread returns as soon as one of them succeeds.
+        """
+        hedging = self.hedging
+        delay = hedging.get_delay()
+        if delay is None or not hedging.has_budget():
+            start = time.time()
+            response = self._perform_on_connection(
+                connection, method, url, *args, **kwargs
+            )
+            hedging.record(time.time() - start)
+            return connection, response
+
+        results = Queue()
+
+        def attempt(conn):
+            start = time.time()
+            try:
+                response = self._perform_on_connection(
+                    conn, method, url, *args, **kwargs
+                )
+            except Exception as e:
+                results.put((conn, None, e))
+            else:
+                hedging.record(time.time() - start)
+                results.put((conn, response, None))
+
+        self._hedging_workers.submit(attempt, connection)
+        pending = 1
+        try:
+            result = results.get(timeout=delay)
+        except Empty:
+            hedge_connection = self._get_hedge_connection(connection)
+            if hedge_connection is not None:
+                self._hedging_workers.submit(attempt, hedge_connection)
+                pending += 1
+            result = results.get()
+
+        errors = {}
+        while True:
+            pending -= 1
+            conn, response, error = result
+            if error is None:
+                return conn, response
+            errors[conn] = error
+            if not pending:
+                raise errors[connection]
+            result = results.get()
 
     def close(self):
         """
         Explicitly closes connections
         """
+        if self._health_check_stop is not None:
+            self._health_check_stop.set()
         self.connection_pool.close()
 
-    def _resolve_request_args(self, method, params, body):
+    def _bulk_body(self, body):
+        """
+        Serialize the body of a bulk or multi search request, one line per
+        item, see ``_bulk_body()``.
+        """
+        return _bulk_body(self.serializer, body)
+
+    def _resolve_request_args(self, method, params, body, serialized=False):
         """Resolves parameters for .perform_request()"""
-        if body is not None:
-            body = self.serializer.dumps(body)
+        if body is not None and not _is_streamed(body):
+            if not serialized:
+                body = self._dumps(body)
 
             # some clients or environments don't support sending GET with body
             if method in ("HEAD", "GET") and self.send_get_body_as != "GET":
@@ -24,11 +24,18 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import threading
 from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Type, Union
 
+from .cache import ResponseCache
+from .concurrency import ConcurrencyLimiter
 from .connection import Connection
 from .connection_pool import ConnectionPool
+from .hedging import RequestHedging
+from .metrics import TransportMetrics
+from .retry import RetryBudget
 from .serializer import Deserializer, Serializer
+from .tracing import Tracing
 
 def get_host_info(
     node_info: Dict[str, Any], host: Optional[Dict[str, Any]]
@@ -41,6 +48,11 @@ class Transport(object):
 
     max_retries: int
     retry_on_timeout: bool
+    retry_backoff: float
+    retry_backoff_max: float
+    retry_budget: Optional[RetryBudget]
+    retries: int
+    suppressed_retries: int
     retry_on_status: Collection[int]
     send_get_body_as: str
     serializer: Serializer
@@ -52,8 +64,17 @@ class Transport(object):
     sniffer_timeout: Optional[float]
     sniff_on_start: bool
     sniff_on_connection_fail: bool
+    sniff_in_background: bool
+    sniffing_thread: Optional[threading.Thread]
     last_sniff: float
     sniff_timeout: Optional[float]
+    hedging: Optional[RequestHedging]
+    concurrency_limiter: Optional[ConcurrencyLimiter]
+    metrics: Optional[TransportMetrics]
+    tracing: Optional[Tracing]
+    response_cache: Optional[ResponseCache]
+    health_check_interval: Optional[float]
+    health_check_timeout: Optional[float]
     host_info_callback: Callable[
         [Dict[str, Any], Optional[Dict[str, Any]]], Optional[Dict[str, Any]]
     ]
@@ -69,19 +90,33 @@ class Transport(object):
         sniffer_timeout: Optional[float] = ...,
         sniff_timeout: float = ...,
         sniff_on_connection_fail: bool = ...,
+        sniff_in_background: bool = ...,
         serializer: Serializer = ...,
         serializers: Optional[Mapping[str, Serializer]] = ...,
         default_mimetype: str = ...,
         max_retries: int = ...,
         retry_on_status: Collection[int] = ...,
         retry_on_timeout: bool = ...,
+        retry_backoff: float = ...,
+        retry_backoff_max: float = ...,
+        retry_budget: Union[bool, RetryBudget, None] = ...,
         send_get_body_as: str = ...,
+        hedging: Union[bool, RequestHedging, None] = ...,
+        concurrency_limiter: Union[bool, ConcurrencyLimiter, None] = ...,
+        metrics: Optional[TransportMetrics] = ...,
+        tracing: Union[bool, Tracing, None] = ...,
+        response_cache: Union[bool, ResponseCache, None] = ...,
+        health_check_interval: Optional[float] = ...,
+        health_check_timeout: Optional[float] = ...,
         **kwargs: Any
     ) -> None: ...
     def add_connection(self, host: Any) -> None: ...
     def set_connections(self, hosts: Collection[Any]) -> None: ...
     def get_connection(self) -> Connection: ...
     def sniff_hosts(self, initial: bool = ...) -> None: ...
+    def create_sniff_thread(self) -> None: ...
+    def check_health(self, connection: Connection) -> bool: ...
+    def check_dead_connections(self) -> None: ...
     def mark_dead(self, connection: Connection) -> None: ...
     def perform_request(
         self,
@@ -91,4 +126,13 @@ class Transport(object):
         params: Optional[Mapping[str, Any]] = ...,
         body: Optional[Any] = ...,
     ) -> Union[bool, Any]: ...
+    def perform_stream_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = ...,
+        params: Optional[Mapping[str, Any]] = ...,
+        body: Optional[Any] = ...,
+    ) -> Any: ...
+    def _bulk_body(self, body: Any) -> Any: ...
     def close(self) -> None: ...
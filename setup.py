@@ -124,5 +124,9 @@ setup(
         "docs": docs_require,
         "async": async_require,
         "kerberos": ["requests_kerberos"],
+        "orjson": ["orjson>=3"],
+        "opentelemetry": ["opentelemetry-api"],
+        "ijson": ["ijson>=3.1"],
+        "zstd": ["zstandard"],
     },
 )
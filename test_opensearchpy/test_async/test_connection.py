@@ -31,6 +31,7 @@ import io
 import json
 import ssl
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from platform import python_version
 
 import aiohttp
@@ -75,6 +76,9 @@ class TestAIOHttpConnection:
                 async def text(self):
                     return response_body.decode("utf-8", "surrogatepass")
 
+                async def read(self):
+                    return response_body
+
             dummy_response = DummyResponse()
             dummy_response.headers = CIMultiDict(**response_headers)
             dummy_response.status = response_code
@@ -142,6 +146,53 @@ class TestAIOHttpConnection:
         assert kwargs["headers"]["accept-encoding"] == "gzip,deflate"
         assert "content-encoding" not in kwargs["headers"]
 
+    async def test_streamed_body_is_sent_chunked(self):
+        con = await self._get_mock_connection()
+        await con.perform_request(
+            "POST", "/_bulk", body=iter([b'{"index":{}}\n', "{}\n"])
+        )
+
+        _, kwargs = con.session.request.call_args
+        assert [b'{"index":{}}\n', b"{}\n"] == [chunk async for chunk in kwargs["data"]]
+
+    async def test_streamed_body_is_compressed(self):
+        con = await self._get_mock_connection({"http_compress": True})
+
+        async def chunks():
+            yield b'{"index":{}}\n'
+            yield b"{}\n"
+
+        await con.perform_request("POST", "/_bulk", body=chunks())
+
+        _, kwargs = con.session.request.call_args
+        data = b"".join([chunk async for chunk in kwargs["data"]])
+        assert gzip_decompress(data) == b'{"index":{}}\n{}\n'
+        assert kwargs["headers"]["content-encoding"] == "gzip"
+
+    async def test_large_body_is_compressed_in_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        con = await self._get_mock_connection(
+            {
+                "http_compress": True,
+                "offload_threshold": 16,
+                "offload_executor": executor,
+            }
+        )
+
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            await con.perform_request("POST", "/", body=b"{}")
+            _, kwargs = con.session.request.call_args
+            assert gzip_decompress(kwargs["data"]) == b"{}"
+            assert submit.call_count == 0
+
+            await con.perform_request("POST", "/", body=b'{"query":{"match_all":{}}}')
+            _, kwargs = con.session.request.call_args
+            assert gzip_decompress(kwargs["data"]) == b'{"query":{"match_all":{}}}'
+            assert kwargs["headers"]["content-encoding"] == "gzip"
+            assert submit.call_count == 1
+
+        executor.shutdown()
+
     async def test_url_prefix(self):
         con = await self._get_mock_connection(
             connection_params={"url_prefix": "/_search/"}
@@ -305,6 +356,14 @@ class TestAIOHttpConnection:
         status, headers, data = await con.perform_request("GET", "/")
         assert u"你好\uda6a" == data  # fmt: skip
 
+    async def test_raw_bytes_returned_without_decode_response(self):
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = await self._get_mock_connection(
+            connection_params={"decode_response": False}, response_body=buf
+        )
+        status, headers, data = await con.perform_request("GET", "/")
+        assert buf == data
+
     @pytest.mark.parametrize("exception_cls", reraise_exceptions)
     async def test_recursion_error_reraised(self, exception_cls):
         conn = AIOHttpConnection()
@@ -418,6 +477,22 @@ class TestConnectionHttpServer:
         with pytest.raises(ConnectionError):
             await conn.perform_request("GET", "/")
 
+    async def test_aiohttp_stream_request(self):
+        conn = AIOHttpConnection("localhost", port=8081, use_ssl=False)
+        status, _, stream = await conn.perform_stream_request("GET", "/")
+        chunks = []
+        try:
+            while True:
+                chunk = await stream.read(16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            stream.close()
+            await conn.close()
+        assert status == 200
+        assert json.loads(b"".join(chunks))["method"] == "GET"
+
 
 async def test_default_connection_is_returned_by_default():
     c = async_connections.AsyncConnections()
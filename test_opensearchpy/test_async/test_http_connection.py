@@ -32,6 +32,7 @@ from multidict import CIMultiDict
 from opensearchpy._async._extra_imports import aiohttp
 from opensearchpy._async.compat import get_running_loop
 from opensearchpy.connection.http_async import AsyncHttpConnection
+from opensearchpy.exceptions import NotFoundError
 
 pytestmark = pytest.mark.asyncio
 
@@ -122,3 +123,26 @@ class TestAsyncHttpConnection:
             ),
             fingerprint=None,
         )
+
+    async def test_error_is_parsed_according_to_content_type(self):
+        class DummyResponse:
+            headers = CIMultiDict({"content-type": "application/json"})
+            status = 404
+
+            async def __aenter__(self, *_, **__):
+                return self
+
+            async def __aexit__(self, *_, **__):
+                pass
+
+            async def text(self):
+                return '{"error": {"type": "index_not_found_exception"}}'
+
+        c = AsyncHttpConnection(loop=get_running_loop())
+        await c._create_aiohttp_session()
+        c.session.request = lambda *args, **kwargs: DummyResponse()
+
+        with pytest.raises(NotFoundError) as e:
+            await c.perform_request("GET", "/i")
+        assert "index_not_found_exception" == e.value.error
+        await c.close()
@@ -26,13 +26,14 @@
 
 
 import asyncio
+import json
 
 import pytest
 from mock import MagicMock, patch
 
-from opensearchpy import TransportError
+from opensearchpy import JSONSerializer, TransportError
 from opensearchpy._async.helpers import actions
-from opensearchpy.helpers import BulkIndexError, ScanError
+from opensearchpy.helpers import AdaptiveChunkSize, BulkIndexError, ScanError
 
 pytestmark = pytest.mark.asyncio
 
@@ -62,6 +63,40 @@ class FailingBulkClient(object):
         return await self.client.bulk(*args, **kwargs)
 
 
+class SlowBulkClient(object):
+    """
+    Acknowledges every document after a delay that is shorter for later
+    requests, records how many requests were in flight at once.
+    """
+
+    def __init__(self, delays, fail_at=()):
+        self.transport = MagicMock(serializer=JSONSerializer())
+        self._delays = list(delays)
+        self._fail_at = fail_at
+        self._called = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def bulk(self, body, *args, **kwargs):
+        self._called += 1
+        called = self._called
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays.pop(0) if self._delays else 0)
+        finally:
+            self.in_flight -= 1
+        if called in self._fail_at:
+            raise TransportError(429, "Rejected!", {})
+        return {
+            "took": 1,
+            "items": [
+                {"index": {"_id": json.loads(line)["index"]["_id"], "status": 201}}
+                for line in body.splitlines()[::2]
+            ],
+        }
+
+
 class TestStreamingBulk(object):
     async def test_actions_remain_unchanged(self, async_client):
         actions1 = [{"_id": 1}, {"_id": 2}]
@@ -214,6 +249,31 @@ class TestStreamingBulk(object):
         assert {"value": 3, "relation": "eq"} == res["hits"]["total"]
         assert 4 == failing_client._called
 
+    async def test_adaptive_chunking_shrinks_rejected_chunks(self, async_client):
+        failing_client = FailingBulkClient(
+            async_client, fail_at=(1,), fail_with=TransportError(429, "Rejected!", {})
+        )
+        sizer = AdaptiveChunkSize(chunk_size=2, min_chunk_size=1, increase_step=1)
+        docs = [
+            {"_index": "i", "_id": 47, "f": "v"},
+            {"_index": "i", "_id": 45, "f": "v"},
+            {"_index": "i", "_id": 42, "f": "v"},
+        ]
+        results = [
+            x
+            async for x in actions.async_streaming_bulk(
+                failing_client,
+                docs,
+                max_retries=1,
+                initial_backoff=0,
+                adaptive_chunking=sizer,
+            )
+        ]
+        assert [True, True, True] == [r[0] for r in results]
+        # halved by the rejection, then grown by each successful request
+        assert 3 == sizer.chunk_size
+        assert 3 == failing_client._called
+
     async def test_rejected_documents_are_retried_at_most_max_retries_times(
         self, async_client
     ):
@@ -439,6 +499,72 @@ async def scan_teardown(async_client):
     await async_client.clear_scroll(scroll_id="_all")
 
 
+class TestParallelBulk(object):
+    async def test_all_documents_get_inserted(self, async_client):
+        docs = [{"answer": x, "_id": x} for x in range(100)]
+        results = [
+            x
+            async for x in actions.async_parallel_bulk(
+                async_client, docs, chunk_size=10, index="test-index", refresh=True
+            )
+        ]
+
+        assert 100 == len(results)
+        assert all(ok for ok, item in results)
+        assert 100 == (await async_client.count(index="test-index"))["count"]
+
+    async def test_requests_are_concurrent_and_results_ordered(self):
+        client = SlowBulkClient(delays=[0.05, 0.04, 0.03, 0.02, 0.01])
+        results = [
+            x
+            async for x in actions.async_parallel_bulk(
+                client, ({"_id": i} for i in range(10)), concurrency=3, chunk_size=2
+            )
+        ]
+
+        assert 3 == client.max_in_flight
+        assert [str(i) for i in range(10)] == [
+            str(item["index"]["_id"]) for ok, item in results
+        ]
+
+    async def test_results_can_be_yielded_in_completion_order(self):
+        client = SlowBulkClient(delays=[0.05, 0.01])
+        results = [
+            x
+            async for x in actions.async_parallel_bulk(
+                client,
+                ({"_id": i} for i in range(4)),
+                concurrency=2,
+                chunk_size=2,
+                preserve_order=False,
+            )
+        ]
+
+        assert ["2", "3", "0", "1"] == [
+            str(item["index"]["_id"]) for ok, item in results
+        ]
+
+    async def test_rejected_chunk_is_retried_without_blocking_others(self):
+        client = SlowBulkClient(delays=[0, 0.01, 0.01], fail_at=(1,))
+        results = [
+            x
+            async for x in actions.async_parallel_bulk(
+                client,
+                ({"_id": i} for i in range(4)),
+                concurrency=2,
+                chunk_size=2,
+                max_retries=1,
+                initial_backoff=0.05,
+                preserve_order=False,
+            )
+        ]
+
+        assert 3 == client._called
+        assert ["2", "3", "0", "1"] == [
+            str(item["index"]["_id"]) for ok, item in results
+        ]
+
+
 class TestScan(object):
     async def test_order_can_be_preserved(self, async_client, scan_teardown):
         bulk = []
@@ -772,6 +898,127 @@ async def reindex_setup(async_client):
     yield
 
 
+class SlicedPitClient(object):
+    """
+    Serves five docs per slice of a point in time, paged with search_after.
+    """
+
+    def __init__(self):
+        self.searches = 0
+        self.deleted = []
+
+    async def create_pit(self, index, keep_alive, **kwargs):
+        return {"pit_id": "pit", "_shards": {"total": 3}}
+
+    async def delete_pit(self, body, **kwargs):
+        self.deleted.append(body)
+
+    async def search(self, body, **kwargs):
+        self.searches += 1
+        await asyncio.sleep(0)
+        slice_id = body["slice"]["id"]
+        start = body.get("search_after", [0])[0]
+        docs = list(range(start + 1, 6))[: body["size"]]
+        return {
+            "_shards": {"total": 1, "successful": 1},
+            "hits": {
+                "hits": [
+                    {"_id": "%d-%d" % (slice_id, doc), "sort": [doc]} for doc in docs
+                ]
+            },
+        }
+
+
+class TestParallelScan(object):
+    async def test_all_slices_are_scanned_and_pit_deleted(self):
+        client = SlicedPitClient()
+        progress = []
+        hits = [
+            hit
+            async for hit in actions.async_parallel_scan(
+                client,
+                "test-index",
+                size=2,
+                concurrency=2,
+                progress_callback=lambda *args: progress.append(args),
+            )
+        ]
+
+        assert sorted(
+            "%d-%d" % (s, d) for s in range(3) for d in range(1, 6)
+        ) == sorted(hit["_id"] for hit in hits)
+        assert 9 == client.searches
+        assert [(0, 5, True), (1, 5, True), (2, 5, True)] == sorted(
+            p for p in progress if p[2]
+        )
+        assert [{"pit_id": ["pit"]}] == client.deleted
+
+    async def test_pit_is_deleted_when_iteration_stops_early(self):
+        client = SlicedPitClient()
+        hits = actions.async_parallel_scan(client, "test-index", size=1)
+        await hits.__anext__()
+        await hits.aclose()
+
+        assert [{"pit_id": ["pit"]}] == client.deleted
+
+
+class ScrollingClient(object):
+    """
+    Serves three pages of two hits through the scroll api.
+    """
+
+    def __init__(self):
+        self.scrolls = 0
+        self.cleared = []
+
+    def page(self, number):
+        return {
+            "_scroll_id": "scroll-%d" % number,
+            "_shards": {"total": 1, "successful": 1},
+            "hits": {
+                "hits": (
+                    [{"_id": "%d-%d" % (number, i)} for i in range(2)]
+                    if number < 3
+                    else []
+                )
+            },
+        }
+
+    async def search(self, **kwargs):
+        return self.page(0)
+
+    async def scroll(self, body, **kwargs):
+        self.scrolls += 1
+        return self.page(self.scrolls)
+
+    async def clear_scroll(self, body, **kwargs):
+        self.cleared.append(body)
+
+
+class TestScanPrefetch(object):
+    async def test_next_pages_are_fetched_while_consuming(self):
+        client = ScrollingClient()
+        hits = actions.async_scan(client, index="test-index", prefetch=2)
+        assert "0-0" == (await hits.__anext__())["_id"]
+
+        # the consumer is still on the first page
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert 2 == client.scrolls
+
+        assert ["0-1", "1-0", "1-1", "2-0", "2-1"] == [hit["_id"] async for hit in hits]
+        assert 3 == client.scrolls
+        assert [{"scroll_id": ["scroll-3"]}] == client.cleared
+
+    async def test_scroll_is_cleared_when_iteration_stops_early(self):
+        client = ScrollingClient()
+        hits = actions.async_scan(client, index="test-index", prefetch=1)
+        await hits.__anext__()
+        await hits.aclose()
+
+        assert [{"scroll_id": ["scroll-%d" % client.scrolls]}] == client.cleared
+
+
 class TestReindex(object):
     async def test_reindex_passes_kwargs_to_scan_and_bulk(
         self, async_client, reindex_setup
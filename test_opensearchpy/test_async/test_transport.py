@@ -29,15 +29,29 @@
 from __future__ import unicode_literals
 
 import asyncio
+import io
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from mock import patch
 
-from opensearchpy import AIOHttpConnection, AsyncTransport
+from opensearchpy import AIOHttpConnection, AsyncOpenSearch, AsyncTransport, helpers
+from opensearchpy._async.transport import _approximate_size
+from opensearchpy.circuit_breaker import CircuitBreaker
+from opensearchpy.concurrency import ConcurrencyLimiter
 from opensearchpy.connection import Connection
 from opensearchpy.connection_pool import DummyConnectionPool
-from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.exceptions import (
+    ConnectionError,
+    ConnectionTimeout,
+    NotFoundError,
+    TransportError,
+)
+from opensearchpy.hedging import RequestHedging
+from opensearchpy.metrics import HistogramCollector
+from opensearchpy.retry import RetryBudget
+from opensearchpy.tracing import Tracing
 
 pytestmark = pytest.mark.asyncio
 
@@ -62,6 +76,10 @@ class DummyConnection(Connection):
             raise self.exception
         return self.status, self.headers, self.data
 
+    async def perform_stream_request(self, *args, **kwargs):
+        status, headers, data = await self.perform_request(*args, **kwargs)
+        return status, headers, AsyncBytesIO(data.encode("utf-8"))
+
     async def close(self):
         if self.closed:
             raise RuntimeError("This connection is already closed")
@@ -119,6 +137,11 @@ CLUSTER_NODES_7x_PUBLISH_HOST = """{
 }"""
 
 
+class AsyncBytesIO(io.BytesIO):
+    async def read(self, size=-1):
+        return super(AsyncBytesIO, self).read(size)
+
+
 class TestTransport:
     async def test_single_connection_uses_dummy_connection_pool(self):
         t = AsyncTransport([{}])
@@ -281,6 +304,317 @@ class TestTransport:
         assert connection_error
         assert 4 == len(t.get_connection().calls)
 
+    async def test_streamed_body_is_passed_through_and_not_retried(self):
+        t = AsyncTransport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+        body = iter([b"{}\n"])
+
+        with pytest.raises(ConnectionError):
+            await t.perform_request("POST", "/_bulk", body=body)
+        calls = t.get_connection().calls
+        assert 1 == len(calls)
+        assert body is calls[0][0][3]
+
+    async def test_stream_request_will_fail_after_X_retries(self):
+        t = AsyncTransport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+
+        with pytest.raises(ConnectionError):
+            await t.perform_stream_request("GET", "/")
+        assert 4 == len(t.get_connection().calls)
+
+    async def test_stream_requests_are_reported_to_pool_and_metrics(self):
+        breaker = CircuitBreaker(window=1, min_requests=1)
+        metrics = HistogramCollector()
+        t = AsyncTransport(
+            [{"exception": TransportError(503, "Service Unavailable")}] * 2,
+            connection_class=DummyConnection,
+            circuit_breaker=breaker,
+            metrics=metrics,
+            max_retries=0,
+        )
+
+        with pytest.raises(TransportError):
+            await t.perform_stream_request("GET", "/")
+        (con,) = [c for c in t.connection_pool.orig_connections if c.calls]
+        assert "open" == breaker.get_state(con)
+        exported = metrics.export()
+        assert (1, 1) == (exported["requests"], exported["errors"])
+        assert 0 == exported["in_flight"]
+
+    async def test_stream_hits_are_parsed_from_the_stream(self):
+        pytest.importorskip("ijson")
+        response = {
+            "took": 3,
+            "hits": {"hits": [{"_id": str(i), "_score": 0.5} for i in range(3)]},
+            "aggregations": {"max_n": {"value": 2.0}},
+        }
+        client = AsyncOpenSearch(
+            connection_class=DummyConnection, data=json.dumps(response)
+        )
+
+        hits = [
+            hit
+            async for hit in helpers.async_stream_hits(
+                client, query={"size": 3}, index="logs", request_timeout=10
+            )
+        ]
+        assert response["hits"]["hits"] == hits
+        assert [
+            (
+                ("POST", "/logs/_search", {}, b'{"size":3}'),
+                {"headers": {}, "ignore": (), "timeout": 10},
+            )
+        ] == client.transport.get_connection().calls
+
+    async def test_retries_back_off_with_jitter(self):
+        t = AsyncTransport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+            retry_backoff=1,
+            retry_backoff_max=3,
+        )
+
+        with patch("opensearchpy.transport.random.uniform") as uniform, patch(
+            "opensearchpy._async.transport.asyncio.sleep"
+        ) as sleep:
+            uniform.side_effect = lambda a, b: b / 2.0
+            with pytest.raises(ConnectionError):
+                await t.perform_request("GET", "/")
+        assert [0.5, 1.0, 1.5] == [call[0][0] for call in sleep.call_args_list]
+
+    async def test_retries_are_limited_by_budget(self):
+        budget = RetryBudget(max_tokens=1)
+        t = AsyncTransport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+            retry_budget=budget,
+        )
+
+        with pytest.raises(ConnectionError):
+            await t.perform_request("GET", "/")
+        assert 2 == len(t.get_connection().calls)
+        assert 1 == budget.retries
+        assert 1 == budget.suppressed
+
+    async def test_requests_are_reported_to_metrics(self):
+        metrics = HistogramCollector()
+        t = AsyncTransport(
+            [{"exception": ConnectionError("abandon ship")}, {}],
+            connection_class=DummyConnection,
+            metrics=metrics,
+            randomize_hosts=False,
+        )
+
+        assert {} == await t.perform_request("GET", "/", body={})
+        exported = metrics.export()
+        assert 1 == exported["requests"]
+        assert 0 == exported["errors"]
+        assert 1 == exported["retries"]
+        assert 1 == exported["marked_dead"]
+        assert ["GET /"] == list(exported["endpoints"])
+        assert 1 == exported["serialization"]["count"]
+
+    async def test_identical_requests_share_one_cached_request(self):
+        t = AsyncTransport(
+            [{"data": '{"count": 3}', "delay": 0.01}],
+            connection_class=DummyConnection,
+            response_cache=True,
+        )
+        await t._async_call()
+        connection = t.get_connection()
+
+        results = await asyncio.gather(
+            *[t.perform_request("POST", "/i/_count") for _ in range(3)]
+        )
+        assert [{"count": 3}] * 3 == results
+        assert {"count": 3} == await t.perform_request("POST", "/i/_count")
+        assert 1 == len(connection.calls)
+
+        await t.perform_request("POST", "/i/_count", params={"ignore_cache": True})
+        assert 2 == len(connection.calls)
+        cache = t.response_cache
+        assert (1, 1, 2) == (cache.hits, cache.misses, cache.shared)
+
+    async def test_identical_requests_share_a_response_not_cached(self):
+        t = AsyncTransport(
+            [{"status": 404, "data": '{"found": false}', "delay": 0.2}],
+            connection_class=DummyConnection,
+            response_cache=True,
+        )
+        await t._async_call()
+        connection = t.get_connection()
+
+        start = t.loop.time()
+        results = await asyncio.gather(
+            *[
+                t.perform_request("GET", "/i/_doc/1", params={"ignore": 404})
+                for _ in range(3)
+            ]
+        )
+        # the waiting requests aren't sent one after the other
+        assert t.loop.time() - start < 0.4
+        assert [{"found": False}] * 3 == results
+        assert 1 == len(connection.calls)
+
+    async def test_large_responses_are_deserialized_in_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        metrics = HistogramCollector()
+        t = AsyncTransport(
+            [{"data": '{"hits": {"hits": []}}'}],
+            connection_class=DummyConnection,
+            offload_threshold=16,
+            offload_executor=executor,
+            metrics=metrics,
+        )
+        await t._async_call()
+        connection = t.get_connection()
+        # passed on to the connections, which compress the request bodies
+        assert 16 == t.kwargs["offload_threshold"]
+        assert executor is t.kwargs["offload_executor"]
+
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            assert {"hits": {"hits": []}} == await t.perform_request("GET", "/")
+            assert 1 == submit.call_count
+
+            connection.data = "{}"
+            assert {} == await t.perform_request("GET", "/")
+            assert 1 == submit.call_count
+
+        assert 2 == metrics.export()["deserialization"]["count"]
+        executor.shutdown()
+
+    async def test_large_requests_are_serialized_in_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        metrics = HistogramCollector()
+        t = AsyncTransport(
+            [{}],
+            connection_class=DummyConnection,
+            offload_threshold=64,
+            offload_executor=executor,
+            metrics=metrics,
+        )
+        await t._async_call()
+        connection = t.get_connection()
+        body = {"query": {"terms": {"_id": [str(i) for i in range(20)]}}}
+
+        with patch.object(executor, "submit", wraps=executor.submit) as submit:
+            await t.perform_request("POST", "/_search", body=body)
+            assert 1 == submit.call_count
+            assert t.serializer.dumps(body).encode() == connection.calls[0][0][3]
+
+            await t.perform_request("POST", "/_search", body={"size": 1})
+            assert 1 == submit.call_count
+
+            lines = [{"index": {}}, {"value": "x" * 64}]
+            assert t.serializer.dumps(lines[1]) in await t._bulk_body(lines)
+            assert 2 == submit.call_count
+            await t._bulk_body(lines[:1])
+            assert 2 == submit.call_count
+
+        assert 2 == metrics.export()["serialization"]["count"]
+        executor.shutdown()
+
+    async def test_approximate_size_stops_at_limit(self):
+        assert 13 == _approximate_size({"a": 1}, 100)
+        assert 24 == _approximate_size(["x" * 20], 100)
+        assert 100 <= _approximate_size([{"a": 1}] * 1000, 100) < 200
+
+    async def test_api_call_is_traced(self):
+        sdk = pytest.importorskip("opentelemetry.sdk.trace")
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        exporter = InMemorySpanExporter()
+        provider = sdk.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        client = AsyncOpenSearch(
+            connection_class=DummyConnection,
+            tracing=Tracing(tracer=provider.get_tracer("test")),
+        )
+
+        await client.indices.exists(index="movies")
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert {"indices.exists", "HEAD"} == set(spans.keys())
+        assert "movies" == spans["indices.exists"].attributes["db.opensearch.index"]
+        assert spans["indices.exists"].context.span_id == spans["HEAD"].parent.span_id
+        ((_, kwargs),) = client.transport.get_connection().calls
+        assert "traceparent" in kwargs["headers"]
+
+    async def test_requests_wait_for_concurrency_limiter(self):
+        limiter = ConcurrencyLimiter(initial_limit=2, max_limit=2)
+        t = AsyncTransport(
+            [{"delay": 0.02}],
+            connection_class=DummyConnection,
+            concurrency_limiter=limiter,
+        )
+        active = []
+
+        async def perform_request():
+            await t.perform_request("GET", "/")
+            active.append(limiter.in_flight)
+
+        await asyncio.gather(*[perform_request() for _ in range(6)])
+
+        assert 6 == len(t.get_connection().calls)
+        assert max(active) <= 2
+        assert 0 == limiter.in_flight
+        assert 0 == len(t._concurrency_waiters)
+
+    async def test_waiting_for_concurrency_limiter_times_out(self):
+        limiter = ConcurrencyLimiter(initial_limit=1, max_limit=1)
+        t = AsyncTransport(
+            [{}], connection_class=DummyConnection, concurrency_limiter=limiter
+        )
+        limiter.acquire()
+
+        with pytest.raises(ConnectionTimeout):
+            await t.perform_request("GET", "/", params={"request_timeout": 0.01})
+        assert [] == t.get_connection().calls
+        assert 1 == limiter.in_flight
+        assert t._concurrency_waiters[0].cancelled()
+
+    async def test_cancelled_request_passes_on_concurrency_slot(self):
+        limiter = ConcurrencyLimiter(initial_limit=1, max_limit=1)
+        t = AsyncTransport(
+            [{"delay": 0.02}],
+            connection_class=DummyConnection,
+            concurrency_limiter=limiter,
+        )
+        await t._async_init()
+
+        first = asyncio.ensure_future(t.perform_request("GET", "/"))
+        second = asyncio.ensure_future(t.perform_request("GET", "/"))
+        third = asyncio.ensure_future(t.perform_request("GET", "/"))
+        await asyncio.sleep(0)
+        second.cancel()
+        await asyncio.gather(first, third)
+
+        assert second.cancelled()
+        assert 2 == len(t.get_connection().calls)
+        assert 0 == limiter.in_flight
+
+    async def test_error_status_is_reported_to_circuit_breaker(self):
+        breaker = CircuitBreaker(window=1, min_requests=1)
+        t = AsyncTransport(
+            [{"exception": TransportError(503, "Service Unavailable")}] * 2,
+            connection_class=DummyConnection,
+            circuit_breaker=breaker,
+            max_retries=0,
+        )
+
+        with pytest.raises(TransportError):
+            await t.perform_request("GET", "/")
+        (con,) = [c for c in t.connection_pool.orig_connections if c.calls]
+        assert "open" == breaker.get_state(con)
+        assert con not in t.connection_pool.connections
+
     async def test_failed_connection_will_be_marked_as_dead(self):
         t = AsyncTransport(
             [{"exception": ConnectionError("abandon ship")}] * 2,
@@ -309,6 +643,101 @@ class TestTransport:
             assert 1 == len(t.connection_pool.connections)
             assert 1 == len(t.connection_pool.dead_count)
 
+    async def test_dead_connection_is_resurrected_after_health_check(self):
+        t = AsyncTransport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            health_check_interval=3600,
+            dead_timeout=0,
+        )
+        await t._async_call()
+        assert t.connection_pool.health_check
+        con1, con2 = t.connection_pool.connections
+        t.connection_pool.mark_dead(con1)
+        con1.exception = ConnectionError("abandon ship")
+
+        await t.check_dead_connections()
+        assert [con2] == t.connection_pool.connections
+        assert [(("HEAD", "/"), {"timeout": 1})] == con1.calls
+
+        con1.exception = None
+        t.connection_pool.dead.queue[0] = (0, con1)
+        await t.check_dead_connections()
+        assert [con2, con1] == t.connection_pool.connections
+        assert {} == t.connection_pool.dead_count
+        await t.close()
+        assert t.health_check_task is None
+
+    async def test_health_checks_run_in_background(self):
+        t = AsyncTransport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            health_check_interval=0.01,
+            dead_timeout=0,
+        )
+        await t._async_call()
+        con1, con2 = t.connection_pool.connections
+        t.connection_pool.mark_dead(con1)
+
+        for _ in range(100):
+            if len(t.connection_pool.connections) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert [con2, con1] == t.connection_pool.connections
+        await t.close()
+
+    def _hedged_transport(self, hosts, budget=1.0):
+        hedging = RequestHedging(budget=budget, min_samples=1)
+        hedging.record(0.01)
+        return AsyncTransport(
+            hosts,
+            connection_class=DummyConnection,
+            hedging=hedging,
+            randomize_hosts=False,
+        )
+
+    async def test_slow_read_is_hedged_to_another_connection(self):
+        t = self._hedged_transport(
+            [{"delay": 0.5, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}]
+        )
+        await t._async_call()
+        slow, fast = t.connection_pool.connections
+
+        assert {"fast": 1} == await t.perform_request("GET", "/_search")
+        assert 1 == len(fast.calls)
+        await asyncio.sleep(0)
+        # the slow request got cancelled
+        assert [] == slow.calls
+
+    async def test_hedging_is_limited_by_budget(self):
+        t = self._hedged_transport(
+            [{"delay": 0.1, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}],
+            budget=0.5,
+        )
+
+        assert {"slow": 1} == await t.perform_request("GET", "/_search")
+
+    async def test_failed_hedge_waits_for_original_request(self):
+        t = self._hedged_transport(
+            [
+                {"delay": 0.1, "data": '{"slow": 1}'},
+                {"exception": ConnectionError("abandon ship")},
+            ]
+        )
+
+        assert {"slow": 1} == await t.perform_request("POST", "/_count")
+
+    async def test_error_of_original_request_is_raised_if_all_fail(self):
+        t = self._hedged_transport(
+            [
+                {"delay": 0.1, "exception": NotFoundError(404)},
+                {"exception": ConnectionError("abandon ship")},
+            ]
+        )
+
+        with pytest.raises(NotFoundError):
+            await t.perform_request("GET", "/_search")
+
     async def test_sniff_will_use_seed_connections(self):
         t = AsyncTransport([{"data": CLUSTER_NODES}], connection_class=DummyConnection)
         await t._async_call()
@@ -447,6 +876,7 @@ class TestTransport:
         assert t.connection_pool.connection_opts[0][1] == {
             "host": "somehost.tld",
             "port": 123,
+            "roles": ["cluster_manager", "data", "ingest"],
         }
 
     async def test_transport_close_closes_all_pool_connections(self):
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+
+from mock import patch
+
+from opensearchpy.cache import ResponseCache
+
+from .test_cases import TestCase
+
+
+class TestResponseCache(TestCase):
+    def test_read_requests_are_cacheable(self):
+        cache = ResponseCache()
+
+        self.assertTrue(cache.is_cacheable("GET", "/index/_doc/1"))
+        self.assertTrue(cache.is_cacheable("POST", "/index/_search"))
+        self.assertFalse(cache.is_cacheable("POST", "/index/_doc"))
+        self.assertFalse(cache.is_cacheable("POST", "/_search", {"scroll": "1m"}))
+
+    def test_key_ignores_order_of_params_and_headers(self):
+        cache = ResponseCache()
+
+        self.assertEqual(
+            cache.key("GET", "/", {"a": "1", "b": "2"}, {"x": "1", "y": "2"}, b"{}"),
+            cache.key("GET", "/", {"b": "2", "a": "1"}, {"y": "2", "x": "1"}, b"{}"),
+        )
+        self.assertNotEqual(
+            cache.key("GET", "/", None, None, b"{}"),
+            cache.key("GET", "/", None, {"authorization": "Basic eDp5"}, b"{}"),
+        )
+
+    def test_key_includes_ignored_statuses_and_timeout(self):
+        cache = ResponseCache()
+        key = cache.key("GET", "/", None, None, None, (404,), 10)
+
+        self.assertEqual(key, cache.key("GET", "/", None, None, None, [404], 10))
+        self.assertNotEqual(key, cache.key("GET", "/", None, None, None))
+        self.assertNotEqual(key, cache.key("GET", "/", None, None, None, (404,)))
+
+    def test_miss_is_claimed_until_released(self):
+        cache = ResponseCache()
+
+        self.assertEqual((None, True), cache.get("k"))
+        response, flight = cache.claim("k")
+        self.assertIsNone(response)
+        self.assertFalse(flight.event.is_set())
+
+        cache.set("k", "response")
+        cache.release("k")
+        self.assertTrue(flight.event.is_set())
+        self.assertEqual(("response", False), cache.get("k"))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_responses_expire_after_ttl(self):
+        cache = ResponseCache(ttl=10)
+
+        with patch("opensearchpy.cache.time.time", return_value=100):
+            cache.set("k", "response", 8)
+        with patch("opensearchpy.cache.time.time", return_value=109):
+            self.assertEqual(("response", False), cache.get("k"))
+        with patch("opensearchpy.cache.time.time", return_value=110):
+            self.assertEqual((None, True), cache.get("k"))
+        self.assertEqual(0, cache.size)
+
+    def test_least_recently_used_responses_are_evicted(self):
+        cache = ResponseCache(max_size=2, max_bytes=10)
+
+        cache.set("a", "a", 4)
+        cache.set("b", "b", 4)
+        cache.get("a")
+        cache.set("c", "c", 4)
+        self.assertEqual(["a", "c"], list(cache._entries))
+
+        cache.set("d", "d", 8)
+        self.assertEqual(["d"], list(cache._entries))
+        self.assertEqual((3, 8), (cache.evictions, cache.size))
+
+        cache.set("e", "e", 11)
+        self.assertEqual(["d"], list(cache._entries))
+
+    def test_identical_requests_wait_for_the_one_in_flight(self):
+        cache = ResponseCache()
+        self.assertEqual((None, True), cache.get("k"))
+        responses = []
+
+        thread = threading.Thread(target=lambda: responses.append(cache.get("k")))
+        thread.start()
+        thread.join(0.05)
+        self.assertEqual([], responses)
+
+        cache.release("k", "response")
+        thread.join()
+        self.assertEqual([("response", False)], responses)
+        self.assertEqual((0, 1, 1), (cache.hits, cache.misses, cache.shared))
+
+    def test_waiting_requests_share_the_error_in_flight(self):
+        cache = ResponseCache()
+        cache.get("k")
+        _, flight = cache.claim("k")
+
+        cache.release("k", error=ValueError("boom"))
+        self.assertRaises(ValueError, cache.wait_result, flight)
+
+    def test_waiting_requests_are_sent_without_an_outcome(self):
+        cache = ResponseCache()
+        cache.get("k")
+        _, flight = cache.claim("k")
+
+        cache.release("k")
+        self.assertIsNone(cache.wait_result(flight))
+        # the next request is claimed again
+        self.assertEqual((None, True), cache.get("k"))
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from opensearchpy.circuit_breaker import CircuitBreaker
+from opensearchpy.connection_pool import ConnectionPool
+
+from .test_cases import TestCase
+
+
+class TestCircuitBreaker(TestCase):
+    def setUp(self):
+        super(TestCircuitBreaker, self).setUp()
+        self.changes = []
+        self.breaker = CircuitBreaker(
+            window=4,
+            min_requests=4,
+            half_open_requests=2,
+            on_state_change=lambda *args: self.changes.append(args),
+        )
+        self.pool = ConnectionPool(
+            [(x, {}) for x in range(2)],
+            circuit_breaker=self.breaker,
+            randomize_hosts=False,
+            dead_timeout=60,
+        )
+
+    def trip(self, connection):
+        for _ in range(4):
+            self.pool.request_finished(connection, 0.1, status=503)
+
+    def test_successes_are_not_tracked(self):
+        self.pool.request_finished(0, 0.1, status=200)
+
+        self.assertEqual({}, self.breaker._circuits)
+        self.assertEqual("closed", self.breaker.get_state(0))
+
+    def test_trips_on_failure_rate(self):
+        for status in (429, 200, 200):
+            self.pool.request_finished(0, 0.1, status=status)
+        self.assertEqual("closed", self.breaker.get_state(0))
+
+        self.pool.request_finished(0, 0.1, failed=True)
+        self.assertEqual("open", self.breaker.get_state(0))
+        self.assertEqual([1], self.pool.connections)
+        self.assertEqual([(0, "closed", "open")], self.changes)
+
+    def test_ignores_other_errors(self):
+        for _ in range(4):
+            self.pool.request_finished(0, 0.1, status=404)
+
+        self.assertEqual("closed", self.breaker.get_state(0))
+        self.assertEqual([0, 1], self.pool.connections)
+
+    def test_failures_slide_out_of_window(self):
+        for status in (503, 200, 200, 200, 200):
+            self.pool.request_finished(0, 0.1, status=status)
+
+        self.assertEqual(0, self.breaker._circuits[0].failures)
+        self.assertEqual("closed", self.breaker.get_state(0))
+
+    def test_resurrected_node_gets_limited_trial_traffic(self):
+        self.trip(0)
+        self.pool.resurrect(True)
+        self.assertEqual([1, 0], self.pool.connections)
+
+        connections = []
+        for _ in range(6):
+            connection = self.pool.get_connection()
+            self.pool.request_started(connection)
+            connections.append(connection)
+
+        self.assertEqual(2, connections.count(0))
+        self.assertEqual("half_open", self.breaker.get_state(0))
+        self.assertEqual((0, "open", "half_open"), self.changes[-1])
+
+    def test_trials_are_taken_by_the_requests_sent(self):
+        self.trip(0)
+        self.pool.resurrect(True)
+
+        # connections selected but not used, e.g. for a hedge
+        for _ in range(6):
+            self.pool.get_connection()
+        self.assertEqual(0, self.breaker._circuits[0].trials)
+        self.assertTrue(self.breaker.allow_request(0))
+
+        self.pool.request_started(0)
+        self.pool.request_started(0)
+        self.assertFalse(self.breaker.allow_request(0))
+
+    def test_successful_trials_close_circuit(self):
+        self.trip(0)
+        self.pool.resurrect(True)
+        self.breaker.allow_request(0)
+
+        self.pool.request_finished(0, 0.1, status=200)
+        self.assertEqual("half_open", self.breaker.get_state(0))
+        self.pool.request_finished(0, 0.1, status=200)
+
+        self.assertEqual("closed", self.breaker.get_state(0))
+        self.assertNotIn(0, self.pool.dead_count)
+        self.assertEqual(
+            [
+                (0, "closed", "open"),
+                (0, "open", "half_open"),
+                (0, "half_open", "closed"),
+            ],
+            self.changes,
+        )
+
+    def test_failed_trial_opens_circuit_again(self):
+        self.trip(0)
+        self.pool.resurrect(True)
+        self.breaker.allow_request(0)
+
+        self.pool.request_finished(0, 0.1, status=429)
+
+        self.assertEqual("open", self.breaker.get_state(0))
+        self.assertEqual([1], self.pool.connections)
+        self.assertEqual(2, self.pool.dead_count[0])
+
+    def test_only_node_is_still_used_when_out_of_trials(self):
+        self.trip(0)
+        self.trip(1)
+        self.pool.resurrect(True)
+
+        self.assertEqual([0, 0, 0], [self.pool.get_connection() for _ in range(3)])
@@ -28,8 +28,11 @@
 
 from __future__ import unicode_literals
 
+from mock import patch
+
 from opensearchpy.client.utils import _bulk_body, _escape, _make_path, query_params
 from opensearchpy.compat import PY2
+from opensearchpy.serializer import ORJSON_AVAILABLE, JSONSerializer, OrjsonSerializer
 
 from ..test_cases import SkipTest, TestCase
 
@@ -206,3 +209,26 @@ class TestBulkBody(TestCase):
             b'"{"index":{ "_index" : "test"}}\n{"field1": "value1"}"\n',
             _bulk_body(None, bytestring_body),
         )
+
+    def test_bulk_body_as_list_is_serialized_with_trailing_newline(self):
+        self.assertEqual(
+            '{"index":{}}\n{"field1":"value1"}\n',
+            _bulk_body(JSONSerializer(), [{"index": {}}, {"field1": "value1"}]),
+        )
+
+    def test_bulk_body_as_list_is_joined_as_bytes_for_bytes_serializer(self):
+        if not ORJSON_AVAILABLE:
+            raise SkipTest("Test requires orjson to be available")
+
+        self.assertEqual(
+            b'{"index":{}}\n{"field1":"value1"}\n',
+            _bulk_body(OrjsonSerializer(), ['{"index":{}}', {"field1": "value1"}]),
+        )
+
+    @patch("opensearchpy.client.utils.BULK_STREAM_CHUNK_SIZE", 30)
+    def test_bulk_body_as_iterator_is_streamed_in_chunks(self):
+        lines = iter([{"index": {}}, {"field1": "value1"}, '{"delete":{"_id":"1"}}'])
+        self.assertEqual(
+            [b'{"index":{}}\n{"field1":"value1"}\n', b'{"delete":{"_id":"1"}}\n'],
+            list(_bulk_body(JSONSerializer(), lines)),
+        )
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+
+from opensearchpy.concurrency import ConcurrencyLimiter
+
+from .test_cases import TestCase
+
+
+class TestConcurrencyLimiter(TestCase):
+    def fill(self, limiter):
+        while limiter.try_acquire():
+            pass
+
+    def test_limits_requests_in_flight(self):
+        limiter = ConcurrencyLimiter(initial_limit=2)
+
+        self.assertEqual([True, True, False], [limiter.try_acquire() for _ in range(3)])
+        self.assertEqual(0, limiter.available())
+        limiter.release(0.1)
+        self.assertEqual(1, limiter.available())
+
+    def test_limit_grows_while_latency_is_stable(self):
+        limiter = ConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(20):
+            self.fill(limiter)
+            limiter.release(0.1)
+        self.assertGreater(limiter.limit, 20)
+
+    def test_limit_shrinks_when_latency_rises(self):
+        limiter = ConcurrencyLimiter(initial_limit=100)
+        self.fill(limiter)
+        limiter.release(0.1)
+
+        for _ in range(20):
+            self.fill(limiter)
+            limiter.release(1.0)
+        self.assertLess(limiter.limit, 50)
+
+    def test_unused_limit_does_not_grow(self):
+        limiter = ConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(20):
+            limiter.try_acquire()
+            limiter.release(0.1)
+        self.assertEqual(10, limiter.limit)
+
+    def test_rejections_shrink_limit(self):
+        limiter = ConcurrencyLimiter(initial_limit=10, min_limit=9)
+
+        limiter.try_acquire()
+        limiter.release(0.1, status=429)
+        self.assertEqual(9, limiter.limit)
+        limiter.try_acquire()
+        limiter.release(0.1, failed=True)
+        self.assertEqual(9, limiter.limit)
+
+    def test_acquire_blocks_until_release(self):
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(0.1)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+        self.assertEqual(1, limiter.in_flight)
+
+    def test_acquire_gives_up_after_timeout(self):
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        self.assertTrue(limiter.acquire(0.01))
+
+        self.assertFalse(limiter.acquire(0.01))
+        self.assertEqual(1, limiter.in_flight)
+
+    def test_cancelled_slot_leaves_limit(self):
+        limiter = ConcurrencyLimiter(initial_limit=1)
+        limiter.acquire()
+
+        limiter.cancel()
+        self.assertEqual(0, limiter.in_flight)
+        self.assertEqual(1, limiter.limit)
+        self.assertIsNone(limiter.long_latency)
@@ -36,12 +36,13 @@ import sys
 import unittest
 import uuid
 import warnings
+import zlib
 from platform import python_version
 
 import pytest
 import six
 import urllib3
-from mock import Mock, patch
+from mock import Mock, call, patch
 from requests.auth import AuthBase
 from urllib3._collections import HTTPHeaderDict
 
@@ -55,6 +56,7 @@ from opensearchpy.connection import (
 from opensearchpy.exceptions import (
     ConflictError,
     ConnectionError,
+    ImproperlyConfigured,
     NotFoundError,
     RequestError,
     TransportError,
@@ -124,6 +126,64 @@ class TestBaseConnection(TestCase):
 
         self.assertEqual([str(w.message) for w in warn], ["warning", "folded"])
 
+    def test_compress_defaults_to_gzip(self):
+        con = Connection(http_compress=True)
+        headers = {}
+        body = con._compress(b'{"query":{}}', headers)
+
+        self.assertEqual("gzip", con.http_compress)
+        self.assertEqual(9, con.http_compress_level)
+        self.assertEqual({"content-encoding": "gzip"}, headers)
+        self.assertEqual(b'{"query":{}}', gzip_decompress(body))
+
+    def test_compress_level(self):
+        body = b'{"query":{"match_all":{}}}' * 100
+        fast = Connection(http_compress=True, http_compress_level=1)
+        best = Connection(http_compress=True)
+
+        self.assertEqual(body, gzip_decompress(fast._compress(body, {})))
+        self.assertLess(len(best._compress(body, {})), len(fast._compress(body, {})))
+
+    def test_compress_deflate(self):
+        con = Connection(http_compress="deflate")
+        headers = {}
+        body = con._compress(b'{"query":{}}', headers)
+
+        self.assertEqual({"content-encoding": "deflate"}, headers)
+        self.assertEqual(b'{"query":{}}', zlib.decompress(body))
+
+    def test_compress_zstd(self):
+        try:
+            import zstandard
+        except ImportError:
+            raise SkipTest("zstandard isn't installed")
+
+        con = Connection(http_compress="zstd")
+        headers = {}
+        body = con._compress(iter([b'{"index":{}}\n', "{}\n"]), headers)
+
+        self.assertEqual({"content-encoding": "zstd"}, headers)
+        self.assertEqual(3, con.http_compress_level)
+        self.assertEqual(
+            b'{"index":{}}\n{}\n',
+            zstandard.ZstdDecompressor().decompressobj().decompress(b"".join(body)),
+        )
+
+    def test_compress_unknown_encoding_raises(self):
+        with pytest.raises(ImproperlyConfigured):
+            Connection(http_compress="br")
+
+    def test_compress_min_size(self):
+        con = Connection(http_compress=True, http_compress_min_size=1024)
+        headers = {}
+
+        self.assertEqual(b'{"query":{}}', con._compress(b'{"query":{}}', headers))
+        self.assertEqual({}, headers)
+
+        body = b"".join(con._compress(iter([b'{"index":{}}\n', b"{}\n"]), headers))
+        self.assertEqual({"content-encoding": "gzip"}, headers)
+        self.assertEqual(b'{"index":{}}\n{}\n', gzip_decompress(body))
+
     @unittest.skipIf(six.PY2, "not compatible with python2")
     def test_raises_errors(self):
         con = Connection()
@@ -137,6 +197,25 @@ class TestBaseConnection(TestCase):
         with self.assertRaises(NotFoundError):
             con._raise_error(404, "Not found", "text/plain; charset=UTF-8")
 
+    def test_requests_are_reported_to_metrics(self):
+        metrics = Mock()
+        con = Connection(metrics=metrics)
+
+        con.log_request_success("GET", "/", "/", b"{}", 200, '{"a": 1}', 0.1)
+        error = ConnectionError("N/A", "abandon ship")
+        con.log_request_fail("GET", "/", "/", None, 0.2, exception=error)
+        # a streamed response, whose size isn't known yet
+        con.log_request_success("GET", "/", "/", None, 200, None, 0.1)
+
+        self.assertEqual(
+            [
+                call(con, "GET", "/", 0.1, 200, 2, 8),
+                call(con, "GET", "/", 0.2, None, 0, 0, error),
+                call(con, "GET", "/", 0.1, 200, 0, None),
+            ],
+            metrics.connection_request.call_args_list,
+        )
+
     def test_ipv6_host_and_port(self):
         for kwargs, expected_host in [
             ({"host": "::1"}, "http://[::1]:9200"),
@@ -264,6 +343,33 @@ class TestUrllib3Connection(TestCase):
         self.assertEqual(kwargs["headers"]["accept-encoding"], "gzip,deflate")
         self.assertNotIn("content-encoding", kwargs["headers"])
 
+    def test_streamed_body_is_sent_chunked(self):
+        con = self._get_mock_connection()
+        con.perform_request("POST", "/_bulk", body=iter([b'{"index":{}}\n', b"{}\n"]))
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertTrue(kwargs["chunked"])
+        self.assertEqual([b'{"index":{}}\n', b"{}\n"], list(req_body))
+
+    def test_streamed_body_is_compressed(self):
+        con = self._get_mock_connection({"http_compress": True})
+        con.perform_request("POST", "/_bulk", body=iter([b'{"index":{}}\n', b"{}\n"]))
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertTrue(kwargs["chunked"])
+        self.assertEqual(b'{"index":{}}\n{}\n', gzip_decompress(b"".join(req_body)))
+        self.assertEqual(kwargs["headers"]["content-encoding"], "gzip")
+
+    def test_http_compression_min_size(self):
+        con = self._get_mock_connection(
+            {"http_compress": True, "http_compress_min_size": 3}
+        )
+        con.perform_request("GET", "/", body=b"{}")
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertEqual(b"{}", req_body)
+        self.assertNotIn("content-encoding", kwargs["headers"])
+
     def test_default_user_agent(self):
         con = Urllib3HttpConnection()
         self.assertEqual(
@@ -488,6 +594,14 @@ class TestUrllib3Connection(TestCase):
         status, headers, data = con.perform_request("GET", "/")
         self.assertEqual(u"你好\uda6a", data)  # fmt: skip
 
+    def test_raw_bytes_returned_without_decode_response(self):
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = self._get_mock_connection(
+            connection_params={"decode_response": False}, response_body=buf
+        )
+        status, headers, data = con.perform_request("GET", "/")
+        self.assertEqual(buf, data)
+
     @pytest.mark.skipif(
         not reraise_exceptions, reason="RecursionError isn't defined in Python <3.5"
     )
@@ -827,6 +941,65 @@ class TestRequestsConnection(TestCase):
         self.assertEqual('> {"example": "body2"}', req[0][0] % req[0][1:])
         self.assertEqual('< {"hello":"world"}', resp[0][0] % resp[0][1:])
 
+    @patch("opensearchpy.connection.base.tracer")
+    @patch("opensearchpy.connection.base.logger")
+    def test_bodies_not_formatted_when_logging_disabled(self, logger, tracer):
+        logger.isEnabledFor.return_value = False
+        tracer.isEnabledFor.return_value = False
+        con = self._get_mock_connection()
+
+        with patch.object(con, "_format_body") as format_body:
+            con.perform_request("GET", "/", body=b'{"example": "body"}')
+
+        self.assertEqual(0, format_body.call_count)
+        self.assertEqual(0, logger.debug.call_count)
+        self.assertEqual(1, logger.info.call_count)
+
+    @patch("opensearchpy.connection.base.tracer")
+    @patch("opensearchpy.connection.base.logger")
+    def test_logged_bodies_are_truncated(self, logger, tracer):
+        con = self._get_mock_connection(
+            connection_params={"max_log_body_size": 10},
+            response_body=b'{"answer": "that\'s it!"}',
+        )
+        con.perform_request("GET", "/", body=b'{"question": "what?"}')
+
+        req, resp = logger.debug.call_args_list
+        self.assertEqual('> {"question... [truncated 11 bytes]', req[0][0] % req[0][1:])
+        self.assertEqual(
+            '< {"answer":... [truncated 14 bytes]', resp[0][0] % resp[0][1:]
+        )
+        self.assertEqual(
+            "curl -H 'Content-Type: application/json' -XGET 'http://localhost:9200/?pretty' -d '{\"question... [truncated 11 bytes]'",
+            tracer.info.call_args[0][0] % tracer.info.call_args[0][1:],
+        )
+
+    def test_logged_text_is_truncated_in_bytes(self):
+        con = self._get_mock_connection(connection_params={"max_log_body_size": 4})
+
+        self.assertEqual("\u00e9\u00e9", con._format_body("\u00e9\u00e9"))
+        self.assertEqual(
+            "\u00e9\u00e9... [truncated 2 bytes]",
+            con._format_body("\u00e9\u00e9\u00e9"),
+        )
+        self.assertEqual(
+            "\u00e9\u00e9... [truncated 2 bytes]",
+            con._format_body("\u00e9\u00e9\u00e9".encode("utf-8")),
+        )
+
+    @patch("opensearchpy.connection.base.tracer")
+    @patch("opensearchpy.connection.base.logger")
+    def test_bodies_formatted_once_for_both_loggers(self, logger, tracer):
+        con = self._get_mock_connection()
+
+        with patch.object(con, "_format_body", side_effect=lambda b, *a: b) as fmt:
+            con.perform_request("GET", "/", body=b'{"example": "body"}')
+
+        self.assertEqual(2, fmt.call_count)
+        self.assertEqual(2, logger.debug.call_count)
+        self.assertEqual(1, tracer.info.call_count)
+        self.assertEqual(1, tracer.debug.call_count)
+
     def test_defaults(self):
         con = self._get_mock_connection()
         request = self._get_request(con, "GET", "/")
@@ -853,6 +1026,14 @@ class TestRequestsConnection(TestCase):
         self.assertEqual("GET", request.method)
         self.assertEqual('{"answer": 42}'.encode("utf-8"), request.body)
 
+    def test_streamed_body_is_sent_chunked(self):
+        con = self._get_mock_connection()
+        con.perform_request("POST", "/_bulk", body=iter([b'{"index":{}}\n', b"{}\n"]))
+
+        request = con.session.send.call_args[0][0]
+        self.assertEqual("chunked", request.headers["transfer-encoding"])
+        self.assertEqual([b'{"index":{}}\n', b"{}\n"], list(request.body))
+
     def test_http_auth_attached(self):
         con = self._get_mock_connection({"http_auth": "username:secret"})
         request = self._get_request(con, "GET", "/")
@@ -883,6 +1064,14 @@ class TestRequestsConnection(TestCase):
         status, headers, data = con.perform_request("GET", "/")
         self.assertEqual(u"你好\uda6a", data)  # fmt: skip
 
+    def test_raw_bytes_returned_without_decode_response(self):
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = self._get_mock_connection(
+            connection_params={"decode_response": False}, response_body=buf
+        )
+        status, headers, data = con.perform_request("GET", "/")
+        self.assertEqual(buf, data)
+
     @pytest.mark.skipif(
         not reraise_exceptions, reason="RecursionError isn't defined in Python <3.5"
     )
@@ -1058,6 +1247,26 @@ class TestConnectionHttpServer:
         with pytest.raises(ConnectionError):
             conn.perform_request("GET", "/")
 
+    def test_urllib3_stream_request(self):
+        conn = Urllib3HttpConnection("localhost", port=8080, use_ssl=False, timeout=60)
+        status, _, stream = conn.perform_stream_request("GET", "/")
+        try:
+            data = json.loads(b"".join(iter(lambda: stream.read(16), b"")))
+        finally:
+            stream.close()
+        assert status == 200
+        assert data["method"] == "GET"
+
+    def test_requests_stream_request(self):
+        conn = RequestsHttpConnection("localhost", port=8080, use_ssl=False, timeout=60)
+        status, _, stream = conn.perform_stream_request("GET", "/")
+        try:
+            data = json.loads(b"".join(iter(lambda: stream.read(16), b"")))
+        finally:
+            stream.close()
+        assert status == 200
+        assert data["method"] == "GET"
+
 
 @pytest.mark.skipif(
     sys.version_info < (3, 0),
@@ -25,13 +25,18 @@
 #  under the License.
 
 
+import threading
 import time
 
+from mock import patch
+
 from opensearchpy.connection import Connection
 from opensearchpy.connection_pool import (
     ConnectionPool,
     DummyConnectionPool,
+    LatencySelector,
     RoundRobinSelector,
+    ZoneAwareSelector,
 )
 from opensearchpy.exceptions import ImproperlyConfigured
 
@@ -165,3 +170,218 @@ class TestConnectionPool(TestCase):
         self.assertEqual(3, pool.dead_count[42])
         pool.mark_live(42)
         self.assertNotIn(42, pool.dead_count)
+
+    def test_live_connections_are_replaced_not_modified(self):
+        pool = ConnectionPool([(x, {}) for x in range(3)], randomize_hosts=False)
+        connections = pool.connections
+
+        pool.mark_dead(1)
+        self.assertEqual([0, 1, 2], connections)
+        self.assertEqual([0, 2], pool.connections)
+
+        connections = pool.connections
+        pool.resurrect(force=True)
+        self.assertEqual([0, 2], connections)
+        self.assertEqual([0, 2, 1], pool.connections)
+
+    def test_dead_connections_are_not_checked_before_their_timeout(self):
+        pool = ConnectionPool([(x, {}) for x in range(3)])
+        now = time.time()
+        pool.mark_dead(0, now=now + 10)
+        pool.mark_dead(1, now=now)
+        self.assertEqual(now + 60, pool._next_resurrection)
+
+        with patch.object(pool, "resurrect") as resurrect:
+            self.assertEqual(2, pool.get_connection())
+        resurrect.assert_not_called()
+
+    def test_next_resurrection_follows_dead_connections(self):
+        pool = ConnectionPool([(x, {}) for x in range(3)])
+        now = time.time()
+        pool.mark_dead(0, now=now - 70)
+        pool.mark_dead(1, now=now - 61)
+
+        pool.get_connection()
+        self.assertEqual(now - 1, pool._next_resurrection)
+        pool.get_connection()
+        self.assertEqual(float("inf"), pool._next_resurrection)
+        self.assertEqual(3, len(pool.connections))
+
+    def test_connections_marked_dead_from_threads_are_removed_once(self):
+        pool = ConnectionPool([(x, {}) for x in range(100)])
+        threads = [
+            threading.Thread(target=pool.mark_dead, args=(x % 50,)) for x in range(100)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(list(range(50, 100)), sorted(pool.connections))
+        self.assertEqual(50, pool.dead.qsize())
+        self.assertEqual({1}, set(pool.dead_count.values()))
+
+    def test_dead_connections_wait_for_health_check(self):
+        pool = ConnectionPool([(x, {}) for x in range(2)], health_check=True)
+        now = time.time()
+        pool.mark_dead(0, now=now - 61)
+
+        self.assertEqual([1, 1], [pool.get_connection(), pool.get_connection()])
+        self.assertEqual([0], pool.get_dead_connections())
+        self.assertEqual([], pool.get_dead_connections(now=now - 10))
+
+    def test_connection_passing_health_check_is_resurrected(self):
+        pool = ConnectionPool([(x, {}) for x in range(2)], health_check=True)
+        pool.mark_dead(0, now=time.time() - 61)
+
+        pool.health_check_passed(0)
+        self.assertEqual([1, 0], pool.connections[-2:])
+        self.assertNotIn(0, pool.dead_count)
+        self.assertTrue(pool.dead.empty())
+        self.assertEqual([], pool.get_dead_connections())
+
+        # no longer dead, nothing to do
+        pool.health_check_passed(0)
+        self.assertEqual(2, len(pool.connections))
+
+    def test_connection_failing_health_check_gets_longer_timeout(self):
+        pool = ConnectionPool([(x, {}) for x in range(2)], health_check=True)
+        now = time.time()
+        pool.mark_dead(0, now=now - 61)
+
+        pool.health_check_failed(0, now=now)
+        self.assertEqual([1], pool.connections)
+        self.assertEqual(2, pool.dead_count[0])
+        self.assertEqual((now + 120, 0), pool.dead.get())
+
+
+class TestLatencySelector(TestCase):
+    def test_unmeasured_connections_are_preferred(self):
+        selector = LatencySelector({1: {}, 2: {}}, choices=None)
+        selector.request_started(1)
+        selector.request_finished(1, 0.5)
+
+        self.assertEqual(2, selector.select([1, 2]))
+
+    def test_faster_connection_is_selected(self):
+        selector = LatencySelector({1: {}, 2: {}}, choices=None)
+        for conn, duration in ((1, 0.5), (2, 0.1)):
+            selector.request_started(conn)
+            selector.request_finished(conn, duration)
+
+        self.assertEqual(2, selector.select([1, 2]))
+        self.assertEqual((0.0, 0), selector.cost(3))
+
+    def test_requests_in_flight_increase_cost(self):
+        selector = LatencySelector({1: {}, 2: {}}, choices=None)
+        for conn, duration in ((1, 0.2), (2, 0.1)):
+            selector.request_started(conn)
+            selector.request_finished(conn, duration)
+        selector.request_started(2)
+        selector.request_started(2)
+
+        self.assertEqual(1, selector.select([1, 2]))
+        selector.request_finished(2, 0.1)
+        selector.request_finished(2, 0.1)
+        self.assertEqual(2, selector.select([1, 2]))
+
+    def test_latency_is_averaged(self):
+        selector = LatencySelector({1: {}}, decay=0.5)
+        with patch("time.time", return_value=100.0):
+            selector.request_started(1)
+            selector.request_finished(1, 1.0)
+            selector.request_started(1)
+            selector.request_finished(1, 3.0)
+
+        self.assertEqual([2.0, 0, 100.0], selector.stats[1])
+
+    def test_failure_is_penalized(self):
+        selector = LatencySelector({1: {}}, failure_penalty=5.0)
+        selector.request_started(1)
+        selector.request_finished(1, 0.1, failed=True)
+
+        self.assertEqual([5.0, 0], selector.stats[1][:2])
+
+    def test_latency_decays_without_responses(self):
+        selector = LatencySelector({1: {}, 2: {}}, choices=None)
+        with patch("time.time", return_value=100.0):
+            selector.request_started(1)
+            selector.request_finished(1, 0.1, failed=True)
+        for now in range(100, 181):
+            with patch("time.time", return_value=float(now)):
+                selector.request_started(2)
+                selector.request_finished(2, 0.1)
+                if now == 100:
+                    self.assertEqual(2, selector.select([1, 2]))
+
+        # the failed node gets probed again
+        with patch("time.time", return_value=180.0):
+            self.assertEqual(1, selector.select([1, 2]))
+
+    def test_connections_not_in_the_pool_are_not_tracked(self):
+        selector = LatencySelector({1: {}})
+        selector.request_started(2)
+        selector.request_finished(2, 0.1)
+
+        self.assertEqual({}, selector.stats)
+
+    def test_only_sampled_connections_are_considered(self):
+        selector = LatencySelector({}, choices=2)
+        for _ in range(20):
+            self.assertIn(selector.select(list(range(10))), range(10))
+
+    def test_pool_forwards_request_feedback_to_selector(self):
+        pool = ConnectionPool(
+            [(x, {}) for x in range(2)], selector_class=LatencySelector
+        )
+        pool.request_started(0)
+        self.assertEqual(1, pool.selector.stats[0][1])
+        pool.request_finished(0, 0.2)
+        self.assertEqual([0.2, 0], pool.selector.stats[0][:2])
+
+    def test_dummy_pool_ignores_request_feedback(self):
+        pool = DummyConnectionPool([(1, {})])
+        pool.request_started(1)
+        pool.request_finished(1, 0.2, failed=True)
+
+
+class TestZoneAwareSelector(TestCase):
+    opts = {
+        1: {"attributes": {"zone": "a"}},
+        2: {"attributes": {"zone": "b"}},
+        3: {"attributes": {"zone": "a"}},
+        4: {},
+    }
+
+    def test_local_connections_are_preferred(self):
+        selector = ZoneAwareSelector(self.opts, zone="a")
+
+        self.assertEqual(
+            [1, 3, 1, 3], [selector.select([1, 2, 3, 4]) for _ in range(4)]
+        )
+        self.assertEqual(3, selector.select([2, 3, 4]))
+
+    def test_remote_connections_are_used_when_no_local_is_live(self):
+        selector = ZoneAwareSelector(self.opts, zone="a")
+
+        self.assertEqual([2, 4], [selector.select([2, 4]) for _ in range(2)])
+
+    def test_all_connections_are_local_without_zone(self):
+        selector = ZoneAwareSelector(self.opts)
+
+        self.assertEqual(
+            [1, 2, 3, 4], [selector.select([1, 2, 3, 4]) for _ in range(4)]
+        )
+
+    def test_custom_attribute_and_selector(self):
+        opts = {1: {"attributes": {"rack": "r1"}}, 2: {"attributes": {"rack": "r2"}}}
+        selector = ZoneAwareSelector(
+            opts, zone="r2", attribute="rack", selector_class=LatencySelector
+        )
+        self.assertIsInstance(selector.selector, LatencySelector)
+        self.assertEqual(2, selector.select([1, 2]))
+
+        selector.request_started(1)
+        self.assertEqual(1, selector.selector.stats[1][1])
+        selector.request_finished(1, 0.1)
+        self.assertEqual([0.1, 0], selector.selector.stats[1][:2])
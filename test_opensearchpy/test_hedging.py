@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import threading
+import time
+
+from opensearchpy.compat import copy_context
+from opensearchpy.hedging import RequestHedging, _Workers
+
+from .test_cases import SkipTest, TestCase
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
+
+class TestRequestHedging(TestCase):
+    def test_read_requests_are_hedgeable(self):
+        hedging = RequestHedging()
+
+        for method, url in (
+            ("GET", "/index/_doc/1"),
+            ("HEAD", "/index"),
+            ("POST", "/index/_search"),
+            ("POST", "/_msearch"),
+            ("POST", "/index/_count?q=x"),
+            ("POST", "/_mget"),
+            ("POST", "/index/_search/template"),
+        ):
+            self.assertTrue(hedging.is_hedgeable(method, url), url)
+
+    def test_writes_and_scrolls_are_not_hedgeable(self):
+        hedging = RequestHedging()
+
+        for method, url, params in (
+            ("PUT", "/index/_doc/1", None),
+            ("POST", "/index/_doc", None),
+            ("POST", "/index/_doc/_search", None),
+            ("POST", "/index/_doc/template", None),
+            ("DELETE", "/index", None),
+            ("POST", "/_search/scroll", None),
+            ("GET", "/_search/scroll/abc", None),
+            ("POST", "/index/_search", {"scroll": "5m"}),
+        ):
+            self.assertFalse(hedging.is_hedgeable(method, url, params), url)
+
+    def test_delay_is_percentile_of_recorded_latencies(self):
+        hedging = RequestHedging(percentile=90, window=100, min_samples=10)
+
+        for i in range(9):
+            hedging.record(i / 100.0)
+        self.assertIsNone(hedging.get_delay())
+
+        hedging.record(0.09)
+        self.assertEqual(0.09, hedging.get_delay())
+
+        # only refreshed every window / 20 latencies
+        for _ in range(4):
+            hedging.record(1.0)
+        self.assertEqual(0.09, hedging.get_delay())
+        hedging.record(1.0)
+        self.assertEqual(1.0, hedging.get_delay())
+
+    def test_delay_has_minimum(self):
+        hedging = RequestHedging(min_samples=1, min_delay=0.05)
+
+        hedging.record(0.001)
+        self.assertEqual(0.05, hedging.get_delay())
+
+    def test_hedges_are_limited_by_budget(self):
+        hedging = RequestHedging(budget=0.25, max_burst=2)
+
+        hedged = 0
+        for _ in range(100):
+            hedging.get_delay()
+            if hedging.acquire():
+                hedged += 1
+        self.assertEqual(25, hedged)
+
+        for _ in range(100):
+            hedging.get_delay()
+        self.assertTrue(hedging.acquire())
+        self.assertTrue(hedging.acquire())
+        self.assertFalse(hedging.acquire())
+
+
+class TestWorkers(TestCase):
+    def _run(self, workers, fn):
+        done = threading.Event()
+        results = []
+
+        def task():
+            results.append(fn())
+            done.set()
+
+        workers.submit(task)
+        done.wait(1)
+        return results[0]
+
+    def test_idle_threads_are_reused(self):
+        workers = _Workers()
+
+        first = self._run(workers, threading.current_thread)
+        # wait for the thread to be idle again
+        while not workers._idle:
+            time.sleep(0.001)
+        self.assertIs(first, self._run(workers, threading.current_thread))
+        self.assertIsNot(threading.current_thread(), first)
+
+    def test_idle_threads_exit(self):
+        workers = _Workers(idle_timeout=0.01)
+
+        thread = self._run(workers, threading.current_thread)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([], workers._idle)
+
+    def test_tasks_wait_for_a_thread_over_max_workers(self):
+        workers = _Workers(max_workers=1)
+        blocked = threading.Event()
+        done = threading.Event()
+
+        workers.submit(blocked.wait, 1)
+        workers.submit(done.set)
+        self.assertFalse(done.wait(0.05))
+        self.assertEqual(1, workers._threads)
+        blocked.set()
+        self.assertTrue(done.wait(1))
+        self.assertEqual(1, workers._threads)
+
+    def test_tasks_run_in_the_context_of_the_caller(self):
+        if copy_context is None:
+            raise SkipTest("contextvars isn't available")
+        var = ContextVar("var", default=None)
+        workers = _Workers()
+
+        var.set("caller")
+        self.assertEqual("caller", self._run(workers, var.get))
@@ -26,16 +26,20 @@
 #  under the License.
 
 
+import io
+import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import ThreadPool
 
 import mock
 import pytest
 
-from opensearchpy import OpenSearch, helpers
-from opensearchpy.serializer import JSONSerializer
+from opensearchpy import OpenSearch, TransportError, helpers
+from opensearchpy.serializer import ORJSON_AVAILABLE, JSONSerializer, OrjsonSerializer
 
-from ..test_cases import TestCase
+from ..test_cases import SkipTest, TestCase
 
 lock_side_effect = threading.Lock()
 
@@ -66,6 +70,88 @@ class TestParallelBulk(TestCase):
 
         self.assertEqual(50, mock_process_bulk_chunk.call_count)
 
+    @mock.patch(
+        "opensearchpy.helpers.actions._process_bulk_chunk",
+        side_effect=lambda client, bulk_actions, bulk_data, **kwargs: [
+            (True, line) for line in bulk_actions[1::2]
+        ],
+    )
+    def test_chunks_serialized_in_processes_are_sent_in_order(
+        self, _process_bulk_chunk
+    ):
+        actions = ({"x": i} for i in range(100))
+        results = list(
+            helpers.parallel_bulk(
+                OpenSearch(), actions, chunk_size=2, queue_size=2, process_count=2
+            )
+        )
+
+        self.assertEqual(50, _process_bulk_chunk.call_count)
+        self.assertEqual(
+            [(True, ('{"x":%d}' % i).encode("utf-8")) for i in range(100)], results
+        )
+
+    @mock.patch(
+        "opensearchpy.helpers.actions._process_bulk_chunk",
+        side_effect=lambda client, bulk_actions, bulk_data, **kwargs: [
+            (True, len(bulk_data))
+        ],
+    )
+    def test_chunks_serialized_in_processes_span_batches(self, _process_bulk_chunk):
+        # 3 actions per chunk, batches of 10 actions don't leave a small chunk
+        kwargs = {"chunk_size": 10, "max_chunk_bytes": 66, "queue_size": 2}
+        sizes = [
+            size
+            for _, size in helpers.parallel_bulk(
+                OpenSearch(), ({"x": i} for i in range(100)), **kwargs
+            )
+        ]
+        self.assertEqual([3] * 33 + [1], sizes)
+
+        sizes = [
+            size
+            for _, size in helpers.parallel_bulk(
+                OpenSearch(), ({"x": i} for i in range(100)), process_count=2, **kwargs
+            )
+        ]
+        self.assertEqual([3] * 33 + [1], sizes)
+
+    @mock.patch(
+        "opensearchpy.helpers.actions._process_bulk_chunk",
+        side_effect=lambda client, bulk_actions, bulk_data, **kwargs: [
+            (True, line) for line in bulk_actions[1::2]
+        ],
+    )
+    def test_actions_serialized_in_caller_pool(self, _process_bulk_chunk):
+        expected = [(True, ('{"x":%d}' % i).encode("utf-8")) for i in range(10)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for pool in (executor, ThreadPool(2)):
+                results = list(
+                    helpers.parallel_bulk(
+                        OpenSearch(),
+                        ({"x": i} for i in range(10)),
+                        chunk_size=2,
+                        process_pool=pool,
+                    )
+                )
+                self.assertEqual(expected, results)
+                # the pool is left open for the next calls
+                self.assertEqual(1, len(list(pool.map(len, ["x"]))))
+            pool.terminate()
+
+    @mock.patch("multiprocessing.pool.Pool")
+    @mock.patch(
+        "opensearchpy.helpers.actions._chunk_actions_in_processes",
+        side_effect=ValueError,
+    )
+    def test_process_pool_is_terminated_on_error(self, _chunk_actions, Pool):
+        with self.assertRaises(ValueError):
+            list(helpers.parallel_bulk(OpenSearch(), [{"x": 1}], process_count=2))
+
+        Pool.return_value.terminate.assert_called_once_with()
+        Pool.return_value.join.assert_called_once_with()
+
     @pytest.mark.skip
     @mock.patch(
         "opensearchpy.helpers.actions._process_bulk_chunk",
@@ -209,11 +295,322 @@ class TestChunkActions(TestCase):
         )
         self.assertEqual(25, len(chunks))
         for chunk_data, chunk_actions in chunks:
-            chunk = u"".join(chunk_actions)  # fmt: skip
-            chunk = chunk if isinstance(chunk, str) else chunk.encode("utf-8")
+            chunk = helpers.actions._bulk_lines_body(chunk_actions)
+            self.assertLessEqual(len(chunk), max_byte_size)
+
+    def test_chunks_are_serialized_to_bytes_once(self):
+        actions = [({"index": {}}, {"some": u"d\u00e1t\u00e1"})] * 2  # fmt: skip
+        chunks = list(
+            helpers._chunk_actions(actions, 100000, 99999999, JSONSerializer())
+        )
+        self.assertEqual(1, len(chunks))
+        chunk_data, chunk_actions = chunks[0]
+        for line in chunk_actions:
+            self.assertIsInstance(line, bytes)
+
+        body = helpers.actions._bulk_lines_body(chunk_actions)
+        self.assertEqual(
+            b'{"index":{}}\n{"some":"d\xc3\xa1t\xc3\xa1"}\n' * 2,
+            body,
+        )
+
+    def test_chunks_are_chopped_by_byte_size_with_bytes_serializer(self):
+        if not ORJSON_AVAILABLE:
+            raise SkipTest("Test requires orjson to be available")
+
+        max_byte_size = 170
+        chunks = list(
+            helpers._chunk_actions(
+                self.actions, 100000, max_byte_size, OrjsonSerializer()
+            )
+        )
+        self.assertEqual(25, len(chunks))
+        for chunk_data, chunk_actions in chunks:
+            chunk = helpers.actions._bulk_lines_body(chunk_actions)
+            self.assertIsInstance(chunk, bytes)
             self.assertLessEqual(len(chunk), max_byte_size)
 
 
+class TestAdaptiveChunkSize(TestCase):
+    lines = [b'{"index":{}}', b'{"a":1}'] * 10
+    data = [({"index": {}}, {"a": 1})] * 10
+
+    def ok_response(self, took=10):
+        return {"took": took, "items": [{"index": {"status": 201}}] * 10}
+
+    def test_grows_additively_after_fast_responses(self):
+        sizer = helpers.AdaptiveChunkSize(
+            chunk_size=10, max_chunk_bytes=1000, increase_step=5
+        )
+        sizer.observe_response(self.ok_response(), self.lines, self.data, 0.5)
+        self.assertEqual(15, sizer.chunk_size)
+        self.assertEqual(1000, sizer.max_chunk_bytes)
+
+        sizer = helpers.AdaptiveChunkSize(
+            chunk_size=10, max_chunk_bytes=2000, min_chunk_bytes=100
+        )
+        sizer.max_chunk_bytes = 200
+        sizer.observe_response(self.ok_response(), self.lines, self.data, 0.5)
+        # 21 bytes per doc times the increase_step of 50 docs
+        self.assertEqual(1250, sizer.max_chunk_bytes)
+
+    def test_shrinks_multiplicatively_when_documents_are_rejected(self):
+        sizer = helpers.AdaptiveChunkSize(
+            chunk_size=100, max_chunk_bytes=1000, min_chunk_bytes=10
+        )
+        resp = self.ok_response()
+        resp["items"][3] = {
+            "index": {
+                "status": 429,
+                "error": {"type": "es_rejected_execution_exception"},
+            }
+        }
+        sizer.observe_response(resp, self.lines, self.data, 0.01)
+        self.assertEqual(50, sizer.chunk_size)
+        # halved from the size of the chunk that was sent, not from the limit
+        self.assertEqual(105, sizer.max_chunk_bytes)
+
+    def test_shrinks_when_server_took_longer_than_target(self):
+        sizer = helpers.AdaptiveChunkSize(chunk_size=100, target_latency=1.0)
+        sizer.observe_response(self.ok_response(took=1500), self.lines, self.data, 0)
+        self.assertEqual(50, sizer.chunk_size)
+
+        # client side latency is only used without took
+        resp = self.ok_response()
+        del resp["took"]
+        sizer.observe_response(resp, self.lines, self.data, 2.0)
+        self.assertEqual(25, sizer.chunk_size)
+
+    def test_shrinks_on_rejected_request_but_not_on_other_errors(self):
+        sizer = helpers.AdaptiveChunkSize(chunk_size=100)
+        sizer.observe_error(TransportError(500, "Error"), self.lines, self.data)
+        self.assertEqual(100, sizer.chunk_size)
+        sizer.observe_error(TransportError(429, "Rejected"), self.lines, self.data)
+        self.assertEqual(50, sizer.chunk_size)
+
+    def test_stays_within_bounds(self):
+        sizer = helpers.AdaptiveChunkSize(
+            chunk_size=10, min_chunk_size=4, max_chunk_size=12, increase_step=5
+        )
+        sizer.observe_response(self.ok_response(), self.lines, self.data, 0)
+        self.assertEqual(12, sizer.chunk_size)
+        for _ in range(3):
+            sizer.observe_error(TransportError(429, "Rejected"), self.lines, self.data)
+        self.assertEqual(4, sizer.chunk_size)
+        self.assertEqual(1024 * 1024, sizer.max_chunk_bytes)
+
+    def test_streaming_bulk_adapts_chunk_sizes(self):
+        client = mock.Mock()
+        client.transport.serializer = JSONSerializer()
+        sent = []
+
+        def bulk(body, *args, **kwargs):
+            count = body.count(b"\n") // 2
+            sent.append(count)
+            return {
+                "took": 1,
+                "items": [{"index": {"status": 429}} for _ in range(count)],
+            }
+
+        client.bulk.side_effect = bulk
+        sizer = helpers.AdaptiveChunkSize(chunk_size=10, min_chunk_size=2)
+        list(
+            helpers.streaming_bulk(
+                client,
+                ({"x": i} for i in range(30)),
+                raise_on_error=False,
+                adaptive_chunking=sizer,
+            )
+        )
+        self.assertEqual([10, 5, 2, 2, 2, 2, 2, 2, 2, 1], sent)
+
+
+class TestScanPrefetch(TestCase):
+    def setup_method(self, _):
+        self.client = mock.Mock()
+        self.client.search.return_value = self.page(0)
+        self.client.scroll.side_effect = [self.page(1), self.page(2), self.page(3)]
+
+    def page(self, number):
+        # three pages of two hits, then an empty one
+        return {
+            "_scroll_id": "scroll-%d" % number,
+            "_shards": {"total": 1, "successful": 1},
+            "hits": {
+                "hits": (
+                    [{"_id": "%d-%d" % (number, i)} for i in range(2)]
+                    if number < 3
+                    else []
+                )
+            },
+        }
+
+    def test_next_pages_are_fetched_while_consuming(self):
+        hits = helpers.scan(self.client, index="test-index", prefetch=2)
+        self.assertEqual("0-0", next(hits)["_id"])
+
+        # the consumer is still on the first page
+        for _ in range(100):
+            if self.client.scroll.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(2, self.client.scroll.call_count)
+
+        self.assertEqual(
+            ["0-1", "1-0", "1-1", "2-0", "2-1"], [hit["_id"] for hit in hits]
+        )
+        self.assertEqual(3, self.client.scroll.call_count)
+        self.client.scroll.assert_called_with(
+            body={"scroll_id": "scroll-2", "scroll": "5m"}
+        )
+        self.client.clear_scroll.assert_called_once_with(
+            body={"scroll_id": ["scroll-3"]}, ignore=(404,)
+        )
+
+    def test_scroll_is_cleared_when_iteration_stops_early(self):
+        hits = helpers.scan(self.client, index="test-index", prefetch=1)
+        next(hits)
+        hits.close()
+
+        self.assertTrue(self.client.scroll.call_count <= 2)
+        self.client.clear_scroll.assert_called_once_with(
+            body={"scroll_id": ["scroll-%d" % self.client.scroll.call_count]},
+            ignore=(404,),
+        )
+
+    def test_scroll_errors_are_raised(self):
+        self.client.scroll.side_effect = TransportError(500, "Error")
+        with self.assertRaises(TransportError):
+            list(helpers.scan(self.client, index="test-index", prefetch=1))
+        self.client.clear_scroll.assert_called_once_with(
+            body={"scroll_id": ["scroll-0"]}, ignore=(404,)
+        )
+
+
+class TestStreamHits(TestCase):
+    def setup_method(self, _):
+        try:
+            import ijson  # noqa: F401
+        except ImportError:
+            raise SkipTest("ijson isn't installed")
+
+        self.response = {
+            "took": 3,
+            "hits": {
+                "total": {"value": 3, "relation": "eq"},
+                "hits": [
+                    {"_id": str(i), "_score": 1.5, "_source": {"n": i}}
+                    for i in range(3)
+                ],
+            },
+            "aggregations": {"max_n": {"value": 2.0}},
+        }
+        self.stream = io.BytesIO(json.dumps(self.response).encode("utf-8"))
+        self.client = mock.Mock()
+        self.client.transport.perform_stream_request.return_value = self.stream
+
+    def test_hits_are_parsed_from_the_stream(self):
+        hits = helpers.stream_hits(
+            self.client,
+            query={"query": {"match_all": {}}},
+            index=["logs-1", "logs-2"],
+            size=3,
+            request_timeout=10,
+        )
+
+        self.assertEqual(self.response["hits"]["hits"], list(hits))
+        self.assertTrue(self.stream.closed)
+        self.client.transport.perform_stream_request.assert_called_once_with(
+            "POST",
+            "/logs-1,logs-2/_search",
+            params={"size": "3", "request_timeout": 10},
+            headers={},
+            body={"query": {"match_all": {}}},
+        )
+
+    def test_stream_is_closed_when_iteration_stops_early(self):
+        hits = helpers.stream_hits(self.client, index="logs")
+        self.assertEqual("0", next(hits)["_id"])
+        hits.close()
+
+        self.assertTrue(self.stream.closed)
+
+
+class TestParallelScan(TestCase):
+    def setup_method(self, _):
+        self.client = mock.Mock()
+        self.client.create_pit.return_value = {"pit_id": "pit", "_shards": {"total": 3}}
+        self.client.search.side_effect = self.search
+        self.failed_shards = 0
+
+    def search(self, body, **kwargs):
+        # five docs in every slice, paged by search_after on _doc
+        slice_id = body["slice"]["id"]
+        start = body.get("search_after", [0])[0]
+        docs = list(range(start + 1, 6))[: body["size"]]
+        return {
+            "pit_id": body["pit"]["id"],
+            "_shards": {"total": 1, "successful": 1 - self.failed_shards},
+            "hits": {
+                "hits": [
+                    {"_id": "%d-%d" % (slice_id, doc), "sort": [doc]} for doc in docs
+                ]
+            },
+        }
+
+    def test_all_slices_are_scanned_and_pit_deleted(self):
+        progress = []
+        hits = list(
+            helpers.parallel_scan(
+                self.client,
+                "test-index",
+                query={"query": {"match_all": {}}},
+                size=2,
+                progress_callback=lambda *args: progress.append(args),
+            )
+        )
+
+        self.assertEqual(
+            sorted("%d-%d" % (s, d) for s in range(3) for d in range(1, 6)),
+            sorted(hit["_id"] for hit in hits),
+        )
+        self.client.create_pit.assert_called_once_with(
+            index="test-index", keep_alive="5m"
+        )
+        self.assertEqual(9, self.client.search.call_count)
+        body = self.client.search.call_args_list[0][1]["body"]
+        self.assertEqual({"match_all": {}}, body["query"])
+        self.assertEqual(["_doc"], body["sort"])
+        self.assertEqual(3, body["slice"]["max"])
+        self.assertEqual(
+            [(0, 5, True), (1, 5, True), (2, 5, True)],
+            sorted(p for p in progress if p[2]),
+        )
+        self.client.delete_pit.assert_called_once_with(
+            body={"pit_id": ["pit"]}, ignore=(404,)
+        )
+
+    def test_pit_is_deleted_when_iteration_stops_early(self):
+        hits = helpers.parallel_scan(
+            self.client, "test-index", slices=2, thread_count=2, size=1
+        )
+        next(hits)
+        hits.close()
+
+        self.client.delete_pit.assert_called_once_with(
+            body={"pit_id": ["pit"]}, ignore=(404,)
+        )
+
+    def test_shard_failures_raise_and_delete_pit(self):
+        self.failed_shards = 1
+        with self.assertRaises(helpers.ScanError):
+            list(helpers.parallel_scan(self.client, "test-index", size=2))
+
+        self.client.delete_pit.assert_called_once_with(
+            body={"pit_id": ["pit"]}, ignore=(404,)
+        )
+
+
 class TestExpandActions(TestCase):
     def test_string_actions_are_marked_as_simple_inserts(self):
         self.assertEqual(
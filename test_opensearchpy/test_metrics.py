@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from mock import Mock
+
+from opensearchpy.connection_pool import ConnectionPool
+from opensearchpy.metrics import Histogram, HistogramCollector
+
+from .test_cases import TestCase
+
+
+class TestHistogram(TestCase):
+    def test_percentiles_are_within_bucket_growth(self):
+        histogram = Histogram()
+        for i in range(1, 101):
+            histogram.record(i / 100.0)
+
+        self.assertEqual(100, histogram.count)
+        self.assertTrue(0.5 <= histogram.percentile(50) <= 0.5 * 1.1)
+        self.assertTrue(0.99 <= histogram.percentile(99) <= 1.0)
+        self.assertEqual(1.0, histogram.percentile(100))
+
+    def test_empty_histogram_has_no_percentiles(self):
+        self.assertEqual(
+            {"count": 0, "p50": None, "p99": None, "max": 0.0}, Histogram().summary()
+        )
+
+
+class TestHistogramCollector(TestCase):
+    def test_endpoint_replaces_index_and_id(self):
+        metrics = HistogramCollector()
+
+        self.assertEqual("GET /", metrics.endpoint("GET", "/"))
+        self.assertEqual("GET /_cat/indices", metrics.endpoint("GET", "/_cat/indices"))
+        self.assertEqual(
+            "POST /{index}/_search", metrics.endpoint("POST", "/logs-1/_search?q=a")
+        )
+        self.assertEqual(
+            "PUT /{index}/_doc/{id}", metrics.endpoint("PUT", "/logs-1/_doc/42")
+        )
+
+    def test_exports_p50_and_p99_per_endpoint_and_node(self):
+        metrics = HistogramCollector()
+        node = Mock(host="http://node1:9200")
+        for i in range(1, 101):
+            metrics.request_started("GET", "/i/_search")
+            metrics.connection_request(node, "GET", "/i/_search", i / 1000.0, 200, 2, 5)
+            metrics.request_finished("GET", "/i/_search", i / 1000.0, 200)
+
+        exported = metrics.export()
+        self.assertEqual(100, exported["requests"])
+        self.assertEqual(200, exported["bytes_sent"])
+        self.assertEqual(500, exported["bytes_received"])
+        endpoint = exported["endpoints"]["GET /{index}/_search"]
+        self.assertEqual(100, endpoint["count"])
+        self.assertTrue(0.05 <= endpoint["p50"] <= 0.055)
+        self.assertTrue(0.099 <= endpoint["p99"] <= 0.1)
+        self.assertEqual(endpoint, exported["nodes"]["http://node1:9200"])
+
+    def test_streamed_responses_are_not_counted_as_received(self):
+        metrics = HistogramCollector()
+        node = Mock(host="http://node1:9200")
+
+        metrics.connection_request(node, "GET", "/", 0.1, 200, 2, None)
+        metrics.connection_request(node, "GET", "/", 0.1, 200, 2, 5)
+        self.assertEqual(5, metrics.export()["bytes_received"])
+
+    def test_connection_pool_reports_dead_and_resurrected_connections(self):
+        metrics = HistogramCollector()
+        pool = ConnectionPool([(x, {}) for x in range(2)], metrics=metrics)
+        self.assertEqual((2, 0), (metrics.live_connections, metrics.dead_connections))
+
+        pool.mark_dead(0)
+        self.assertEqual((1, 1), (metrics.live_connections, metrics.dead_connections))
+
+        pool.resurrect(True)
+        self.assertEqual((2, 0), (metrics.live_connections, metrics.dead_connections))
+        self.assertEqual(1, metrics.marked_dead)
+        self.assertEqual(1, metrics.resurrected)
+
+        metrics.reset()
+        self.assertEqual(0, metrics.export()["marked_dead"])
@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from opensearchpy.retry import RetryBudget
+
+from .test_cases import TestCase
+
+
+class TestRetryBudget(TestCase):
+    def test_budget_starts_full(self):
+        budget = RetryBudget(max_tokens=2)
+
+        self.assertEqual([True, True, False], [budget.acquire() for _ in range(3)])
+        self.assertEqual(2, budget.retries)
+        self.assertEqual(1, budget.suppressed)
+
+    def test_successes_refill_budget(self):
+        budget = RetryBudget(ratio=0.25, max_tokens=1)
+        budget.acquire()
+
+        for _ in range(3):
+            budget.record_success()
+        self.assertFalse(budget.acquire())
+        budget.record_success()
+        self.assertTrue(budget.acquire())
+
+    def test_budget_is_capped(self):
+        budget = RetryBudget(ratio=1, max_tokens=2)
+
+        for _ in range(10):
+            budget.record_success()
+        self.assertEqual(2, budget.tokens)
@@ -37,11 +37,17 @@ try:
 except ImportError:
     np = pd = None
 
+import mock
+
 from opensearchpy.exceptions import ImproperlyConfigured, SerializationError
+from opensearchpy.helpers.utils import AttrList
 from opensearchpy.serializer import (
     DEFAULT_SERIALIZERS,
+    ORJSON_AVAILABLE,
+    AttrOrjsonSerializer,
     Deserializer,
     JSONSerializer,
+    OrjsonSerializer,
     TextSerializer,
 )
 
@@ -203,6 +209,61 @@ class TestJSONSerializer(TestCase):
         self.assertEqual("你好", JSONSerializer().dumps("你好"))
 
 
+class TestOrjsonSerializer(TestCase):
+    def setup_method(self, _):
+        if not ORJSON_AVAILABLE:
+            raise SkipTest("Test requires orjson to be available")
+
+    def test_dumps_returns_bytes(self):
+        self.assertEqual(
+            b'{"d":"2010-10-01T02:30:00","s":"\xe4\xbd\xa0\xe5\xa5\xbd"}',
+            OrjsonSerializer().dumps({"d": datetime(2010, 10, 1, 2, 30), "s": "你好"}),
+        )
+
+    def test_default_is_used_for_unsupported_types(self):
+        self.assertEqual(
+            b'{"d":3.8,"u":"00000000-0000-0000-0000-000000000003"}',
+            OrjsonSerializer().dumps(
+                {
+                    "d": Decimal("3.8"),
+                    "u": uuid.UUID("00000000-0000-0000-0000-000000000003"),
+                }
+            ),
+        )
+
+    def test_serializes_numpy_ndarray(self):
+        requires_numpy_and_pandas()
+
+        self.assertEqual(
+            b'{"d":[0,0,0,0,0]}',
+            OrjsonSerializer().dumps({"d": np.zeros((5,), dtype=np.uint8)}),
+        )
+
+    def test_non_string_keys_are_serialized(self):
+        self.assertEqual(b'{"1":2}', OrjsonSerializer().dumps({1: 2}))
+
+    def test_strings_are_only_encoded(self):
+        self.assertEqual(b'{"a":1}', OrjsonSerializer().dumps('{"a":1}'))
+        self.assertEqual(b'{"a":1}', OrjsonSerializer().dumps(b'{"a":1}'))
+
+    def test_loads_accepts_bytes_and_str(self):
+        self.assertEqual({"some": "data"}, OrjsonSerializer().loads(b'{"some":"data"}'))
+        self.assertEqual({"some": "data"}, OrjsonSerializer().loads('{"some":"data"}'))
+
+    def test_raises_serialization_error_on_dump_error(self):
+        self.assertRaises(SerializationError, OrjsonSerializer().dumps, object())
+
+    def test_raises_serialization_error_on_load_error(self):
+        self.assertRaises(SerializationError, OrjsonSerializer().loads, object())
+        self.assertRaises(SerializationError, OrjsonSerializer().loads, b"")
+        self.assertRaises(SerializationError, OrjsonSerializer().loads, b"{{")
+
+    def test_attr_serializer_handles_dsl_objects(self):
+        self.assertEqual(
+            b'{"l":[1,2]}', AttrOrjsonSerializer().dumps({"l": AttrList([1, 2])})
+        )
+
+
 class TestTextSerializer(TestCase):
     def test_strings_are_left_untouched(self):
         self.assertEqual("你好", TextSerializer().dumps("你好"))
@@ -227,6 +288,23 @@ class TestDeserializer(TestCase):
             self.de.loads('{"some":"data"}', "text/plain; charset=whatever"),
         )
 
+    def test_decodes_bytes_for_serializers_not_accepting_them(self):
+        self.assertEqual({"some": "data"}, self.de.loads(b'{"some":"data"}'))
+        self.assertEqual(
+            '{"some":"你好"}',
+            self.de.loads('{"some":"你好"}'.encode("utf-8"), "text/plain"),
+        )
+
+    def test_passes_bytes_to_serializers_accepting_them(self):
+        if not ORJSON_AVAILABLE:
+            raise SkipTest("Test requires orjson to be available")
+
+        serializer = OrjsonSerializer()
+        de = Deserializer({serializer.mimetype: serializer})
+        with mock.patch.object(serializer, "loads", return_value={}) as loads:
+            de.loads(b'{"some":"data"}')
+        loads.assert_called_once_with(b'{"some":"data"}')
+
     def test_raises_serialization_error_on_unknown_mimetype(self):
         self.assertRaises(SerializationError, self.de.loads, "{}", "text/html")
 
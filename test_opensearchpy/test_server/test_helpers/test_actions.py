@@ -177,6 +177,32 @@ class TestStreamingBulk(OpenSearchTestCase):
         self.assertEqual({"value": 3, "relation": "eq"}, res["hits"]["total"])
         self.assertEqual(4, failing_client._called)
 
+    def test_adaptive_chunking_shrinks_rejected_chunks(self):
+        failing_client = FailingBulkClient(
+            self.client, fail_at=(1,), fail_with=TransportError(429, "Rejected!", {})
+        )
+        sizer = helpers.AdaptiveChunkSize(
+            chunk_size=2, min_chunk_size=1, increase_step=1
+        )
+        docs = [
+            {"_index": "i", "_id": 47, "f": "v"},
+            {"_index": "i", "_id": 45, "f": "v"},
+            {"_index": "i", "_id": 42, "f": "v"},
+        ]
+        results = list(
+            helpers.streaming_bulk(
+                failing_client,
+                docs,
+                max_retries=1,
+                initial_backoff=0,
+                adaptive_chunking=sizer,
+            )
+        )
+        self.assertEqual([True, True, True], [r[0] for r in results])
+        # halved by the rejection, then grown by each successful request
+        self.assertEqual(3, sizer.chunk_size)
+        self.assertEqual(3, failing_client._called)
+
     def test_rejected_documents_are_retried_at_most_max_retries_times(self):
         failing_client = FailingBulkClient(
             self.client, fail_at=(1, 2), fail_with=TransportError(429, "Rejected!", {})
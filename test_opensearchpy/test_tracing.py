@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from opensearchpy import OpenSearch
+from opensearchpy.client.indices import IndicesClient
+from opensearchpy.exceptions import ConnectionError
+from opensearchpy.tracing import Tracing, _api_name
+
+from .test_cases import SkipTest, TestCase
+from .test_transport import DummyConnection
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:
+    TracerProvider = None
+
+
+class TestTracing(TestCase):
+    def setUp(self):
+        if TracerProvider is None:
+            raise SkipTest("Test requires opentelemetry-sdk to be available")
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracing = Tracing(tracer=provider.get_tracer("test"))
+
+    def get_spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def test_api_names(self):
+        self.assertEqual("search", _api_name(OpenSearch.search))
+        self.assertEqual("indices.create", _api_name(IndicesClient.create))
+
+    def test_api_call_is_split_into_spans(self):
+        client = OpenSearch(connection_class=DummyConnection, tracing=self.tracing)
+
+        client.search(index=["movies", "books"], body={"query": {}})
+        spans = self.get_spans()
+        self.assertEqual(
+            {"search", "serialize", "POST", "deserialize"}, set(spans.keys())
+        )
+        api = spans["search"]
+        self.assertEqual("movies,books", api.attributes["db.opensearch.index"])
+        for name in ("serialize", "POST", "deserialize"):
+            self.assertEqual(api.context.span_id, spans[name].parent.span_id)
+        attempt = spans["POST"]
+        self.assertEqual("/movies,books/_search", attempt.attributes["url.path"])
+        self.assertEqual(200, attempt.attributes["http.response.status_code"])
+
+    def test_index_passed_as_positional_argument(self):
+        client = OpenSearch(connection_class=DummyConnection, tracing=self.tracing)
+
+        client.get("movies", "1")
+        self.assertEqual(
+            "movies", self.get_spans()["get"].attributes["db.opensearch.index"]
+        )
+
+    def test_trace_context_is_sent_with_request(self):
+        client = OpenSearch(connection_class=DummyConnection, tracing=self.tracing)
+
+        client.info()
+        attempt = self.get_spans()["GET"]
+        ((_, kwargs),) = client.transport.get_connection().calls
+        self.assertIn(
+            "%032x" % attempt.context.trace_id, kwargs["headers"]["traceparent"]
+        )
+
+    def test_retries_get_a_span_each(self):
+        client = OpenSearch(
+            connection_class=DummyConnection,
+            exception=ConnectionError("N/A", "abandon ship", Exception()),
+            max_retries=1,
+            tracing=self.tracing,
+        )
+
+        self.assertRaises(ConnectionError, client.info)
+        attempts = [
+            span for span in self.exporter.get_finished_spans() if span.name == "GET"
+        ]
+        self.assertEqual(2, len(attempts))
+        self.assertNotIn("http.request.resend_count", attempts[0].attributes)
+        self.assertEqual(1, attempts[1].attributes["http.request.resend_count"])
+        self.assertFalse(self.get_spans()["info"].status.is_ok)
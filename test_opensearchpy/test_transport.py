@@ -28,14 +28,27 @@
 
 from __future__ import unicode_literals
 
+import io
 import json
+import threading
 import time
 
 from mock import patch
 
+from opensearchpy.cache import ResponseCache
+from opensearchpy.circuit_breaker import CircuitBreaker
+from opensearchpy.concurrency import ConcurrencyLimiter
 from opensearchpy.connection import Connection
-from opensearchpy.connection_pool import DummyConnectionPool
-from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.connection_pool import DummyConnectionPool, LatencySelector
+from opensearchpy.exceptions import (
+    ConnectionError,
+    ConnectionTimeout,
+    NotFoundError,
+    TransportError,
+)
+from opensearchpy.hedging import RequestHedging
+from opensearchpy.metrics import HistogramCollector
+from opensearchpy.retry import RetryBudget
 from opensearchpy.transport import Transport, get_host_info
 
 from .test_cases import TestCase
@@ -55,6 +68,48 @@ class DummyConnection(Connection):
             raise self.exception
         return self.status, self.headers, self.data
 
+    def perform_stream_request(self, *args, **kwargs):
+        status, headers, data = self.perform_request(*args, **kwargs)
+        return status, headers, io.BytesIO(data.encode("utf-8"))
+
+
+class BlockingConnection(DummyConnection):
+    def __init__(self, **kwargs):
+        self.block = kwargs.pop("block", None)
+        super(BlockingConnection, self).__init__(**kwargs)
+
+    def perform_request(self, *args, **kwargs):
+        if self.block is not None and args[1] == "/_nodes/_all/http":
+            self.block.wait()
+        return super(BlockingConnection, self).perform_request(*args, **kwargs)
+
+
+class SlowConnection(DummyConnection):
+    def __init__(self, **kwargs):
+        self.delay = kwargs.pop("delay", 0)
+        super(SlowConnection, self).__init__(**kwargs)
+
+    def perform_request(self, *args, **kwargs):
+        time.sleep(self.delay)
+        return super(SlowConnection, self).perform_request(*args, **kwargs)
+
+
+class CountingConnection(SlowConnection):
+    def __init__(self, **kwargs):
+        self.active = self.max_active = 0
+        self.lock = threading.Lock()
+        super(CountingConnection, self).__init__(**kwargs)
+
+    def perform_request(self, *args, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.active, self.max_active)
+        try:
+            return super(CountingConnection, self).perform_request(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.active -= 1
+
 
 CLUSTER_NODES = """{
   "_nodes" : {
@@ -231,6 +286,14 @@ class TestTransport(TestCase):
             t.get_connection().calls[0][0],
         )
 
+    def test_raw_bytes_response_gets_deserialized(self):
+        t = Transport(
+            [{"data": '{"answer":"你好"}'.encode("utf-8")}],
+            connection_class=DummyConnection,
+        )
+
+        self.assertEqual({"answer": "你好"}, t.perform_request("GET", "/"))
+
     def test_kwargs_passed_on_to_connections(self):
         t = Transport([{"host": "google.com"}], port=123)
         self.assertEqual(1, len(t.connection_pool.connections))
@@ -268,6 +331,318 @@ class TestTransport(TestCase):
         self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
         self.assertEqual(4, len(t.get_connection().calls))
 
+    @patch("opensearchpy.transport.time.sleep")
+    def test_retries_back_off_with_jitter(self, sleep):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+            retry_backoff=1,
+            retry_backoff_max=3,
+        )
+
+        with patch("opensearchpy.transport.random.uniform") as uniform:
+            uniform.side_effect = lambda a, b: b / 2.0
+            self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual(
+            [((0, 1),), ((0, 2),), ((0, 3),)],
+            [call[0:1] for call in uniform.call_args_list],
+        )
+        self.assertEqual(
+            [((0.5,),), ((1.0,),), ((1.5,),)],
+            [call[0:1] for call in sleep.call_args_list],
+        )
+
+    @patch("opensearchpy.transport.time.sleep")
+    def test_no_back_off_by_default(self, sleep):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        sleep.assert_not_called()
+
+    def test_retries_are_limited_by_budget(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+            retry_budget=budget,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual(3, len(t.get_connection().calls))
+        self.assertEqual(2, budget.retries)
+        self.assertEqual(1, budget.suppressed)
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual(4, len(t.get_connection().calls))
+        self.assertEqual(2, budget.suppressed)
+        self.assertEqual((2, 2), (t.retries, t.suppressed_retries))
+
+        t.get_connection().exception = None
+        t.perform_request("GET", "/")
+        t.perform_request("GET", "/")
+        self.assertEqual(1, budget.tokens)
+
+    def test_retries_are_counted_without_budget(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual((3, 0), (t.retries, t.suppressed_retries))
+
+    def test_streamed_body_is_passed_through_and_not_retried(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+        body = iter([b"{}\n"])
+
+        self.assertRaises(
+            ConnectionError, t.perform_request, "POST", "/_bulk", body=body
+        )
+        calls = t.get_connection().calls
+        self.assertEqual(1, len(calls))
+        self.assertIs(body, calls[0][0][3])
+
+    def test_stream_request_returns_body_stream(self):
+        t = Transport([{"data": '{"answer": 42}'}], connection_class=DummyConnection)
+
+        stream = t.perform_stream_request(
+            "GET", "/", params={"request_timeout": 5}, body={}
+        )
+        self.assertEqual(b'{"answer": 42}', stream.read())
+        self.assertEqual(
+            [(("GET", "/", {}, b"{}"), {"headers": None, "ignore": (), "timeout": 5})],
+            t.get_connection().calls,
+        )
+
+    def test_stream_request_will_fail_after_X_retries(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}],
+            connection_class=DummyConnection,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_stream_request, "GET", "/")
+        self.assertEqual(4, len(t.get_connection().calls))
+
+    def test_stream_requests_are_reported_to_pool_and_metrics(self):
+        breaker = CircuitBreaker(window=1, min_requests=1)
+        metrics = HistogramCollector()
+        t = Transport(
+            [{"exception": TransportError(503, "Service Unavailable")}] * 2,
+            connection_class=DummyConnection,
+            circuit_breaker=breaker,
+            metrics=metrics,
+            max_retries=0,
+        )
+
+        self.assertRaises(TransportError, t.perform_stream_request, "GET", "/")
+        (con,) = [c for c in t.connection_pool.orig_connections if c.calls]
+        self.assertEqual("open", breaker.get_state(con))
+        exported = metrics.export()
+        self.assertEqual((1, 1), (exported["requests"], exported["errors"]))
+        self.assertEqual(0, exported["in_flight"])
+
+    def test_requests_are_reported_to_metrics(self):
+        metrics = HistogramCollector()
+        t = Transport(
+            [{"data": '{"answer": 42}'}],
+            connection_class=DummyConnection,
+            metrics=metrics,
+        )
+
+        self.assertIs(metrics, t.get_connection().metrics)
+        self.assertEqual({"answer": 42}, t.perform_request("GET", "/i/_doc/1", body={}))
+        exported = metrics.export()
+        self.assertEqual(1, exported["requests"])
+        self.assertEqual(0, exported["in_flight"])
+        self.assertEqual(["GET /{index}/_doc/{id}"], list(exported["endpoints"]))
+        self.assertEqual(1, exported["serialization"]["count"])
+        self.assertEqual(1, exported["deserialization"]["count"])
+
+    def test_read_responses_are_cached(self):
+        metrics = HistogramCollector()
+        t = Transport(
+            [{"data": '{"hits": {"hits": []}}'}],
+            connection_class=DummyConnection,
+            response_cache=True,
+            metrics=metrics,
+        )
+        connection = t.get_connection()
+
+        first = t.perform_request("POST", "/i/_search", body={"size": 0})
+        first["hits"]["hits"].append("mutated")
+        self.assertEqual(
+            {"hits": {"hits": []}},
+            t.perform_request("POST", "/i/_search", body={"size": 0}),
+        )
+        self.assertTrue(t.perform_request("HEAD", "/i"))
+        self.assertTrue(t.perform_request("HEAD", "/i"))
+        self.assertEqual(2, len(connection.calls))
+
+        # other bodies, writes and bypassed requests are sent
+        t.perform_request("POST", "/i/_search", body={"size": 1})
+        t.perform_request("POST", "/i/_doc", body={})
+        t.perform_request("POST", "/i/_search", params={"ignore_cache": True})
+        self.assertEqual(5, len(connection.calls))
+        self.assertEqual({}, connection.calls[-1][0][2])
+
+        exported = metrics.export()
+        self.assertEqual((2, 3), (exported["cache_hits"], exported["cache_misses"]))
+
+    def test_error_responses_are_not_cached(self):
+        t = Transport(
+            [{"status": 404, "data": '{"found": false}'}],
+            connection_class=DummyConnection,
+            response_cache=ResponseCache(),
+        )
+        connection = t.get_connection()
+
+        for _ in range(2):
+            self.assertEqual(
+                {"found": False},
+                t.perform_request("GET", "/i/_doc/1", params={"ignore": 404}),
+            )
+        self.assertEqual(2, len(connection.calls))
+
+    def test_identical_requests_share_one_request(self):
+        block = threading.Event()
+        t = Transport(
+            [{"block": block}],
+            connection_class=BlockingConnection,
+            response_cache=True,
+        )
+        connection = t.get_connection()
+        results = []
+
+        def search():
+            results.append(t.perform_request("GET", "/_nodes/_all/http"))
+
+        threads = [threading.Thread(target=search) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        block.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([{}] * 3, results)
+        self.assertEqual(1, len(connection.calls))
+
+    def test_identical_requests_share_a_response_not_cached(self):
+        t = Transport(
+            [{"status": 404, "data": '{"found": false}', "delay": 0.2}],
+            connection_class=SlowConnection,
+            response_cache=True,
+        )
+        connection = t.get_connection()
+        results = []
+
+        def get():
+            results.append(
+                t.perform_request("GET", "/i/_doc/1", params={"ignore": 404})
+            )
+
+        threads = [threading.Thread(target=get) for _ in range(3)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # the waiting requests aren't sent one after the other
+        self.assertLess(time.time() - start, 0.4)
+        self.assertEqual([{"found": False}] * 3, results)
+        self.assertEqual(1, len(connection.calls))
+
+    def test_identical_requests_share_an_error(self):
+        t = Transport(
+            [{"exception": NotFoundError(404, "not_found"), "delay": 0.1}],
+            connection_class=SlowConnection,
+            response_cache=True,
+        )
+        connection = t.get_connection()
+        errors = []
+
+        def get():
+            try:
+                t.perform_request("GET", "/i/_doc/1")
+            except NotFoundError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=get) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(3, len(errors))
+        self.assertEqual(1, len(connection.calls))
+
+    def test_requests_ignoring_other_statuses_are_not_shared(self):
+        class NotFoundConnection(SlowConnection):
+            def perform_request(self, *args, **kwargs):
+                super(NotFoundConnection, self).perform_request(*args, **kwargs)
+                if 404 not in kwargs["ignore"]:
+                    raise NotFoundError(404, "not_found")
+                return 404, {}, '{"found": false}'
+
+        t = Transport(
+            [{"delay": 0.1}],
+            connection_class=NotFoundConnection,
+            response_cache=True,
+        )
+        connection = t.get_connection()
+        results = []
+
+        def get(params):
+            try:
+                results.append(t.perform_request("GET", "/i/_doc/1", params=params))
+            except NotFoundError as e:
+                results.append(e.status_code)
+
+        threads = [
+            threading.Thread(target=get, args=(params,))
+            for params in ({"ignore": 404}, {})
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([404, {"found": False}], sorted(results, key=str))
+        self.assertEqual(2, len(connection.calls))
+
+    def test_stream_requests_do_not_send_ignore_cache(self):
+        t = Transport([{}], connection_class=DummyConnection, response_cache=True)
+        connection = t.get_connection()
+
+        t.perform_stream_request(
+            "POST", "/i/_search", params={"ignore_cache": True}
+        ).close()
+        self.assertEqual({}, connection.calls[-1][0][2])
+
+    def test_retries_and_dead_connections_are_reported_to_metrics(self):
+        metrics = HistogramCollector()
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}] * 2,
+            connection_class=DummyConnection,
+            metrics=metrics,
+            max_retries=1,
+        )
+        self.assertEqual(2, metrics.live_connections)
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        exported = metrics.export()
+        self.assertEqual(1, exported["errors"])
+        self.assertEqual(1, exported["retries"])
+        self.assertEqual(2, exported["marked_dead"])
+        self.assertEqual((0, 2), (metrics.live_connections, metrics.dead_connections))
+
     def test_failed_connection_will_be_marked_as_dead(self):
         t = Transport(
             [{"exception": ConnectionError("abandon ship")}] * 2,
@@ -277,6 +652,145 @@ class TestTransport(TestCase):
         self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
         self.assertEqual(0, len(t.connection_pool.connections))
 
+    def test_request_latency_is_reported_to_selector(self):
+        t = Transport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            selector_class=LatencySelector,
+        )
+        selector = t.connection_pool.selector
+
+        t.perform_request("GET", "/")
+        (con,) = [c for c in t.connection_pool.connections if c.calls]
+        self.assertEqual(0, selector.stats[con][1])
+        self.assertGreaterEqual(selector.stats[con][0], 0)
+
+    def test_failed_request_is_penalized_in_selector(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}] * 2,
+            connection_class=DummyConnection,
+            selector_class=LatencySelector,
+            max_retries=0,
+        )
+        selector = t.connection_pool.selector
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        (con,) = [c for c in t.connection_pool.orig_connections if c.calls]
+        self.assertEqual([selector.failure_penalty, 0], selector.stats[con][:2])
+
+    def test_requests_wait_for_concurrency_limiter(self):
+        limiter = ConcurrencyLimiter(initial_limit=2, max_limit=2)
+        t = Transport(
+            [{"delay": 0.02}],
+            connection_class=CountingConnection,
+            concurrency_limiter=limiter,
+        )
+
+        threads = [
+            threading.Thread(target=t.perform_request, args=("GET", "/"))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        con = t.get_connection()
+        self.assertEqual(6, len(con.calls))
+        self.assertEqual(2, con.max_active)
+        self.assertEqual(0, limiter.in_flight)
+
+    def test_waiting_for_concurrency_limiter_times_out(self):
+        limiter = ConcurrencyLimiter(initial_limit=1, max_limit=1)
+        t = Transport(
+            [{}], connection_class=DummyConnection, concurrency_limiter=limiter
+        )
+        limiter.acquire()
+
+        self.assertRaises(
+            ConnectionTimeout,
+            t.perform_request,
+            "GET",
+            "/",
+            params={"request_timeout": 0.01},
+        )
+        self.assertEqual([], t.get_connection().calls)
+        self.assertEqual(1, limiter.in_flight)
+
+    def test_error_status_is_reported_to_circuit_breaker(self):
+        breaker = CircuitBreaker(window=1, min_requests=1)
+        t = Transport(
+            [{"exception": TransportError(503, "Service Unavailable")}] * 2,
+            connection_class=DummyConnection,
+            circuit_breaker=breaker,
+            max_retries=0,
+        )
+
+        self.assertRaises(TransportError, t.perform_request, "GET", "/")
+        (con,) = [c for c in t.connection_pool.orig_connections if c.calls]
+        self.assertEqual("open", breaker.get_state(con))
+        self.assertNotIn(con, t.connection_pool.connections)
+
+    def test_resurrected_connection_is_not_starved_of_trials(self):
+        breaker = CircuitBreaker(window=1, min_requests=1, half_open_requests=1)
+        t = Transport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            circuit_breaker=breaker,
+            randomize_hosts=False,
+        )
+        con = t.connection_pool.connections[0]
+        t.connection_pool.request_finished(con, 0.1, status=503)
+        t.connection_pool.resurrect(True)
+
+        for _ in range(4):
+            t.perform_stream_request("GET", "/").close()
+        for _ in range(2):
+            t.perform_request("GET", "/")
+
+        self.assertEqual("closed", breaker.get_state(con))
+        self.assertIn(con, t.connection_pool.connections)
+
+    def test_dead_connection_is_resurrected_after_health_check(self):
+        t = Transport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            health_check_interval=3600,
+            dead_timeout=0,
+        )
+        self.assertTrue(t.connection_pool.health_check)
+        con1, con2 = t.connection_pool.connections
+        t.connection_pool.mark_dead(con1)
+        con1.exception = ConnectionError("abandon ship")
+
+        t.check_dead_connections()
+        self.assertEqual([con2], t.connection_pool.connections)
+        self.assertEqual([(("HEAD", "/"), {"timeout": 1})], con1.calls)
+
+        con1.exception = None
+        t.connection_pool.dead.queue[0] = (0, con1)
+        t.check_dead_connections()
+        self.assertEqual([con2, con1], t.connection_pool.connections)
+        self.assertEqual({}, t.connection_pool.dead_count)
+        t._health_check_stop.set()
+
+    def test_health_checks_run_in_background(self):
+        t = Transport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            health_check_interval=0.01,
+            dead_timeout=0,
+        )
+        con1, con2 = t.connection_pool.connections
+        t.connection_pool.mark_dead(con1)
+
+        for _ in range(100):
+            if len(t.connection_pool.connections) == 2:
+                break
+            time.sleep(0.01)
+        t._health_check_stop.set()
+        self.assertEqual([con2, con1], t.connection_pool.connections)
+
     def test_resurrected_connection_will_be_marked_as_live_on_success(self):
         for method in ("GET", "HEAD"):
             t = Transport([{}, {}], connection_class=DummyConnection)
@@ -391,6 +905,157 @@ class TestTransport(TestCase):
         self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
         self.assertTrue(time.time() - 1 < t.last_sniff < time.time() + 0.01)
 
+    def test_sniff_after_n_seconds_in_background(self):
+        sniffing = threading.Event()
+        t = Transport(
+            [{"data": CLUSTER_NODES, "block": sniffing}],
+            connection_class=BlockingConnection,
+            sniffer_timeout=5,
+            sniff_in_background=True,
+        )
+        seed = t.get_connection()
+        t.last_sniff = time.time() - 5.1
+
+        # the request is served by the current pool while sniffing is blocked
+        t.perform_request("GET", "/")
+        self.assertIs(seed, t.get_connection())
+        self.assertTrue(t.sniffing_thread.is_alive())
+
+        sniffing.set()
+        t.sniffing_thread.join(1)
+        self.assertEqual(1, len(t.connection_pool.connections))
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+        self.assertTrue(time.time() - 1 < t.last_sniff < time.time() + 0.01)
+
+    def test_sniff_in_background_queries_nodes_in_parallel(self):
+        blocked = threading.Event()
+        t = Transport(
+            [
+                {"data": CLUSTER_NODES, "block": blocked},
+                {"exception": ConnectionError("abandon ship")},
+                {"data": CLUSTER_NODES_7x_PUBLISH_HOST},
+            ],
+            connection_class=BlockingConnection,
+            sniff_in_background=True,
+            randomize_hosts=False,
+        )
+
+        t.sniff_hosts()
+        self.assertEqual(1, len(t.connection_pool.connections))
+        self.assertEqual("http://somehost.tld:123", t.get_connection().host)
+        blocked.set()
+
+    def test_sniff_in_background_reuses_threads(self):
+        t = Transport(
+            [{"data": CLUSTER_NODES}] * 20,
+            connection_class=BlockingConnection,
+            sniff_in_background=True,
+        )
+
+        for _ in range(2):
+            self.assertEqual(1, len(t._get_sniff_data()))
+            self.assertLessEqual(t._sniff_workers._threads, 8)
+
+    def test_sniff_in_background_failure_keeps_connections(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}] * 2,
+            connection_class=BlockingConnection,
+            sniffer_timeout=5,
+            sniff_in_background=True,
+        )
+        connections = t.connection_pool.connections
+        last_sniff = t.last_sniff = time.time() - 5.1
+
+        t.create_sniff_thread()
+        t.sniffing_thread.join(1)
+        self.assertEqual(connections, t.connection_pool.connections)
+        self.assertEqual(last_sniff, t.last_sniff)
+
+    def test_sniff_on_fail_in_background(self):
+        t = Transport(
+            [{"exception": ConnectionError("abandon ship")}, {"data": CLUSTER_NODES}],
+            connection_class=BlockingConnection,
+            sniff_on_connection_fail=True,
+            sniff_in_background=True,
+            max_retries=0,
+            randomize_hosts=False,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        t.sniffing_thread.join(1)
+        self.assertEqual(1, len(t.connection_pool.connections))
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+
+    def _hedged_transport(self, hosts, budget=1.0):
+        hedging = RequestHedging(budget=budget, min_samples=1)
+        hedging.record(0.01)
+        return Transport(
+            hosts,
+            connection_class=SlowConnection,
+            hedging=hedging,
+            randomize_hosts=False,
+        )
+
+    def test_slow_read_is_hedged_to_another_connection(self):
+        t = self._hedged_transport(
+            [{"delay": 0.5, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}]
+        )
+        slow, fast = t.connection_pool.connections
+
+        self.assertEqual({"fast": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual(1, len(fast.calls))
+        self.assertEqual(0, t.hedging.tokens)
+
+    def test_hedging_is_limited_by_budget(self):
+        t = self._hedged_transport(
+            [{"delay": 0.1, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}],
+            budget=0.5,
+        )
+
+        self.assertEqual({"slow": 1}, t.perform_request("GET", "/_search"))
+
+    def test_hedges_do_not_wait_for_concurrency_limiter(self):
+        t = self._hedged_transport(
+            [{"delay": 0.1, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}]
+        )
+        t.concurrency_limiter = ConcurrencyLimiter(initial_limit=1, max_limit=1)
+        slow, fast = t.connection_pool.connections
+
+        self.assertEqual({"slow": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual([], fast.calls)
+        self.assertEqual(1, t.hedging.tokens)
+        self.assertEqual(0, t.concurrency_limiter.in_flight)
+
+    def test_writes_are_not_hedged(self):
+        t = self._hedged_transport(
+            [{"delay": 0.1, "data": '{"slow": 1}'}, {"data": '{"fast": 1}'}]
+        )
+        slow, fast = t.connection_pool.connections
+
+        self.assertEqual({"slow": 1}, t.perform_request("PUT", "/index/_doc/1"))
+        self.assertEqual([], fast.calls)
+
+    def test_failed_hedge_waits_for_original_request(self):
+        t = self._hedged_transport(
+            [
+                {"delay": 0.1, "data": '{"slow": 1}'},
+                {"exception": ConnectionError("abandon ship")},
+            ]
+        )
+
+        self.assertEqual({"slow": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual(2, len(t.connection_pool.connections))
+
+    def test_error_of_original_request_is_raised_if_all_fail(self):
+        t = self._hedged_transport(
+            [
+                {"delay": 0.1, "status": 404, "exception": NotFoundError(404)},
+                {"exception": ConnectionError("abandon ship")},
+            ]
+        )
+
+        self.assertRaises(NotFoundError, t.perform_request, "GET", "/_search")
+
     def test_sniff_7x_publish_host(self):
         # Test the response shaped when a 7.x node has publish_host set
         # and the returend data is shaped in the fqdn/ip:port format.
@@ -403,5 +1068,28 @@ class TestTransport(TestCase):
         # Ensure we parsed out the fqdn and port from the fqdn/ip:port string.
         self.assertEqual(
             t.connection_pool.connection_opts[0][1],
-            {"host": "somehost.tld", "port": 123},
+            {
+                "host": "somehost.tld",
+                "port": 123,
+                "roles": ["cluster_manager", "data", "ingest"],
+            },
+        )
+
+    def test_sniff_keeps_node_roles_and_attributes(self):
+        nodes = json.loads(CLUSTER_NODES)
+        nodes["nodes"]["SRZpKFZdQguhhvifmN6UVA"]["attributes"] = {"zone": "us-east-1a"}
+        t = Transport(
+            [{"data": json.dumps(nodes)}],
+            connection_class=DummyConnection,
+        )
+        t.sniff_hosts()
+
+        self.assertEqual(
+            {
+                "host": "1.1.1.1",
+                "port": 123,
+                "roles": ["cluster_manager", "data", "ingest"],
+                "attributes": {"zone": "us-east-1a"},
+            },
+            t.connection_pool.connection_opts[0][1],
         )
@@ -221,7 +221,6 @@ class Module:
                 "_escape",
                 "_make_path",
                 "query_params",
-                "_bulk_body",
                 "_base64_auth_header",
                 "NamespacedClient",
                 "AddonClient",